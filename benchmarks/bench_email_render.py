@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Sertifika e-postası oluşturma kıyaslaması
+
+Toplu gönderimde e-posta başına harcanan CPU süresini ölçer. Eski yöntem
+her alıcı için HTML f-string'ini ve MIMEMultipart mesajını baştan kurar;
+yeni yöntem önceden derlenmiş şablona yalnızca ad ve linki yerleştirir.
+Gönderim (ağ) dahil değildir.
+
+Kullanım:
+    python benchmarks/bench_email_render.py --messages 10000
+"""
+
+import sys
+import os
+import time
+import json
+import argparse
+from email import message_from_bytes
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.email_template import CertificateEmailTemplate, CERTIFICATE_EMAIL_HTML, CERTIFICATE_EMAIL_SUBJECT
+
+SENDER_NAME = "Sertifika Sistemi"
+SENDER_EMAIL = "sertifika@example.com"
+
+def legacy_render(to, student_name, certificate_link):
+    """Eski yöntem: her alıcı için gövde ve MIME mesajı baştan kurulur"""
+    body = CERTIFICATE_EMAIL_HTML.format(student_name=student_name, certificate_link=certificate_link)
+    message = MIMEMultipart()
+    message["From"] = f"{SENDER_NAME} <{SENDER_EMAIL}>"
+    message["To"] = to
+    message["Subject"] = CERTIFICATE_EMAIL_SUBJECT
+    message.attach(MIMEText(body, "html"))
+    return message.as_bytes()
+
+def make_recipients(count):
+    """Örnek alıcı listesi"""
+    return [
+        (f"ogrenci{i}@example.com", f"Öğrenci Çağlar {i}", f"https://sertifika.example.com/?token=bench-{i}")
+        for i in range(count)
+    ]
+
+def check_template_output(template):
+    """Yeni yöntemin ürettiği mesajın doğru çözüldüğünü kontrol eder"""
+    message = message_from_bytes(template.render("ogrenci@example.com", "Ayşe Öz", "https://example.com/?token=a&b"))
+    parts = {part.get_content_type(): part.get_payload(decode=True).decode("utf-8") for part in message.walk()
+             if not part.is_multipart()}
+    assert "Tebrikler, Ayşe Öz!" in parts["text/plain"]
+    assert 'href="https://example.com/?token=a&amp;b"' in parts["text/html"]
+
+def run(name, render, recipients):
+    """Mesajları üretir ve mesaj başına süreyi ölçer"""
+    start = time.perf_counter()
+    total_bytes = 0
+    for recipient in recipients:
+        total_bytes += len(render(*recipient))
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "name": name,
+        "messages": len(recipients),
+        "total_s": round(elapsed, 4),
+        "per_message_us": round(elapsed / len(recipients) * 1e6, 1),
+        "avg_bytes": total_bytes // len(recipients),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Sertifika e-postası oluşturma kıyaslaması")
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    recipients = make_recipients(args.messages)
+    
+    # Şablon toplu gönderim başına bir kez hazırlanır
+    template = CertificateEmailTemplate(SENDER_NAME, SENDER_EMAIL)
+    check_template_output(template)
+    
+    results = [
+        run("legacy_mime", legacy_render, recipients),
+        run("prepared_template", template.render, recipients),
+    ]
+    speedup = round(results[0]["per_message_us"] / results[1]["per_message_us"], 1)
+    
+    if args.json:
+        print(json.dumps({"results": results, "speedup": speedup}, indent=2))
+    else:
+        for r in results:
+            print(f"{r['name']:<18} {r['messages']:>6} mesaj  {r['total_s']:>8}s  {r['per_message_us']}µs/mesaj  {r['avg_bytes']} bayt")
+        print(f"Hızlanma: {speedup}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Toplu sertifika e-postası gönderim kıyaslaması
+
+Yerel bir asyncio SMTP sunucusu (aiosmtpd) başlatır ve aynı alıcı listesini
+önce eski yöntemle (her e-posta için ayrı bağlantı, sırayla), sonra
+eşzamanlı gönderici ile gönderir. Sunucu, gerçek bir SMTP sunucusunun ağ
+gecikmesini taklit etmek için bağlantı el sıkışmasında ve her e-postada
+bekler.
+
+Sırayla gönderim yavaş olduğundan --serial ile daha az alıcıya yapılır ve
+sonuç alıcı başına süre üzerinden karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_email_send.py --recipients 5000 --serial 200 --concurrency 10
+"""
+
+import sys
+import os
+import io
+import time
+import json
+import asyncio
+import argparse
+import contextlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+import config
+
+class LatencyHandler:
+    """Gelen e-postaları sayar; el sıkışma ve DATA adımlarında gecikme ekler"""
+    
+    def __init__(self, handshake_latency, message_latency):
+        self.handshake_latency = handshake_latency
+        self.message_latency = message_latency
+        self.received = 0
+    
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        await asyncio.sleep(self.handshake_latency)
+        session.host_name = hostname
+        return responses
+    
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.message_latency)
+        self.received += 1
+        return "250 OK"
+
+def start_server(port, handshake_latency, message_latency):
+    """Kimlik doğrulamayı kabul eden yerel SMTP sunucusunu başlatır"""
+    handler = LatencyHandler(handshake_latency, message_latency)
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=lambda server, session, envelope, mechanism, auth_data: AuthResult(success=True),
+        auth_require_tls=False
+    )
+    controller.start()
+    return controller, handler
+
+def make_email_service(port):
+    """Yerel sunucuya bağlanan e-posta servisi"""
+    config.SMTP_SERVER = "127.0.0.1"
+    config.SMTP_PORT = port
+    config.SMTP_USERNAME = "bench"
+    config.SMTP_PASSWORD = "bench"
+    config.SMTP_SENDER_EMAIL = "sertifika@example.com"
+    config.SMTP_USE_TLS = False
+    # Gönderim yönteminin kendisi ölçülür; sağlayıcı sınırları kapatılır
+    config.SMTP_RATE_PER_MINUTE = 0
+    config.SMTP_DAILY_LIMIT = 0
+    
+    from services.email_service import EmailService
+    with contextlib.redirect_stdout(io.StringIO()):
+        return EmailService()
+
+def make_recipients(count):
+    """Örnek alıcı listesi"""
+    return [
+        (f"ogrenci{i}@example.com", f"Öğrenci {i}", f"{config.BASE_URL}/?token=bench-{i}")
+        for i in range(count)
+    ]
+
+def run(name, send, recipients, handler):
+    """Gönderimi çalıştırır ve süreyi ölçer"""
+    received_before = handler.received
+    
+    # Servisin ayrıntılı günlükleri ölçüme dahil edilmez
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        results = send(recipients)
+        elapsed = time.perf_counter() - start
+    
+    assert all(results), f"{name}: {results.count(False)} e-posta gönderilemedi"
+    assert handler.received - received_before == len(recipients)
+    
+    return {
+        "name": name,
+        "recipients": len(recipients),
+        "total_s": round(elapsed, 3),
+        "per_recipient_ms": round(elapsed / len(recipients) * 1000, 2),
+        "throughput_per_s": round(len(recipients) / elapsed, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Toplu sertifika e-postası gönderim kıyaslaması")
+    parser.add_argument("--recipients", type=int, default=5000, help="Eşzamanlı gönderimde alıcı sayısı")
+    parser.add_argument("--serial", type=int, default=200, help="Sırayla gönderimde alıcı sayısı")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--handshake-ms", type=float, default=30, help="Bağlantı el sıkışma gecikmesi")
+    parser.add_argument("--message-ms", type=float, default=10, help="E-posta başına sunucu gecikmesi")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    controller, handler = start_server(args.port, args.handshake_ms / 1000, args.message_ms / 1000)
+    
+    try:
+        email_service = make_email_service(args.port)
+        
+        serial = run(
+            "serial_smtplib",
+            lambda recipients: [email_service.send_certificate_email(*recipient) for recipient in recipients],
+            make_recipients(args.serial),
+            handler
+        )
+        concurrent = run(
+            f"asyncio_x{args.concurrency}",
+            lambda recipients: email_service.send_certificate_emails(recipients, concurrency=args.concurrency),
+            make_recipients(args.recipients),
+            handler
+        )
+    finally:
+        controller.stop()
+    
+    results = [serial, concurrent]
+    speedup = round(serial["per_recipient_ms"] / concurrent["per_recipient_ms"], 1)
+    
+    if args.json:
+        print(json.dumps({"results": results, "speedup": speedup}, indent=2))
+    else:
+        for r in results:
+            print(f"{r['name']:<16} {r['recipients']:>6} alıcı  {r['total_s']:>8}s  {r['per_recipient_ms']}ms/alıcı  {r['throughput_per_s']}/s")
+        print(f"Hızlanma: {speedup}x")
+
+if __name__ == "__main__":
+    main()
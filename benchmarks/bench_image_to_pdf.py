@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Eşzamanlı resim -> PDF dönüştürme kıyaslaması
+
+Aynı anda sertifika görüntüleyen kullanıcıları taklit eder: N thread, toplam
+M dönüştürme yapar. Eski geçici dosya yöntemi, yeni bellek içi yöntem
+(önbelleksiz) ve önbellekli tekrar tıklamalar karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_image_to_pdf.py --threads 8 --conversions 200
+"""
+
+import sys
+import os
+import io
+import time
+import uuid
+import json
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.utils import ImageReader
+from utils.certificate_generator import CertificateGenerator
+
+def make_sample_image(width=1684, height=1190):
+    """Sertifika boyutunda örnek bir PNG üretir"""
+    img = Image.new("RGB", (width, height), color="#f9f9f9")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([(20, 20), (width-20, height-20)], outline="#3498db", width=10)
+    draw.text((width/2, height/2), "SERTİFİKA", fill="#2c3e50")
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def legacy_convert(image_data):
+    """Eski yöntem: çalışma dizinine geçici PDF yazıp geri okur"""
+    output_path = f"temp_certificate_{uuid.uuid4()}.pdf"
+    img = Image.open(io.BytesIO(image_data))
+    c = canvas.Canvas(output_path, pagesize=landscape(A4))
+    width, height = landscape(A4)
+    img_reader = ImageReader(img)
+    img_width, img_height = img_reader.getSize()
+    scale = min(width/img_width, height/img_height) * 0.8
+    c.drawImage(img_reader, (width - img_width*scale) / 2, (height - img_height*scale) / 2,
+                width=img_width*scale, height=img_height*scale)
+    c.save()
+    with open(output_path, "rb") as f:
+        pdf_bytes = f.read()
+    os.remove(output_path)
+    return pdf_bytes
+
+def run(name, func, conversions, threads):
+    """Dönüştürmeleri thread havuzunda çalıştırır ve gecikmeleri ölçer"""
+    latencies = []
+    
+    def task(i):
+        start = time.perf_counter()
+        result = func(i)
+        latencies.append(time.perf_counter() - start)
+        assert result and result.startswith(b"%PDF")
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(task, range(conversions)))
+    elapsed = time.perf_counter() - start
+    
+    latencies.sort()
+    return {
+        "name": name,
+        "threads": threads,
+        "conversions": conversions,
+        "total_s": round(elapsed, 4),
+        "throughput_per_s": round(conversions / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Eşzamanlı resim -> PDF kıyaslaması")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--conversions", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    image_data = make_sample_image()
+    
+    results = [
+        run("legacy_tempfile", lambda i: legacy_convert(image_data), args.conversions, args.threads),
+        # Her çağrıda farklı anahtar: önbellek devre dışı, yalnızca bellek içi yol ölçülür
+        run("bytesio_uncached", lambda i: CertificateGenerator.convert_image_to_pdf(
+            image_data, cache_key=f"bench-{uuid.uuid4()}"), args.conversions, args.threads),
+        # Aynı sertifikaya tekrar tıklamalar
+        run("bytesio_cached", lambda i: CertificateGenerator.convert_image_to_pdf(
+            image_data, cache_key="bench-same-certificate"), args.conversions, args.threads),
+    ]
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"{r['name']:<18} {r['throughput_per_s']:>9}/s  p50={r['p50_ms']}ms  p95={r['p95_ms']}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Soğuk açılış (import süresi ve bellek) kıyaslaması
+
+Her senaryo ayrı bir Python sürecinde `-X importtime` ile çalıştırılır;
+toplam import süresi, süreç belleği (en yüksek RSS) ve en pahalı modüller
+raporlanır. 'all_pages' senaryosu tüm sayfa modüllerini birlikte yükler
+(app.py'nin eskiden her açılışta yaptığı gibi); diğer senaryolar yalnızca
+o sayfanın ihtiyaç duyduklarını yükler.
+
+Kullanım:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --scenario certificate_viewer --top 20
+"""
+
+import sys
+import os
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from utils.router import ROUTES
+
+# Senaryo adı -> içe aktarılacak modüller
+SCENARIOS = {
+    "all_pages": [route["module"] for route in ROUTES.values()],
+    **{page: [route["module"]] for page, route in ROUTES.items()}
+}
+
+# Kıyaslamada öne çıkan ağır kütüphaneler
+HEAVY_PACKAGES = ["pandas", "numpy", "altair", "openpyxl", "PIL", "reportlab", "qrcode", "pypdfium2", "xhtml2pdf"]
+
+def measure(modules):
+    """
+    Modülleri yeni bir süreçte içe aktarır
+    
+    Returns:
+        (toplam süre µs, en yüksek RSS KB, {modül: (kendi süresi µs, toplam süre µs)})
+    """
+    code = (
+        "import resource\n"
+        f"import {', '.join(modules)}\n"
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        # Aynı modül bir kez yüklenir; ilk kayıt esas alınır
+        timings.setdefault(name, (int(self_us), int(cumulative_us)))
+    
+    # En üst seviyedeki modüllerin toplam süreleri toplanır
+    total_us = sum(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "self [us]" not in line and not line.split("|")[2].startswith("  ")
+    )
+    max_rss_kb = int(result.stdout.strip().splitlines()[-1])
+    return total_us, max_rss_kb, timings
+
+def run(name, modules, repeat, top):
+    """Senaryoyu `repeat` kez ölçer; ortanca değerleri döndürür"""
+    runs = [measure(modules) for _ in range(repeat)]
+    total_us = statistics.median(r[0] for r in runs)
+    max_rss_kb = statistics.median(r[1] for r in runs)
+    timings = runs[-1][2]
+    
+    heaviest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    
+    return {
+        "name": name,
+        "modules": modules,
+        "import_ms": round(total_us / 1000, 1),
+        "max_rss_mb": round(max_rss_kb / 1024, 1),
+        "heavy_packages": [package for package in HEAVY_PACKAGES if package in timings],
+        "slowest_modules": [
+            {"module": module, "self_ms": round(self_us / 1000, 1), "cumulative_ms": round(cumulative_us / 1000, 1)}
+            for module, (self_us, cumulative_us) in heaviest
+        ]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Soğuk açılış (import süresi ve bellek) kıyaslaması")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="Ölçülecek senaryo (tekrarlanabilir; varsayılan: all_pages, login, certificate_viewer)")
+    parser.add_argument("--repeat", type=int, default=3, help="Senaryo başına ölçüm sayısı (ortanca alınır)")
+    parser.add_argument("--top", type=int, default=10, help="Listelenecek en yavaş modül sayısı")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    scenarios = args.scenario or ["all_pages", "login", "certificate_viewer"]
+    results = [run(name, SCENARIOS[name], args.repeat, args.top) for name in scenarios]
+    
+    if args.json:
+        print(json.dumps({"results": results}, indent=2))
+        return
+    
+    for r in results:
+        print(f"{r['name']:<20} {r['import_ms']:>8}ms import  {r['max_rss_mb']:>7}MB bellek  ağır paketler: {', '.join(r['heavy_packages']) or '-'}")
+    for r in results:
+        print(f"\n{r['name']} - en yavaş modüller (kendi süresi):")
+        for m in r["slowest_modules"]:
+            print(f"  {m['module']:<50} {m['self_ms']:>7}ms  (toplam {m['cumulative_ms']}ms)")
+
+if __name__ == "__main__":
+    main()
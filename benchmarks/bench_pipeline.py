@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Sertifika süreci kıyaslama paketi
+
+Geçici bir klasörde yapay verili bir SQLite veritabanı (--courses eğitim,
+eğitim başına --students öğrenci) ve yerel depolama hazırlar; ardından
+sürecin temel adımlarını ölçer:
+
+    get_all_courses            Eğitim listesi (öğrenci sayılarıyla)
+    get_students_by_course     Bir eğitimin öğrenci listesi
+    import_students_from_excel --import-rows satırlık Excel içe aktarma
+    export_students_to_excel   Bir eğitimin (--students öğrenci) Excel dışa aktarımı
+    generate_certificate_html  HTML şablondan sertifika
+    generate_certificate_pdf   PDF şablondan sertifika
+    generate_certificate_png   PNG şablondan sertifika
+    bulk_email                 --emails alıcıya yerel SMTP sunucusu üzerinden
+                               toplu gönderim (aiosmtpd gerekir)
+
+Sonuçlar --json ile ya da --output ile dosyaya JSON olarak yazılır; aynı
+parametrelerle farklı sürümlerde alınan sonuçlar karşılaştırılabilir.
+Veritabanı ve dosyalar her çalıştırmada sıfırdan üretilir, sayılar
+yalnızca parametrelere ve makineye bağlıdır.
+
+Kullanım:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --courses 50 --students 200 --repeat 10
+    python benchmarks/bench_pipeline.py --only get_all_courses --only bulk_email --json
+    python benchmarks/bench_pipeline.py --output sonuc.json
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import random
+import argparse
+import platform
+import datetime
+import tempfile
+import statistics
+import subprocess
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+SCENARIOS = [
+    "get_all_courses",
+    "get_students_by_course",
+    "import_students_from_excel",
+    "export_students_to_excel",
+    "generate_certificate_html",
+    "generate_certificate_pdf",
+    "generate_certificate_png",
+    "bulk_email"
+]
+
+def prepare_environment(workdir):
+    """
+    Uygulamayı geçici veritabanı ve depolamaya yönlendirir
+    
+    config içe aktarılmadan önce çağrılmalıdır; ayarlar ortam
+    değişkenlerinden okunur.
+    """
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["STORAGE_TYPE"] = "local"
+    os.environ["STORAGE_PATH"] = os.path.join(workdir, "storage")
+    os.environ["FILE_SERVER_ENABLED"] = "false"
+    os.environ["JOB_RUNNER_ENABLED"] = "false"
+    os.environ["METRICS_EXPORTER_ENABLED"] = "false"
+    os.environ["QUERY_PROFILER_ENABLED"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+def seed_database(courses, students_per_course, seed):
+    """
+    Eğitim ve öğrencileri toplu INSERT ile ekler
+    
+    Returns:
+        Eğitim ID'leri listesi
+    """
+    from sqlalchemy import insert
+    from db.database import get_session
+    from db.models import Course, Student
+    
+    rng = random.Random(seed)
+    start_date = datetime.datetime(2025, 1, 6)
+    
+    session = get_session()
+    try:
+        course_ids = []
+        for c in range(courses):
+            course = Course(
+                name=f"Eğitim {c + 1}",
+                description="Kıyaslama için üretilmiş eğitim",
+                instructor_name=f"Eğitmen {c % 7 + 1}",
+                start_date=start_date + datetime.timedelta(days=7 * c),
+                end_date=start_date + datetime.timedelta(days=7 * c + 5)
+            )
+            session.add(course)
+            session.flush()
+            course_ids.append(course.id)
+            
+            session.execute(insert(Student), [
+                {
+                    "first_name": f"Öğrenci{i + 1}",
+                    "last_name": f"Soyad{c + 1}",
+                    "email": f"ogrenci{c + 1}_{i + 1}@example.com",
+                    # Telefonu olmayan öğrenciler de dışa aktarılır
+                    "phone_number": f"0532{rng.randint(1000000, 9999999)}" if rng.random() < 0.7 else None,
+                    "has_completed_course": rng.random() < 0.5,
+                    "course_id": course.id
+                }
+                for i in range(students_per_course)
+            ])
+        
+        session.commit()
+        return course_ids
+    finally:
+        session.close()
+
+def make_excel(rows, batch):
+    """
+    İçe aktarma için örnek Excel dosyası
+    
+    Aynı eğitimde e-posta tekrar edemez; her ölçüm farklı `batch` ile
+    üretilen bir dosya kullanır.
+    """
+    import pandas as pd
+    
+    df = pd.DataFrame([
+        {
+            "Ad": f"Aday{i + 1}",
+            "Soyad": "İçeAktarım",
+            "E-posta": f"aday{batch}_{i + 1}@example.com",
+            "Telefon": f"0555{i:07d}",
+            "Eğitimi Tamamladı": i % 2 == 0
+        }
+        for i in range(rows)
+    ])
+    output = io.BytesIO()
+    df.to_excel(output, index=False)
+    return output.getvalue()
+
+def make_templates(file_service):
+    """
+    HTML, PDF ve PNG sertifika şablonlarını depoya kaydeder
+    
+    Returns:
+        Şablon türü -> depo yolu sözlüğü
+    """
+    from PIL import Image, ImageDraw
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4, landscape
+    
+    html = (
+        "<html><head><meta charset='utf-8'></head><body style='text-align:center'>"
+        "<h1>SERTİFİKA</h1><h2>{{ogrenci_adi}}</h2><p>{{kurs_adi}} - {{egitmen_adi}}</p>"
+        "<p>{{tarih}} · {{sertifika_no}} · {{dogrulama_kodu}}</p><img src='{{qr_kodu}}' width='120'>"
+        "</body></html>"
+    )
+    
+    pdf = io.BytesIO()
+    c = canvas.Canvas(pdf, pagesize=landscape(A4))
+    c.drawString(100, 100, "Şablon")
+    c.save()
+    pdf.seek(0)
+    pdf.name = "template.pdf"
+    
+    image = Image.new("RGB", (1684, 1190), "white")
+    draw = ImageDraw.Draw(image)
+    for i in range(0, 1684, 40):
+        draw.line([(i, 0), (i, 1190)], fill=(230, 230, 240))
+    png = io.BytesIO()
+    image.save(png, format="PNG")
+    png.seek(0)
+    png.name = "template.png"
+    
+    return {
+        "html": file_service.save_html_template(html, 0),
+        "pdf": file_service.upload_file(pdf, "certificate-templates"),
+        "png": file_service.upload_file(png, "certificate-templates")
+    }
+
+def make_replacements(index):
+    """Sertifika alanları (her çağrıda farklı öğrenci)"""
+    import base64
+    from utils.qr_helper import QRCodeGenerator
+    
+    verification_url = QRCodeGenerator.verification_url(f"bench-{index}")
+    return {
+        "{{ogrenci_adi}}": f"Öğrenci {index}",
+        "{{kurs_adi}}": "Kıyaslama Eğitimi",
+        "{{egitmen_adi}}": "Eğitmen",
+        "{{tarih}}": "06.01.2025",
+        "{{sertifika_no}}": f"BENCH-{index:06d}",
+        "{{dogrulama_kodu}}": f"{index:08X}",
+        "{{dogrulama_linki}}": verification_url,
+        "{{qr_kodu}}": f"data:image/png;base64,{base64.b64encode(QRCodeGenerator.generate_png(verification_url)).decode('ascii')}"
+    }
+
+def measure(name, func, repeat, warmup=1, items=1, **meta):
+    """
+    Fonksiyonu `repeat` kez çalıştırır (önce `warmup` kez ısıtır)
+    
+    Args:
+        items: Bir çağrıda işlenen kayıt sayısı (kayıt/sn hesabı için)
+    
+    Returns:
+        Ölçüm özeti sözlüğü
+    """
+    for i in range(warmup):
+        func(-1 - i)
+    
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    
+    ordered = sorted(samples)
+    mean_ms = statistics.fmean(samples)
+    return {
+        "name": name,
+        "repeat": repeat,
+        "items_per_call": items,
+        "mean_ms": round(mean_ms, 3),
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+        "items_per_s": round(items / (mean_ms / 1000), 1) if mean_ms else None,
+        **meta
+    }
+
+def bench_bulk_email(emails, concurrency, port, repeat):
+    """Yerel SMTP sunucusuna toplu gönderimi ölçer; aiosmtpd yoksa None"""
+    try:
+        from aiosmtpd.controller import Controller
+        from aiosmtpd.smtp import AuthResult
+    except ImportError:
+        print("⚠️  'aiosmtpd' paketi yok, bulk_email atlandı", file=sys.stderr)
+        return None
+    
+    import config
+    
+    class SinkHandler:
+        """Gelen e-postaları sayar"""
+        
+        def __init__(self):
+            self.received = 0
+        
+        async def handle_DATA(self, server, session, envelope):
+            self.received += 1
+            return "250 OK"
+    
+    handler = SinkHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=lambda server, session, envelope, mechanism, auth_data: AuthResult(success=True),
+        auth_require_tls=False
+    )
+    controller.start()
+    
+    try:
+        config.SMTP_SERVER = "127.0.0.1"
+        config.SMTP_PORT = port
+        config.SMTP_USERNAME = "bench"
+        config.SMTP_PASSWORD = "bench"
+        config.SMTP_SENDER_EMAIL = "sertifika@example.com"
+        config.SMTP_USE_TLS = False
+        # Gönderim yolunun kendisi ölçülür; sağlayıcı sınırları kapatılır
+        config.SMTP_RATE_PER_MINUTE = 0
+        config.SMTP_DAILY_LIMIT = 0
+        
+        from services.email_service import EmailService
+        email_service = EmailService()
+        
+        recipients = [
+            (f"ogrenci{i}@example.com", f"Öğrenci {i}", f"{config.BASE_URL}/?token=bench-{i}")
+            for i in range(emails)
+        ]
+        
+        def send(_):
+            results = email_service.send_certificate_emails(recipients, concurrency=concurrency)
+            assert all(results), f"{results.count(False)} e-posta gönderilemedi"
+        
+        return measure("bulk_email", send, repeat, warmup=0, items=emails, concurrency=concurrency)
+    finally:
+        controller.stop()
+
+def run(args):
+    """Seçilen senaryoları çalıştırır"""
+    from services.course_service import CourseService
+    from services.student_service import StudentService
+    from services.file_service import FileService
+    from utils.excel_helper import ExcelHelper
+    from utils.bootstrap import init_app
+    
+    selected = args.only or SCENARIOS
+    results = []
+    
+    init_app(create_admin=False)
+    
+    seed_start = time.perf_counter()
+    course_ids = seed_database(args.courses, args.students, args.seed)
+    seed_s = time.perf_counter() - seed_start
+    
+    if "get_all_courses" in selected:
+        results.append(measure(
+            "get_all_courses", lambda i: CourseService.get_all_courses(), args.repeat, items=args.courses
+        ))
+    
+    if "get_students_by_course" in selected:
+        rng = random.Random(args.seed)
+        results.append(measure(
+            "get_students_by_course",
+            lambda i: StudentService.get_students_by_course(rng.choice(course_ids)),
+            args.repeat,
+            items=args.students
+        ))
+    
+    if "export_students_to_excel" in selected:
+        students = StudentService.get_students_by_course(course_ids[0])
+        results.append(measure(
+            "export_students_to_excel", lambda i: ExcelHelper.export_students_to_excel(students), args.repeat, items=len(students)
+        ))
+    
+    if "import_students_from_excel" in selected:
+        # Dosyalar ölçümden önce hazırlanır (ısıtma çağrısı -1 ile gelir)
+        excel_files = {i: make_excel(args.import_rows, i + 1) for i in range(-1, args.repeat)}
+        
+        def import_excel(i):
+            assert StudentService.import_students_from_excel(course_ids[-1], io.BytesIO(excel_files[i]))
+        
+        results.append(measure("import_students_from_excel", import_excel, args.repeat, items=args.import_rows))
+    
+    template_kinds = [kind for kind in ["html", "pdf", "png"] if f"generate_certificate_{kind}" in selected]
+    if template_kinds:
+        file_service = FileService()
+        templates = make_templates(file_service)
+        for kind in template_kinds:
+            results.append(measure(
+                f"generate_certificate_{kind}",
+                lambda i, path=templates[kind]: file_service.generate_certificate(path, make_replacements(i)),
+                args.renders
+            ))
+    
+    if "bulk_email" in selected:
+        result = bench_bulk_email(args.emails, args.concurrency, args.port, max(1, args.repeat // 5))
+        if result:
+            results.append(result)
+    
+    return results, seed_s
+
+def git_revision():
+    """Çalışılan git sürümü (varsa)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Sertifika süreci kıyaslama paketi")
+    parser.add_argument("--courses", type=int, default=20, help="Yapay eğitim sayısı")
+    parser.add_argument("--students", type=int, default=100, help="Eğitim başına öğrenci sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Senaryo başına ölçüm sayısı")
+    parser.add_argument("--import-rows", type=int, default=500, help="İçe aktarılan Excel satır sayısı")
+    parser.add_argument("--renders", type=int, default=20, help="Şablon türü başına sertifika sayısı")
+    parser.add_argument("--emails", type=int, default=500, help="Toplu gönderimde alıcı sayısı")
+    parser.add_argument("--concurrency", type=int, default=10, help="Toplu gönderimde SMTP bağlantı sayısı")
+    parser.add_argument("--port", type=int, default=8026, help="Yerel SMTP sunucusu portu")
+    parser.add_argument("--seed", type=int, default=42, help="Yapay veri için rastgelelik tohumu")
+    parser.add_argument("--only", choices=SCENARIOS, action="append", help="Yalnızca bu senaryoyu çalıştır (tekrarlanabilir)")
+    parser.add_argument("--workdir", help="Veritabanı ve dosyalar için klasör (varsayılan: geçici klasör, sonra silinir)")
+    parser.add_argument("--output", help="Sonuçları bu JSON dosyasına da yaz")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    with contextlib.ExitStack() as stack:
+        workdir = args.workdir or stack.enter_context(tempfile.TemporaryDirectory(prefix="sertifika-bench-"))
+        os.makedirs(workdir, exist_ok=True)
+        prepare_environment(workdir)
+        
+        # Servislerin ayrıntılı günlükleri ölçüm çıktısına karışmaz
+        with contextlib.redirect_stdout(io.StringIO()):
+            results, seed_s = run(args)
+    
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {
+                "courses": args.courses,
+                "students_per_course": args.students,
+                "repeat": args.repeat,
+                "import_rows": args.import_rows,
+                "renders": args.renders,
+                "emails": args.emails,
+                "concurrency": args.concurrency,
+                "seed": args.seed
+            },
+            "seed_s": round(seed_s, 3)
+        },
+        "results": results
+    }
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    
+    print(f"Veri: {args.courses} eğitim x {args.students} öğrenci ({report['meta']['seed_s']}s'de eklendi)")
+    for r in results:
+        print(f"{r['name']:<28} ort. {r['mean_ms']:>9}ms  p50 {r['p50_ms']:>9}ms  p95 {r['p95_ms']:>9}ms  {r['items_per_s']}/s kayıt")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,9 @@
 import streamlit as st
-import base64
 from services.student_service import StudentService
 from services.file_service import FileService
 from utils.certificate_generator import CertificateGenerator
-import config
+from utils.qr_helper import QRCodeGenerator
+import base64
 
 def show():
     """Sertifika görüntüleme sayfası"""
@@ -57,7 +57,9 @@ def show():
     
     with col2:
         st.write(f"**Eğitim:** {student['course_name']}")
-        st.write(f"**Sertifika No:** {student['certificate_access_token']}")
+        st.write(f"**Sertifika No:** {student['certificate_number'] or student['certificate_access_token']}")
+        if student['verification_code']:
+            st.write(f"**Doğrulama Kodu:** {student['verification_code']}")
     
     st.divider()
     
@@ -66,22 +68,39 @@ def show():
     
     try:
         file_service = FileService()
-        certificate_data = file_service.get_file(student['certificate_url'])
-        
-        if not certificate_data:
-            st.error("Sertifika dosyası bulunamadı!")
-            return
         
         # Dosya uzantısına göre görüntüleme
         file_ext = student['certificate_url'].split('.')[-1].lower()
+        derivatives = student.get("derivatives", {})
+        
+        if file_ext not in ["html", "pdf", "jpg", "jpeg", "png"]:
+            st.error(f"Desteklenmeyen dosya formatı: {file_ext}")
+            return
+        
+        # Dosya sunucusu varsa dosya Streamlit üzerinden gönderilmez
+        if _show_certificate_by_url(student, file_service, file_ext, derivatives):
+            certificate_data = None
+        else:
+            certificate_data = file_service.get_file(student['certificate_url'])
+            
+            if not certificate_data:
+                st.error("Sertifika dosyası bulunamadı!")
+                return
         
-        if file_ext == "html":
+        if certificate_data is None:
+            pass
+        elif file_ext == "html":
             # HTML sertifikasını gömülü olarak göster
             html_content = certificate_data.decode('utf-8') if isinstance(certificate_data, bytes) else str(certificate_data)
             
             # HTML'i tam ekran göster
             st.components.v1.html(html_content, height=800, scrolling=True)
             
+            # Hazır PDF yoksa dönüştürme işçilerini tıklamadan önce hazırla
+            if not derivatives.get("pdf"):
+                from utils.html_pdf_renderer import HtmlPdfRenderer
+                HtmlPdfRenderer.warm_up()
+            
             # İndirme butonları
             col1, col2 = st.columns(2)
             
@@ -95,8 +114,17 @@ def show():
                 )
             
             with col2:
+                # Sertifika oluşturulurken hazırlanan PDF varsa doğrudan sun
+                if derivatives.get("pdf"):
+                    st.download_button(
+                        label="📥 PDF İndir",
+                        data=file_service.get_file(derivatives["pdf"]),
+                        file_name=f"sertifika_{student['first_name']}_{student['last_name']}.pdf",
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
                 # HTML'i PDF'e çevirme butonu
-                if st.button("🔄 PDF'e Çevir", help="HTML sertifikasını PDF formatına çevirir", use_container_width=True):
+                elif st.button("🔄 PDF'e Çevir", help="HTML sertifikasını PDF formatına çevirir", use_container_width=True):
                     with st.spinner("PDF oluşturuluyor..."):
                         pdf_data = CertificateGenerator.convert_html_to_pdf(html_content)
                         if pdf_data:
@@ -112,15 +140,19 @@ def show():
                             st.error("PDF oluşturulurken bir hata oluştu!")
             
         elif file_ext == "pdf":
-            # PDF'i gömülü olarak göster
-            base64_pdf = base64.b64encode(certificate_data).decode('utf-8')
-            pdf_display = f'''
-            <iframe src="data:application/pdf;base64,{base64_pdf}" 
-                    width="100%" height="600" type="application/pdf"
-                    style="border: 1px solid #ddd; border-radius: 5px;">
-            </iframe>
-            '''
-            st.markdown(pdf_display, unsafe_allow_html=True)
+            # Web boyutundaki PNG türevi varsa önizleme olarak gösterilir,
+            # yoksa PDF sayfaya gömülür
+            if derivatives.get("png"):
+                st.image(file_service.get_file(derivatives["png"]), caption=f"{student['first_name']} {student['last_name']} Sertifikası")
+            else:
+                base64_pdf = base64.b64encode(certificate_data).decode('utf-8')
+                pdf_display = f'''
+                <iframe src="data:application/pdf;base64,{base64_pdf}" 
+                        width="100%" height="600" type="application/pdf"
+                        style="border: 1px solid #ddd; border-radius: 5px;">
+                </iframe>
+                '''
+                st.markdown(pdf_display, unsafe_allow_html=True)
             
             # PDF indirme butonu
             st.download_button(
@@ -132,8 +164,9 @@ def show():
             )
             
         elif file_ext in ["jpg", "jpeg", "png"]:
-            # Resim sertifikasını göster
-            st.image(certificate_data, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
+            # Resim sertifikasını göster (varsa web boyutundaki türev ile)
+            preview_data = file_service.get_file(derivatives["png"]) if derivatives.get("png") else certificate_data
+            st.image(preview_data, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
             
             # İndirme butonları
             col1, col2 = st.columns(2)
@@ -148,10 +181,22 @@ def show():
                 )
             
             with col2:
+                # Sertifika oluşturulurken hazırlanan PDF varsa doğrudan sun
+                if derivatives.get("pdf"):
+                    st.download_button(
+                        label="📥 PDF İndir",
+                        data=file_service.get_file(derivatives["pdf"]),
+                        file_name=f"sertifika_{student['first_name']}_{student['last_name']}.pdf",
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
                 # Resmi PDF'e çevirme butonu
-                if st.button("🔄 PDF'e Çevir", help="Resim sertifikasını PDF formatına çevirir", use_container_width=True):
+                elif st.button("🔄 PDF'e Çevir", help="Resim sertifikasını PDF formatına çevirir", use_container_width=True):
                     with st.spinner("PDF oluşturuluyor..."):
-                        pdf_data = CertificateGenerator.convert_image_to_pdf(certificate_data)
+                        pdf_data = CertificateGenerator.convert_image_to_pdf(
+                            certificate_data,
+                            cache_key=student['certificate_url']
+                        )
                         if pdf_data:
                             st.download_button(
                                 label="📥 PDF İndir",
@@ -164,10 +209,6 @@ def show():
                         else:
                             st.error("PDF oluşturulurken bir hata oluştu!")
             
-        else:
-            st.error(f"Desteklenmeyen dosya formatı: {file_ext}")
-            return
-            
     except Exception as e:
         st.error(f"Sertifika görüntülenirken bir hata oluştu: {str(e)}")
         return
@@ -184,39 +225,36 @@ def show():
     """)
     
     # Doğrulama linki (domain uyumlu)
-    verification_url = f"{config.BASE_URL}/?token={token}"
+    verification_url = QRCodeGenerator.verification_url(token)
     st.write(f"**Doğrulama Linki:** {verification_url}")
     
-    # QR kod oluşturma (opsiyonel)
+    # QR kod (sertifika oluşturulurken kaydedilen, yoksa önbellekten)
     try:
-        import qrcode
-        from io import BytesIO
-        
-        # QR kod oluştur
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(verification_url)
-        qr.make(fit=True)
-        
-        # QR kod resmi oluştur
-        qr_img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Resmi bytes'a çevir
-        img_buffer = BytesIO()
-        qr_img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
+        qr_file = student.get("derivatives", {}).get("qr")
+        qr_file_name = f"qr_kod_{student['first_name']}_{student['last_name']}.png"
+        qr_url = file_service.get_file_url(qr_file) if qr_file else None
         
-        # QR kodu göster
         st.subheader("📱 QR Kod")
-        st.image(img_buffer, caption="Sertifika doğrulama QR kodu", width=200)
         
-        # QR kod indirme butonu
-        st.download_button(
-            label="📥 QR Kodu İndir",
-            data=img_buffer.getvalue(),
-            file_name=f"qr_kod_{student['first_name']}_{student['last_name']}.png",
-            mime="image/png",
-            use_container_width=True
-        )
+        if qr_url:
+            st.image(qr_url, caption="Sertifika doğrulama QR kodu", width=200)
+            st.link_button(
+                "📥 QR Kodu İndir",
+                file_service.get_file_url(qr_file, download_name=qr_file_name),
+                use_container_width=True
+            )
+        else:
+            qr_png = QRCodeGenerator.generate_png(verification_url)
+            st.image(qr_png, caption="Sertifika doğrulama QR kodu", width=200)
+        
+            # QR kod indirme butonu
+            st.download_button(
+                label="📥 QR Kodu İndir",
+                data=qr_png,
+                file_name=qr_file_name,
+                mime="image/png",
+                use_container_width=True
+            )
         
     except ImportError:
         st.info("QR kod özelliği için 'qrcode' paketi gerekli.")
@@ -269,7 +307,7 @@ def show():
     
     st.info(f"""
     **Sertifika Detayları:**
-    - **Oluşturulma Tarihi:** {student.get('created_at', 'Bilinmiyor')}
+    - **Oluşturulma Tarihi:** {student['certificate_issued_at'].strftime('%d.%m.%Y') if student['certificate_issued_at'] else 'Bilinmiyor'}
     - **Eğitim Süresi:** {student.get('course_duration', 'Bilinmiyor')}
     - **Sertifika Türü:** {file_ext.upper()}
     - **Doğrulama Durumu:** ✅ Geçerli
@@ -283,3 +321,78 @@ def show():
         Sertifika doğrulama için yukarıdaki linki kullanabilirsiniz.
     </div>
     """, unsafe_allow_html=True)
+
+def _show_certificate_by_url(student, file_service, file_ext, derivatives):
+    """
+    Sertifikayı dosya sunucusu URL'i üzerinden gösterir
+    
+    Sayfaya yalnızca bağlantılar eklenir; dosyayı tarayıcı doğrudan indirir
+    ve ETag/Cache-Control başlıkları sayesinde önbellekler.
+    
+    Args:
+        student: Öğrenci bilgileri
+        file_service: Dosya servisi
+        file_ext: Sertifika dosyasının uzantısı
+        derivatives: Sertifika türevleri (tür -> dosya yolu)
+    
+    Returns:
+        Gösterildiyse True, URL oluşturulamadıysa False
+    """
+    certificate_url = file_service.get_file_url(student['certificate_url'])
+    if not certificate_url:
+        return False
+    
+    base_name = f"sertifika_{student['first_name']}_{student['last_name']}"
+    
+    if file_ext in ["html", "pdf"]:
+        st.components.v1.iframe(certificate_url, height=800 if file_ext == "html" else 600, scrolling=True)
+    else:
+        # Resim sertifikasını göster (varsa web boyutundaki türev ile)
+        preview_url = file_service.get_file_url(derivatives["png"]) if derivatives.get("png") else certificate_url
+        st.image(preview_url, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
+    
+    download_labels = {"html": "📥 HTML İndir", "pdf": "📥 PDF Sertifikayı İndir"}
+    
+    # İndirme butonları
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.link_button(
+            download_labels.get(file_ext, "📥 Resim İndir"),
+            file_service.get_file_url(student['certificate_url'], download_name=f"{base_name}.{file_ext}"),
+            use_container_width=True
+        )
+    
+    with col2:
+        if file_ext == "pdf":
+            pass
+        elif derivatives.get("pdf"):
+            # Sertifika oluşturulurken hazırlanan PDF
+            st.link_button(
+                "📥 PDF İndir",
+                file_service.get_file_url(derivatives["pdf"], download_name=f"{base_name}.pdf"),
+                use_container_width=True
+            )
+        elif st.button("🔄 PDF'e Çevir", help="Sertifikayı PDF formatına çevirir", use_container_width=True):
+            # Eski sertifikalar için PDF isteğe bağlı olarak oluşturulur
+            with st.spinner("PDF oluşturuluyor..."):
+                certificate_data = file_service.get_file(student['certificate_url'])
+                if file_ext == "html":
+                    pdf_data = CertificateGenerator.convert_html_to_pdf(certificate_data)
+                else:
+                    pdf_data = CertificateGenerator.convert_image_to_pdf(
+                        certificate_data,
+                        cache_key=student['certificate_url']
+                    )
+                if pdf_data:
+                    st.download_button(
+                        label="📥 PDF İndir",
+                        data=pdf_data,
+                        file_name=f"{base_name}.pdf",
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
+                else:
+                    st.error("PDF oluşturulurken bir hata oluştu!")
+    
+    return True
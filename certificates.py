@@ -1,14 +1,31 @@
 import streamlit as st
 import pandas as pd
-from utils.auth_helpers import auth_required
 from services.course_service import CourseService
 from services.student_service import StudentService
 from services.file_service import FileService
+from services.job_service import JobService
+from services.email_service import EmailService
+from utils.qr_helper import QRCodeGenerator
+from utils.job_runner import start_job_runner, notify_job_runner
 import base64
 import io
+import os
 import config
 
-@auth_required
+# Toplu iş türlerinin ekranda görünen adları
+JOB_KIND_LABELS = {
+    "complete_course": "Eğitim Tamamlama",
+    "generate_certificates": "Sertifika Oluşturma",
+    "send_emails": "E-posta Gönderimi"
+}
+
+JOB_STATUS_LABELS = {
+    "pending": "⏳ Sırada",
+    "running": "🔄 Çalışıyor",
+    "completed": "✅ Tamamlandı",
+    "failed": "❌ Hata ile durdu"
+}
+
 def show():
     """Sertifikalar sayfasını gösterir"""
     
@@ -21,39 +38,6 @@ def show():
     
     st.title("Sertifikalar")
     
-    # Kullanıcı bilgileri
-    st.sidebar.success(f"Hoş geldiniz, {st.session_state['username']}!")
-    
-    # Navigasyon
-    with st.sidebar:
-        st.title("Menü")
-        if st.button("Ana Sayfa", use_container_width=True):
-            st.session_state["current_page"] = "dashboard"
-            st.rerun()
-        
-        if st.button("Eğitimler", use_container_width=True):
-            st.session_state["current_page"] = "courses"
-            st.rerun()
-            
-        if st.button("Öğrenciler", use_container_width=True):
-            st.session_state["current_page"] = "students"
-            st.rerun()
-            
-        if st.button("Sertifikalar", use_container_width=True, type="primary"):
-            st.session_state["current_page"] = "certificates"
-            st.rerun()
-            
-        if st.button("Çıkış Yap", use_container_width=True):
-            # Oturum bilgilerini temizle
-            st.session_state.pop("token", None)
-            st.session_state.pop("user_id", None)
-            st.session_state.pop("username", None)
-            st.session_state.pop("email", None)
-            st.session_state.pop("role", None)
-            
-            st.session_state["current_page"] = "login"
-            st.rerun()
-    
     # Servis nesnelerini oluştur
     course_service = CourseService()
     student_service = StudentService()
@@ -118,6 +102,9 @@ def show():
             - `{{egitmen_adi}}` - Eğitmen adı
             - `{{tarih}}` - Sertifika tarihi
             - `{{sertifika_no}}` - Sertifika numarası
+            - `{{dogrulama_kodu}}` - Sertifika doğrulama kodu
+            - `{{dogrulama_linki}}` - Sertifika doğrulama linki
+            - `{{qr_kodu}}` - Doğrulama QR kodu (`<img src="{{qr_kodu}}">` olarak kullanılır)
             """)
             
             html_template = st.text_area(
@@ -255,6 +242,16 @@ def show():
             z-index: 2;
         }
 
+        /* Doldurulacak Alan: Doğrulama QR Kodu */
+        #qr-kodu {
+            position: absolute;
+            bottom: 1.5rem;
+            right: 2rem;
+            width: 80px;
+            height: 80px;
+            z-index: 2;
+        }
+        
         /* Yazdırma için Özel Stiller */
         @media print {
             body {
@@ -303,7 +300,8 @@ def show():
                     </div>
                 </div>
             </div>
-            <span id="sertifika-no">Sertifika No: {{sertifika_no}}</span>
+            <span id="sertifika-no">Sertifika No: {{sertifika_no}} · Doğrulama Kodu: {{dogrulama_kodu}}</span>
+            <img id="qr-kodu" src="{{qr_kodu}}" alt="Doğrulama QR Kodu">
         </div>
     </div>
 
@@ -322,7 +320,12 @@ def show():
                 "kurs_adi": selected_course["name"],
                 "egitmen_adi": selected_course.get("instructor_name", "Test Eğitmen"),
                 "tarih": "29.07.2025",
-                "sertifika_no": "2025072901"
+                "sertifika_no": "2025072901",
+                "dogrulama_kodu": "ABCD2345",
+                "dogrulama_linki": QRCodeGenerator.verification_url("ornek"),
+                "qr_kodu": "data:image/png;base64," + base64.b64encode(
+                    QRCodeGenerator.generate_png(QRCodeGenerator.verification_url("ornek"))
+                ).decode("ascii")
             }
             
             # HTML'de placeholder'ları değiştir
@@ -368,7 +371,12 @@ def show():
                         "kurs_adi": selected_course["name"],
                         "egitmen_adi": selected_course.get("instructor_name", "Test Eğitmen"),
                         "tarih": "29.07.2025",
-                        "sertifika_no": "2025072901"
+                        "sertifika_no": "2025072901",
+                        "dogrulama_kodu": "ABCD2345",
+                        "dogrulama_linki": QRCodeGenerator.verification_url("ornek"),
+                        "qr_kodu": "data:image/png;base64," + base64.b64encode(
+                            QRCodeGenerator.generate_png(QRCodeGenerator.verification_url("ornek"))
+                        ).decode("ascii")
                     }
                     
                     # HTML'de placeholder'ları değiştir
@@ -403,58 +411,21 @@ def show():
                         if student['certificate_url']:
                             certificate_link = f"{config.BASE_URL}/?token={student['certificate_access_token']}"
                             st.write(f"**Sertifika Linki:** [Görüntüle]({certificate_link})")
+                            
+                            # Listede tam boy dosya yerine küçük resim göster
+                            thumbnail_url = student['derivatives'].get('thumbnail')
+                            if thumbnail_url:
+                                try:
+                                    st.image(file_service.get_file_url(thumbnail_url) or file_service.get_file(thumbnail_url), width=240)
+                                except Exception:
+                                    pass
                     
                     with cols[1]:
                         # Sertifika görüntüleme butonu
                         if student['certificate_url']:
                             if st.button("Sertifikayı Görüntüle", key=f"view_cert_{student['id']}"):
                                 try:
-                                    # Sertifika dosyasını al
-                                    certificate_data = file_service.get_file(student['certificate_url'])
-                                    
-                                    # Dosya uzantısına göre MIME türünü belirle
-                                    file_ext = student['certificate_url'].split('.')[-1].lower()
-                                    
-                                    if file_ext == "html":
-                                        # HTML sertifikasını gömülü olarak göster
-                                        html_content = certificate_data.decode('utf-8') if isinstance(certificate_data, bytes) else str(certificate_data)
-                                        st.components.v1.html(html_content, height=600, scrolling=True)
-                                        
-                                        # İndirme butonu
-                                        st.download_button(
-                                            label="Sertifikayı İndir",
-                                            data=certificate_data,
-                                            file_name=f"sertifika_{student['first_name']}_{student['last_name']}.html",
-                                            mime="text/html"
-                                        )
-                                    elif file_ext == "pdf":
-                                        mime_type = "application/pdf"
-                                        
-                                        # PDF'i gömülü olarak göster
-                                        base64_pdf = base64.b64encode(certificate_data).decode('utf-8')
-                                        pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="700" height="500" type="application/pdf"></iframe>'
-                                        st.markdown(pdf_display, unsafe_allow_html=True)
-                                        
-                                        # İndirme butonu
-                                        st.download_button(
-                                            label="Sertifikayı İndir",
-                                            data=certificate_data,
-                                            file_name=f"sertifika_{student['first_name']}_{student['last_name']}.pdf",
-                                            mime=mime_type
-                                        )
-                                    elif file_ext in ["jpg", "jpeg", "png"]:
-                                        mime_type = f"image/{file_ext}"
-                                        st.image(certificate_data, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
-                                        
-                                        # İndirme butonu
-                                        st.download_button(
-                                            label="Sertifikayı İndir",
-                                            data=certificate_data,
-                                            file_name=f"sertifika_{student['first_name']}_{student['last_name']}.{file_ext}",
-                                            mime=mime_type
-                                        )
-                                    else:
-                                        st.error(f"Desteklenmeyen dosya formatı: {file_ext}")
+                                    _show_certificate_file(student, file_service)
                                 except Exception as e:
                                     st.error(f"Sertifika görüntülenirken bir hata oluştu: {str(e)}")
                         
@@ -477,123 +448,351 @@ def show():
             # Toplu işlemler
             st.subheader("Toplu İşlemler")
             
+            # Kota dolduğunda e-posta işleri durur ve ertesi gün devam ettirilebilir
+            remaining_quota = EmailService().daily_quota_remaining()
+            if remaining_quota is not None:
+                st.caption(f"Bugün kalan e-posta kotası: {remaining_quota} / {config.SMTP_DAILY_LIMIT}")
+            
             col1, col2 = st.columns(2)
             
+            # Toplu işler arka planda çalışır; sayfadan ayrılmak işi durdurmaz
             with col1:
                 if st.button("Tüm Sertifikaları Oluştur", use_container_width=True):
-                    success_count = 0
-                    for student in completed_students:
-                        if not student['certificate_url']:
-                            if student_service.send_certificate_email(student['id']):
-                                success_count += 1
-                    
-                    if success_count > 0:
-                        st.success(f"{success_count} sertifika başarıyla oluşturuldu!")
-                        st.rerun()
+                    if any(not student['certificate_url'] for student in completed_students):
+                        _start_bulk_job(selected_course_id, "generate_certificates")
                     else:
                         st.info("Oluşturulacak sertifika bulunamadı.")
             
             with col2:
                 if st.button("Tüm E-postaları Gönder", use_container_width=True):
-                    success_count = 0
-                    for student in completed_students:
-                        if student['certificate_url']:
-                            if student_service.send_certificate_email(student['id']):
-                                success_count += 1
-                    
-                    if success_count > 0:
-                        st.success(f"{success_count} e-posta başarıyla gönderildi!")
+                    if any(student['certificate_url'] for student in completed_students):
+                        _start_bulk_job(selected_course_id, "send_emails")
                     else:
                         st.info("Gönderilecek e-posta bulunamadı.")
-    
+            
+            _show_course_jobs(selected_course_id)
+
+            # Tüm sertifikaları yazdırmak için tek PDF
+            if selected_course["certificate_template_url"]:
+                if st.button("Tüm Sertifikaları Tek PDF Olarak Hazırla", use_container_width=True):
+                    with st.spinner("Toplu PDF oluşturuluyor..."):
+                        batch_pdf_path = course_service.generate_course_certificates_pdf(selected_course_id)
+
+                    if batch_pdf_path:
+                        _show_export_download("📥 Toplu PDF İndir", batch_pdf_path, f"sertifikalar_{selected_course_id}.pdf", "application/pdf", file_service)
+                    else:
+                        st.error("Toplu PDF oluşturulurken bir hata oluştu!")
+
+            # Tüm sertifikaları ZIP arşivi olarak indir
+            if st.button("Tüm Sertifikaları ZIP Olarak Hazırla", use_container_width=True):
+                with st.spinner("Sertifika arşivi oluşturuluyor..."):
+                    zip_path = course_service.export_course_certificates_zip(selected_course_id)
+
+                if zip_path:
+                    _show_export_download("📥 ZIP İndir", zip_path, f"sertifikalar_{selected_course_id}.zip", "application/zip", file_service)
+                else:
+                    st.error("İndirilecek sertifika bulunamadı!")
+
     with tab3:
         st.header("Sertifika Doğrulama")
         
         st.write("""
-        Sertifika erişim tokeni ile sertifika doğrulama yapabilirsiniz.
-        Token, öğrenciye gönderilen sertifika linkinde yer alır.
+        Sertifikayı erişim tokeni veya sertifika üzerindeki numara ve doğrulama
+        kodu ile doğrulayabilirsiniz. Token, öğrenciye gönderilen sertifika
+        linkinde yer alır.
         """)
         
-        token = st.text_input("Sertifika Tokeni")
+        method = st.radio("Doğrulama Yöntemi", ["Sertifika Tokeni", "Sertifika No ve Doğrulama Kodu"], horizontal=True)
+        
+        if method == "Sertifika Tokeni":
+            token = st.text_input("Sertifika Tokeni")
+        else:
+            certificate_number = st.text_input("Sertifika No")
+            verification_code = st.text_input("Doğrulama Kodu")
         
         if st.button("Doğrula"):
-            if not token:
-                st.error("Token girilmedi!")
-            else:
-                try:
+            try:
+                if method == "Sertifika Tokeni":
+                    if not token:
+                        st.error("Token girilmedi!")
+                        return
+                    
                     # Token formatını kontrol et
                     import uuid
                     try:
-                        uuid_obj = uuid.UUID(token)
+                        uuid.UUID(token)
                     except ValueError:
                         st.error("Geçersiz token formatı!")
                         return
                     
                     # Öğrenciyi bul
                     student = student_service.get_student_by_token(token)
+                else:
+                    if not certificate_number or not verification_code:
+                        st.error("Sertifika numarası ve doğrulama kodu girilmelidir!")
+                        return
                     
-                    if not student:
-                        st.error("Bu token ile eşleşen bir sertifika bulunamadı!")
-                    elif not student["has_completed_course"]:
-                        st.warning("Bu öğrenci eğitimi henüz tamamlamamış!")
-                    elif not student["certificate_url"]:
-                        st.warning("Bu öğrenci için henüz sertifika oluşturulmamış!")
-                    else:
-                        st.success("✅ Sertifika doğrulandı!")
+                    # Kod, sertifika bilgilerinden yeniden hesaplanarak karşılaştırılır
+                    student = student_service.get_student_by_certificate_code(certificate_number, verification_code)
                         
-                        st.write(f"**Öğrenci:** {student['first_name']} {student['last_name']}")
-                        st.write(f"**E-posta:** {student['email']}")
-                        st.write(f"**Eğitim:** {student['course_name']}")
+                if not student:
+                    st.error("Bu bilgilerle eşleşen bir sertifika bulunamadı!")
+                elif not student["has_completed_course"]:
+                    st.warning("Bu öğrenci eğitimi henüz tamamlamamış!")
+                elif not student["certificate_url"]:
+                    st.warning("Bu öğrenci için henüz sertifika oluşturulmamış!")
+                else:
+                    st.success("✅ Sertifika doğrulandı!")
                         
-                        # Sertifikayı görüntüle
-                        try:
-                            # Sertifika dosyasını al
-                            certificate_data = file_service.get_file(student['certificate_url'])
-                            
-                            # Dosya uzantısına göre MIME türünü belirle
-                            file_ext = student['certificate_url'].split('.')[-1].lower()
-                            
-                            if file_ext == "html":
-                                # HTML sertifikasını gömülü olarak göster
-                                html_content = certificate_data.decode('utf-8') if isinstance(certificate_data, bytes) else str(certificate_data)
-                                st.components.v1.html(html_content, height=600, scrolling=True)
-                                
-                                # İndirme butonu
-                                st.download_button(
-                                    label="Sertifikayı İndir",
-                                    data=certificate_data,
-                                    file_name=f"sertifika_{student['first_name']}_{student['last_name']}.html",
-                                    mime="text/html"
-                                )
-                            elif file_ext == "pdf":
-                                mime_type = "application/pdf"
-                                
-                                # PDF'i gömülü olarak göster
-                                base64_pdf = base64.b64encode(certificate_data).decode('utf-8')
-                                pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="700" height="500" type="application/pdf"></iframe>'
-                                st.markdown(pdf_display, unsafe_allow_html=True)
-                                
-                                # İndirme butonu
-                                st.download_button(
-                                    label="Sertifikayı İndir",
-                                    data=certificate_data,
-                                    file_name=f"sertifika_{student['first_name']}_{student['last_name']}.pdf",
-                                    mime=mime_type
-                                )
-                            elif file_ext in ["jpg", "jpeg", "png"]:
-                                mime_type = f"image/{file_ext}"
-                                st.image(certificate_data, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
-                                
-                                # İndirme butonu
-                                st.download_button(
-                                    label="Sertifikayı İndir",
-                                    data=certificate_data,
-                                    file_name=f"sertifika_{student['first_name']}_{student['last_name']}.{file_ext}",
-                                    mime=mime_type
-                                )
-                            else:
-                                st.error(f"Desteklenmeyen dosya formatı: {file_ext}")
-                        except Exception as e:
-                            st.error(f"Sertifika görüntülenirken bir hata oluştu: {str(e)}")
-                except Exception as e:
-                    st.error(f"Doğrulama sırasında bir hata oluştu: {str(e)}")
+                    st.write(f"**Öğrenci:** {student['first_name']} {student['last_name']}")
+                    st.write(f"**E-posta:** {student['email']}")
+                    st.write(f"**Eğitim:** {student['course_name']}")
+                    if student['verification_code']:
+                        st.write(f"**Sertifika No:** {student['certificate_number']}")
+                        st.write(f"**Doğrulama Kodu:** {student['verification_code']}")
+                    
+                    # Sertifikayı görüntüle
+                    try:
+                        _show_certificate_file(student, file_service)
+                    except Exception as e:
+                        st.error(f"Sertifika görüntülenirken bir hata oluştu: {str(e)}")
+            except Exception as e:
+                st.error(f"Doğrulama sırasında bir hata oluştu: {str(e)}")
+
+def _show_certificate_file(student, file_service):
+    """
+    Sertifika dosyasını gösterir ve indirme seçeneği sunar
+    
+    Dosya sunucusu URL'i varsa dosya tarayıcı tarafından doğrudan alınır ve
+    önbelleklenir; sayfaya yalnızca bağlantı eklenir. URL yoksa içerik
+    Streamlit üzerinden gönderilir.
+    
+    Args:
+        student: Öğrenci bilgileri
+        file_service: Dosya servisi
+    """
+    file_ext = student['certificate_url'].split('.')[-1].lower()
+    file_name = f"sertifika_{student['first_name']}_{student['last_name']}.{file_ext}"
+    web_url = student['derivatives'].get('png')
+    
+    if file_ext not in ["html", "pdf", "jpg", "jpeg", "png"]:
+        st.error(f"Desteklenmeyen dosya formatı: {file_ext}")
+        return
+    
+    certificate_url = file_service.get_file_url(student['certificate_url'])
+    
+    if certificate_url:
+        if file_ext in ["html", "pdf"]:
+            st.components.v1.iframe(certificate_url, height=600 if file_ext == "html" else 500, scrolling=True)
+        else:
+            preview_url = file_service.get_file_url(web_url) if web_url else certificate_url
+            st.image(preview_url, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
+        
+        # İndirme bağlantısı
+        st.link_button(
+            "Sertifikayı İndir",
+            file_service.get_file_url(student['certificate_url'], download_name=file_name)
+        )
+        return
+    
+    # Sertifika dosyasını al
+    certificate_data = file_service.get_file(student['certificate_url'])
+    
+    if file_ext == "html":
+        # HTML sertifikasını gömülü olarak göster
+        html_content = certificate_data.decode('utf-8') if isinstance(certificate_data, bytes) else str(certificate_data)
+        st.components.v1.html(html_content, height=600, scrolling=True)
+        mime_type = "text/html"
+    elif file_ext == "pdf":
+        # Web boyutundaki PNG türevi varsa önizleme olarak gösterilir,
+        # yoksa PDF sayfaya gömülür
+        mime_type = "application/pdf"
+        if web_url:
+            st.image(file_service.get_file(web_url), caption=f"{student['first_name']} {student['last_name']} Sertifikası")
+        else:
+            base64_pdf = base64.b64encode(certificate_data).decode('utf-8')
+            pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="700" height="500" type="application/pdf"></iframe>'
+            st.markdown(pdf_display, unsafe_allow_html=True)
+    else:
+        mime_type = f"image/{file_ext}"
+        preview_data = file_service.get_file(web_url) if web_url else certificate_data
+        st.image(preview_data, caption=f"{student['first_name']} {student['last_name']} Sertifikası")
+    
+    # İndirme butonu
+    st.download_button(
+        label="Sertifikayı İndir",
+        data=certificate_data,
+        file_name=file_name,
+        mime=mime_type
+    )
+
+def _show_export_download(label, export_path, file_name, mime, file_service):
+    """
+    Toplu dışa aktarma dosyasının indirme bağlantısını gösterir
+    
+    Mümkünse dosya URL ile (S3 imzalı URL) indirilir. Değilse dosya yalnızca
+    butona basıldığında okunur; sayfa her çizildiğinde oturum belleğine
+    alınmaz (data olarak fonksiyon verilmesi Streamlit 1.52 gerektirir).
+    
+    Args:
+        label: Buton yazısı
+        export_path: Dosyanın depo köküne göre yolu (exports/...)
+        file_name: Tarayıcının kaydedeceği dosya adı
+        mime: Dosya türü
+        file_service: Dosya servisi
+    """
+    url = file_service.get_export_url(export_path, file_name)
+    if url:
+        st.link_button(label, url, use_container_width=True)
+        return
+    
+    full_path = os.path.join(config.STORAGE_PATH, export_path)
+    
+    def read_export():
+        with open(full_path, "rb") as export_file:
+            return export_file.read()
+    
+    st.download_button(
+        label=label,
+        data=read_export,
+        file_name=file_name,
+        mime=mime,
+        on_click="ignore",
+        use_container_width=True
+    )
+
+def _start_bulk_job(course_id, kind):
+    """
+    Toplu işi oluşturur ve arka plan çalıştırıcısına bildirir
+    
+    Arka plan çalıştırıcısı devre dışıysa iş bu istekte çalıştırılır.
+    
+    Args:
+        course_id: Eğitim ID'si
+        kind: İş türü
+    """
+    job_id = JobService.create_job(course_id, kind)
+    
+    if not job_id:
+        st.error("İş oluşturulurken bir hata oluştu!")
+        return
+    
+    if _run_job(job_id, kind):
+        st.success(f"{JOB_KIND_LABELS[kind]} işi başlatıldı. Sayfadan ayrılabilirsiniz; iş arka planda devam eder.")
+    else:
+        st.rerun()
+
+def _run_job(job_id, kind):
+    """
+    İşi arka plan çalıştırıcısına bildirir; çalıştırıcı devre dışıysa iş bu istekte çalıştırılır
+    
+    Args:
+        job_id: İş ID'si
+        kind: İş türü
+    
+    Returns:
+        İş arka planda çalışacaksa True, bu istekte çalıştırıldıysa False
+    """
+    if start_job_runner():
+        notify_job_runner()
+        return True
+    
+    with st.spinner(f"{JOB_KIND_LABELS.get(kind, kind)} işi çalışıyor..."):
+        JobService.run_job(job_id)
+    return False
+
+def _show_course_jobs(course_id):
+    """
+    Eğitimin son toplu işlerini ve ilerlemesini gösterir
+    
+    Devam eden iş varsa yalnızca bu bölüm JOB_PROGRESS_REFRESH_SECONDS
+    aralıkla yenilenir; iş bittiğinde öğrenci listesi güncellensin diye
+    sayfa bir kez yeniden çalıştırılır.
+    
+    Args:
+        course_id: Eğitim ID'si
+    """
+    jobs = JobService.list_jobs(course_id=course_id, limit=3)
+    active = any(job["status"] in ["pending", "running"] for job in jobs)
+    
+    @st.fragment(run_every=config.JOB_PROGRESS_REFRESH_SECONDS if active else None)
+    def job_progress():
+        current_jobs = JobService.list_jobs(course_id=course_id, limit=3)
+        
+        if active and not any(job["status"] in ["pending", "running"] for job in current_jobs):
+            st.rerun()
+        
+        if not current_jobs:
+            return
+        
+        st.subheader("Toplu İşler")
+        for job in current_jobs:
+            _show_job(job)
+    
+    job_progress()
+
+def _show_job(job):
+    """
+    Tek bir işin ilerlemesini, tahmini kalan süresini ve hatalarını gösterir
+    
+    Args:
+        job: İş bilgileri (bkz. JobService.get_job)
+    """
+    counts = job["counts"]
+    label = JOB_KIND_LABELS.get(job["kind"], job["kind"])
+    status = JOB_STATUS_LABELS.get(job["status"], job["status"])
+    created_at = job["created_at"].strftime("%d.%m.%Y %H:%M") if job["created_at"] else ""
+    
+    with st.container(border=True):
+        st.write(f"**{label}** #{job['id']} · {status} · {created_at}")
+        st.progress(job["progress"], text=f"{job['processed']} / {job['total']} öğrenci")
+        
+        cols = st.columns(4)
+        cols[0].metric("E-posta Gönderildi", counts.get("emailed", 0))
+        cols[1].metric("Değişmedi", counts.get("skipped", 0))
+        cols[2].metric("Başarısız", counts.get("failed", 0))
+        if job["eta_seconds"] is not None:
+            cols[3].metric("Tahmini Kalan Süre", _format_duration(job["eta_seconds"]))
+        elif job["elapsed_seconds"] is not None:
+            cols[3].metric("Süre", _format_duration(job["elapsed_seconds"]))
+        
+        if job["status"] == "failed" and job["error"]:
+            st.error(f"İş durdu: {job['error']}")
+        
+        if job["status"] in ["completed", "failed"]:
+            if counts.get("failed", 0):
+                with st.expander(f"Başarısız öğrenciler ({counts['failed']})"):
+                    failures = JobService.get_job_failures(job["id"])
+                    st.dataframe(
+                        pd.DataFrame(failures)[["name", "email", "error", "attempts"]].rename(columns={
+                            "name": "Ad Soyad",
+                            "email": "E-posta",
+                            "error": "Hata",
+                            "attempts": "Deneme"
+                        }),
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                    
+                    if st.button("Başarısızları Yeniden Dene", key=f"retry_job_{job['id']}"):
+                        if JobService.requeue_job(job["id"], retry_failed=True):
+                            _run_job(job["id"], job["kind"])
+                            st.rerun()
+            
+            if job["status"] == "failed":
+                if st.button("Kaldığı Yerden Devam Et", key=f"resume_job_{job['id']}"):
+                    if JobService.requeue_job(job["id"]):
+                        _run_job(job["id"], job["kind"])
+                        st.rerun()
+
+def _format_duration(seconds):
+    """Saniyeyi '2 sa 5 dk', '3 dk 12 sn' gibi okunur metne çevirir"""
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    if hours:
+        return f"{hours} sa {minutes} dk"
+    if minutes:
+        return f"{minutes} dk {seconds} sn"
+    return f"{seconds} sn"
@@ -25,6 +25,18 @@ APP_ICON = "📜"
 # Veritabanı ayarları - Streamlit.io için SQLite kullan
 default_db = "sqlite:///certificate_app.db"
 DATABASE_URL = get_secret("DATABASE_URL", default_db)
+DB_AUTO_INIT = get_secret("DB_AUTO_INIT", "true").lower() == "true"  # Açılışta tabloları ve admin kullanıcısını hazırla; kapalıysa scripts/init_app.py çalıştırılır
+
+# SQLite bağlantı ayarları (her yeni bağlantıda PRAGMA olarak uygulanır)
+SQLITE_WAL = get_secret("SQLITE_WAL", "true").lower() == "true"  # WAL günlüğü: okumalar yazmaları beklemez
+SQLITE_SYNCHRONOUS = get_secret("SQLITE_SYNCHRONOUS", "NORMAL").upper()  # WAL ile NORMAL güvenlidir; elektrik kesintisinde yalnızca son işlemler kaybolabilir
+SQLITE_BUSY_TIMEOUT_MS = int(get_secret("SQLITE_BUSY_TIMEOUT_MS", "5000"))  # Kilitli veritabanında hata vermeden önce beklenecek süre
+SQLITE_CACHE_SIZE_KB = int(get_secret("SQLITE_CACHE_SIZE_KB", "20000"))  # Bağlantı başına sayfa önbelleği
+SQLITE_MMAP_SIZE_MB = int(get_secret("SQLITE_MMAP_SIZE_MB", "256"))  # Bellek eşlemeli okuma (0 kapatır)
+SQLITE_FOREIGN_KEYS = get_secret("SQLITE_FOREIGN_KEYS", "true").lower() == "true"  # Yabancı anahtar kısıtlarını denetle
+
+# Toplu durum güncellemesinde tek UPDATE ... WHERE id IN (...) ile işlenen öğrenci sayısı
+BULK_UPDATE_CHUNK_SIZE = int(get_secret("BULK_UPDATE_CHUNK_SIZE", "500"))
 
 # JWT ayarları
 JWT_SECRET = get_secret("JWT_SECRET", "PXn7KDollarMEqualsph8CaretPA-NhCsDotPercentCHAe52DSlashSlashYZq0XFSlashP3rxm9JfA6i9y7T-g")
@@ -49,10 +61,73 @@ SMTP_USERNAME = get_secret("SMTP_USERNAME", "")  # Secrets'tan alınacak
 SMTP_PASSWORD = get_secret("SMTP_PASSWORD", "")  # Secrets'tan alınacak - GÜVENLİ!
 SMTP_SENDER_EMAIL = get_secret("SMTP_SENDER_EMAIL", "")  # Secrets'tan alınacak
 SMTP_SENDER_NAME = get_secret("SMTP_SENDER_NAME", "Certificate System")
+SMTP_USE_TLS = get_secret("SMTP_USE_TLS", "true").lower() == "true"  # STARTTLS
+SMTP_TIMEOUT = float(get_secret("SMTP_TIMEOUT", "30"))  # saniye
+SMTP_CONCURRENCY = int(get_secret("SMTP_CONCURRENCY", "5"))  # Toplu gönderimde aynı anda açık bağlantı sayısı
+SMTP_MESSAGES_PER_CONNECTION = int(get_secret("SMTP_MESSAGES_PER_CONNECTION", "100"))  # Bu sayıdan sonra bağlantı yenilenir
+# Sağlayıcı sınırları (Gmail: ücretsiz hesapta günde 500, Workspace'te 2000 alıcı); 0 sınırı kapatır
+SMTP_RATE_PER_MINUTE = int(get_secret("SMTP_RATE_PER_MINUTE", "60"))  # Dakikada gönderilecek en fazla e-posta
+SMTP_BURST = int(get_secret("SMTP_BURST", "10"))  # Beklemeden art arda gönderilebilecek e-posta sayısı
+SMTP_DAILY_LIMIT = int(get_secret("SMTP_DAILY_LIMIT", "500"))  # Hesap başına günlük (UTC) gönderim kotası
+SMTP_MAX_RETRIES = int(get_secret("SMTP_MAX_RETRIES", "3"))  # Geçici (4xx) hatalarda yeniden deneme sayısı
+SMTP_THROTTLE_BACKOFF = float(get_secret("SMTP_THROTTLE_BACKOFF", "30"))  # Sunucu yavaşlama istediğinde ilk bekleme (saniye)
+
+# Günlük kayıtları
+LOG_LEVEL = get_secret("LOG_LEVEL", "INFO").upper()  # DEBUG, INFO, WARNING, ERROR
+LOG_FORMAT = get_secret("LOG_FORMAT", "text")  # 'text' veya 'json'
+LOG_SAMPLE_EVERY = int(get_secret("LOG_SAMPLE_EVERY", "100"))  # Alıcı başına kayıtlardan her N'incisi yazılır
+
+# Performans ölçümü (servis metotlarının süreleri, yönetici sayfasında gösterilir)
+METRICS_ENABLED = get_secret("METRICS_ENABLED", "true").lower() == "true"  # Kapalıyken metotlar sarmalanmaz
+METRICS_WINDOW = int(get_secret("METRICS_WINDOW", "1000"))  # Yüzdelikler için işlem başına saklanan son ölçüm sayısı
+
+# Sorgu profilleyicisi (istek başına sorgu sayısı, yavaş sorgular, olası N+1); rapor: scripts/query_report.py
+QUERY_PROFILER_ENABLED = get_secret("QUERY_PROFILER_ENABLED", "false").lower() == "true"
+QUERY_PROFILE_LOG = get_secret("QUERY_PROFILE_LOG", "query_profile.jsonl")  # İstek özetleri ve yavaş sorgular (JSON satırları); boşsa yazılmaz
+SLOW_QUERY_MS = float(get_secret("SLOW_QUERY_MS", "100"))  # Bu süreyi aşan sorgular plan ve parametreleriyle kaydedilir
+QUERY_N_PLUS_ONE_THRESHOLD = int(get_secret("QUERY_N_PLUS_ONE_THRESHOLD", "5"))  # Bir istekte bu kadar tekrarlanan SELECT N+1 sayılır
+
+# Prometheus metrik sunucusu (sertifika, e-posta, veritabanı havuzu, önbellek ve oturum metrikleri)
+METRICS_EXPORTER_ENABLED = get_secret("METRICS_EXPORTER_ENABLED", "false").lower() == "true"
+METRICS_EXPORTER_HOST = get_secret("METRICS_EXPORTER_HOST", "127.0.0.1")
+METRICS_EXPORTER_PORT = int(get_secret("METRICS_EXPORTER_PORT", "9464"))  # http://<host>:<port>/metrics
+ACTIVE_SESSION_SECONDS = int(get_secret("ACTIVE_SESSION_SECONDS", "900"))  # Bu süre işlem yapmayan oturum etkin sayılmaz
 
 # Uygulama URL'i - Streamlit.io için güncellendi
 BASE_URL = get_secret("BASE_URL", "https://genczeka.streamlit.app")
 
+# HTML -> PDF dönüştürme ayarları
+PDF_RENDERER_WORKERS = int(get_secret("PDF_RENDERER_WORKERS", "2"))
+PDF_RENDER_TIMEOUT = int(get_secret("PDF_RENDER_TIMEOUT", "30"))  # saniye
+PDF_CACHE_MAX_BYTES = int(get_secret("PDF_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PDF_DISK_CACHE_MAX_BYTES = int(get_secret("PDF_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))  # Diskteki HTML -> PDF önbelleğinin üst sınırı; 0 sınırı kapatır
+
+# Sertifika oluşturulurken hazırlanacak türevler (pdf, png, thumbnail, qr)
+CERTIFICATE_DERIVATIVES = [
+    kind.strip() for kind in get_secret("CERTIFICATE_DERIVATIVES", "pdf,png,thumbnail,qr").split(",") if kind.strip()
+]
+CERTIFICATE_WEB_WIDTH = int(get_secret("CERTIFICATE_WEB_WIDTH", "1200"))  # piksel
+CERTIFICATE_THUMBNAIL_WIDTH = int(get_secret("CERTIFICATE_THUMBNAIL_WIDTH", "320"))  # piksel
+QR_CACHE_MAX_BYTES = int(get_secret("QR_CACHE_MAX_BYTES", str(4 * 1024 * 1024)))
+CERTIFICATE_SECRET = get_secret("CERTIFICATE_SECRET", JWT_SECRET)  # Doğrulama kodlarını imzalar
+
+# Arka plan işleri (toplu sertifika oluşturma)
+JOB_CHUNK_SIZE = int(get_secret("JOB_CHUNK_SIZE", "50"))  # Bir seferde okunan ve e-postaları birlikte gönderilen öğrenci sayısı
+JOB_LEASE_SECONDS = int(get_secret("JOB_LEASE_SECONDS", "120"))  # Bu süre ilerleme kaydı olmayan iş devralınabilir
+JOB_RUNNER_ENABLED = get_secret("JOB_RUNNER_ENABLED", "true").lower() == "true"  # İşleri uygulama içinde arka planda çalıştır
+JOB_WORKERS = int(get_secret("JOB_WORKERS", "1"))  # Aynı anda çalışan iş sayısı
+JOB_POLL_SECONDS = float(get_secret("JOB_POLL_SECONDS", "5"))  # Yeni iş kontrol aralığı
+JOB_PROGRESS_REFRESH_SECONDS = float(get_secret("JOB_PROGRESS_REFRESH_SECONDS", "2"))  # Sayfadaki ilerleme yenileme aralığı
+
+# Sertifika dosya sunucusu (yerel depolamada dosyaları tarayıcıya doğrudan sunar)
+# Yalnızca tarayıcının erişebildiği FILE_SERVER_URL ayarlandığında açılır (örn. ters vekil arkasında);
+# ayarlı değilse dosyalar Streamlit üzerinden gönderilir (Streamlit Cloud vb.)
+FILE_SERVER_URL = get_secret("FILE_SERVER_URL", "")  # Tarayıcının eriştiği genel adres
+FILE_SERVER_ENABLED = bool(FILE_SERVER_URL) and get_secret("FILE_SERVER_ENABLED", "true").lower() == "true"
+FILE_SERVER_HOST = get_secret("FILE_SERVER_HOST", "127.0.0.1")  # Kimlik doğrulaması yok; dışarıya ancak vekil üzerinden açın
+FILE_SERVER_PORT = int(get_secret("FILE_SERVER_PORT", "8502"))
+FILE_SERVER_MAX_AGE = int(get_secret("FILE_SERVER_MAX_AGE", str(365 * 24 * 3600)))  # saniye
+
 # Sayfa ayarları
 PAGES = {
     "login": "Giriş",
@@ -2,11 +2,9 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 import io
-from utils.auth_helpers import auth_required, admin_required
 from services.course_service import CourseService
 from services.student_service import StudentService
 
-@auth_required
 def show():
     """Eğitimler sayfasını gösterir"""
     
@@ -19,39 +17,6 @@ def show():
     
     st.title("Eğitimler")
     
-    # Kullanıcı bilgileri
-    st.sidebar.success(f"Hoş geldiniz, {st.session_state['username']}!")
-    
-    # Navigasyon
-    with st.sidebar:
-        st.title("Menü")
-        if st.button("Ana Sayfa", use_container_width=True):
-            st.session_state["current_page"] = "dashboard"
-            st.rerun()
-        
-        if st.button("Eğitimler", use_container_width=True):
-            st.session_state["current_page"] = "courses"
-            st.rerun()
-            
-        if st.button("Öğrenciler", use_container_width=True):
-            st.session_state["current_page"] = "students"
-            st.rerun()
-            
-        if st.button("Sertifikalar", use_container_width=True):
-            st.session_state["current_page"] = "certificates"
-            st.rerun()
-            
-        if st.button("Çıkış Yap", use_container_width=True):
-            # Oturum bilgilerini temizle
-            st.session_state.pop("token", None)
-            st.session_state.pop("user_id", None)
-            st.session_state.pop("username", None)
-            st.session_state.pop("email", None)
-            st.session_state.pop("role", None)
-            
-            st.session_state["current_page"] = "login"
-            st.rerun()
-    
     # Servis nesnelerini oluştur
     course_service = CourseService()
     
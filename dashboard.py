@@ -2,63 +2,15 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import datetime
-from utils.auth_helpers import auth_required
 from services.course_service import CourseService
 from services.student_service import StudentService
 import altair as alt
 
-@auth_required
 def show():
     """Gösterge paneli sayfasını gösterir"""
     
     st.title("Gösterge Paneli")
     
-    # Kullanıcı bilgileri
-    st.sidebar.success(f"Hoş geldiniz, {st.session_state['username']}!")
-    
-    # Navigasyon
-    with st.sidebar:
-        st.title("Menü")
-        if st.button("Ana Sayfa", use_container_width=True):
-            st.session_state["current_page"] = "dashboard"
-            st.rerun()
-        
-        if st.button("Eğitimler", use_container_width=True):
-            st.session_state["current_page"] = "courses"
-            st.rerun()
-            
-        if st.button("Öğrenciler", use_container_width=True):
-            st.session_state["current_page"] = "students"
-            st.rerun()
-            
-        if st.button("Sertifikalar", use_container_width=True):
-            st.session_state["current_page"] = "certificates"
-            st.rerun()
-            
-        # Admin menüleri
-        if st.session_state.get("role") == "admin":
-            st.divider()
-            st.write("**👑 Admin Paneli**")
-            if st.button("👥 Kullanıcı Yönetimi", use_container_width=True):
-                st.session_state["current_page"] = "users"
-                st.rerun()
-        
-        st.divider()
-        if st.button("👤 Profil", use_container_width=True):
-            st.session_state["current_page"] = "profile"
-            st.rerun()
-            
-        if st.button("Çıkış Yap", use_container_width=True, type="primary"):
-            # Oturum bilgilerini temizle
-            st.session_state.pop("token", None)
-            st.session_state.pop("user_id", None)
-            st.session_state.pop("username", None)
-            st.session_state.pop("email", None)
-            st.session_state.pop("role", None)
-            
-            st.session_state["current_page"] = "login"
-            st.rerun()
-    
     # Verileri al
     course_service = CourseService()
     student_service = StudentService()
@@ -1,13 +1,79 @@
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float
+import threading
+from sqlalchemy import create_engine, event, inspect, text, Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import Pool
 import config
+from utils.metrics_exporter import DB_CONNECTIONS_IN_USE, DB_CONNECTIONS_OPENED, DB_CONNECTION_CHECKOUTS
 
 Base = declarative_base()
 
+# DATABASE_URL -> motor; her motorun kendi bağlantı havuzu vardır
+_engines = {}
+_engine_lock = threading.Lock()
+
+# SQLite'ın kabul ettiği synchronous değerleri
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Bağlantı havuzu metrikleri; dinleyiciler Pool sınıfına eklendiği için tüm motorları kapsar
+@event.listens_for(Pool, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    DB_CONNECTIONS_OPENED.inc()
+
+@event.listens_for(Pool, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_CONNECTION_CHECKOUTS.inc()
+    DB_CONNECTIONS_IN_USE.inc()
+
+@event.listens_for(Pool, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    DB_CONNECTIONS_IN_USE.dec()
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    """
+    Yeni SQLite bağlantısını eşzamanlı kullanım için ayarlar
+    
+    WAL günlüğünde okuyucular yazıcıyı beklemez, yazıcılar birbirini
+    SQLITE_BUSY_TIMEOUT_MS boyunca bekler ("database is locked" hatası
+    yerine). journal_mode veritabanı dosyasında kalıcıdır; diğer ayarlar
+    bağlantıya özeldir ve her bağlantıda tekrar uygulanır.
+    """
+    synchronous = config.SQLITE_SYNCHRONOUS if config.SQLITE_SYNCHRONOUS in _SYNCHRONOUS_MODES else "NORMAL"
+    
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(config.SQLITE_BUSY_TIMEOUT_MS)}")
+        if config.SQLITE_WAL:
+            cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute(f"PRAGMA synchronous = {synchronous}")
+        # Negatif değer sayfa sayısı yerine KiB cinsindendir
+        cursor.execute(f"PRAGMA cache_size = -{int(config.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size = {int(config.SQLITE_MMAP_SIZE_MB) * 1024 * 1024}")
+        cursor.execute(f"PRAGMA foreign_keys = {'ON' if config.SQLITE_FOREIGN_KEYS else 'OFF'}")
+    finally:
+        cursor.close()
+
 def get_engine():
-    """Veritabanı motoru oluştur"""
-    return create_engine(config.DATABASE_URL)
+    """
+    Veritabanı motorunu döndürür
+    
+    Motor DATABASE_URL başına bir kez oluşturulur; oturumlar aynı bağlantı
+    havuzunu paylaşır. SQLite bağlantıları açılırken _configure_sqlite ile
+    ayarlanır.
+    """
+    url = config.DATABASE_URL
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+    
+    with _engine_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = create_engine(url)
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", _configure_sqlite)
+            _engines[url] = engine
+        return engine
 
 def get_session():
     """Veritabanı oturumu başlat"""
@@ -19,3 +85,27 @@ def init_db():
     """Veritabanını oluştur"""
     engine = get_engine()
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
+
+def _add_missing_columns(engine):
+    """
+    Mevcut tablolara sonradan eklenen boş bırakılabilir sütunları ekler
+    
+    create_all var olan tabloları değiştirmez; bu fonksiyon yeni sürümde
+    modele eklenen nullable sütunları eski veritabanlarına taşır.
+    """
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+    
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 import uuid
 import datetime
@@ -50,12 +50,18 @@ class Student(Base):
     has_completed_course = Column(Boolean, default=False)
     certificate_url = Column(String(255), nullable=True)
     certificate_access_token = Column(String(36), default=lambda: str(uuid.uuid4()), nullable=False)
+    certificate_number = Column(String(20), nullable=True)  # İlk oluşturmada sabitlenir
+    certificate_issued_at = Column(DateTime, nullable=True)  # Sertifika üzerindeki tarih
+    certificate_fingerprint = Column(String(64), nullable=True)  # Son üretilen sertifikanın girdilerinin özeti
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     
     # İlişki: Bir öğrenci bir eğitime katılabilir
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
     course = relationship("Course", back_populates="students")
     
+    # İlişki: Sertifikadan üretilen hazır dosyalar (PDF, PNG, küçük resim)
+    derivatives = relationship("CertificateDerivative", back_populates="student", cascade="all, delete-orphan")
+    
     # E-posta ve kurs ID kombinasyonunun benzersiz olmasını sağla
     __table_args__ = (
         UniqueConstraint('email', 'course_id', name='uq_student_email_course'),
@@ -63,3 +69,86 @@ class Student(Base):
     
     def __repr__(self):
         return f"<Student {self.first_name} {self.last_name}>"
+
+class CertificateDerivative(Base):
+    """Sertifika türevleri tablosu (sertifika oluşturulurken üretilen PDF, PNG ve küçük resimler)"""
+    __tablename__ = "certificate_derivatives"
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(20), nullable=False)  # 'pdf', 'png' veya 'thumbnail'
+    file_url = Column(String(255), nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    student = relationship("Student", back_populates="derivatives")
+    
+    # Her öğrenci için her türden yalnızca bir dosya
+    __table_args__ = (
+        UniqueConstraint('student_id', 'kind', name='uq_derivative_student_kind'),
+    )
+    
+    def __repr__(self):
+        return f"<CertificateDerivative {self.kind} student={self.student_id}>"
+
+class Job(Base):
+    """Arka plan işleri tablosu (toplu sertifika oluşturma, e-posta gönderimi vb.)"""
+    __tablename__ = "jobs"
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)  # 'complete_course', 'generate_certificates', 'send_emails'
+    status = Column(String(20), nullable=False, default="pending")  # 'pending', 'running', 'completed', 'failed'
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=True)
+    total = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    worker_id = Column(String(100), nullable=True)  # İşi yürüten süreç
+    heartbeat_at = Column(DateTime, nullable=True)  # Son ilerleme kaydı; süresi dolan iş devralınabilir
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    
+    # İlişki: Bir işin her öğrenci için bir adımı vardır
+    items = relationship("JobItem", back_populates="job", cascade="all, delete-orphan")
+    
+    def __repr__(self):
+        return f"<Job {self.kind} {self.status}>"
+
+class JobItem(Base):
+    """İş adımları tablosu (öğrenci başına kalıcı ilerleme durumu)"""
+    __tablename__ = "job_items"
+    
+    id = Column(Integer, primary_key=True)
+    state = Column(String(20), nullable=False, default="pending")  # 'pending', 'rendered', 'sending', 'emailed', 'skipped', 'failed'
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    job = relationship("Job", back_populates="items")
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    
+    # Her öğrenci bir işte yalnızca bir kez yer alır; durum sorguları için indeks
+    __table_args__ = (
+        UniqueConstraint('job_id', 'student_id', name='uq_job_item_student'),
+        Index('ix_job_items_job_state', 'job_id', 'state'),
+    )
+    
+    def __repr__(self):
+        return f"<JobItem job={self.job_id} student={self.student_id} {self.state}>"
+
+class EmailQuota(Base):
+    """Günlük e-posta gönderim sayaçları (SMTP hesabı başına, yeniden başlatmada korunur)"""
+    __tablename__ = "email_quotas"
+    
+    id = Column(Integer, primary_key=True)
+    account = Column(String(255), nullable=False)  # SMTP kullanıcı adı
+    day = Column(String(10), nullable=False)  # UTC tarih (YYYY-MM-DD)
+    sent = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    
+    # Her hesap için günde bir sayaç
+    __table_args__ = (
+        UniqueConstraint('account', 'day', name='uq_email_quota_account_day'),
+    )
+    
+    def __repr__(self):
+        return f"<EmailQuota {self.account} {self.day} sent={self.sent}>"
@@ -0,0 +1,307 @@
+import re
+import json
+import time
+import logging
+import datetime
+import threading
+import contextlib
+import contextvars
+from collections import deque
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import config
+from utils.log_helper import get_logger, log_event
+
+logger = get_logger("db")
+
+_installed = False
+_install_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+# Etkin istek (sayfa çizimi, iş adımı vb.); thread ve asyncio görevine özeldir
+_current_request = contextvars.ContextVar("query_profiler_request", default=None)
+
+# Son yavaş sorgular (yönetici incelemesi için, işlem içinde)
+_slow_queries = deque(maxlen=100)
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+class _Request:
+    """Bir isteğin sorgu istatistikleri"""
+    
+    __slots__ = ("name", "statements", "duration_ms", "queries")
+    
+    def __init__(self, name):
+        self.name = name
+        self.statements = 0
+        self.duration_ms = 0.0
+        # Normalleştirilmiş SQL -> [adet, toplam ms, en fazla ms]
+        self.queries = {}
+
+def normalize_statement(statement):
+    """
+    Aynı sorgunun farklı çağrılarını tek biçime getirir
+    
+    Boşluklar sadeleştirilir ve 'IN (?, ?, ?)' listeleri uzunluklarından
+    bağımsız olarak 'IN (?...)' yazılır.
+    
+    Args:
+        statement: Sürücüye gönderilen SQL
+    
+    Returns:
+        Normalleştirilmiş SQL
+    """
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+def install_profiler():
+    """
+    Sorgu profilleyicisini tüm veritabanı motorlarına bağlar
+    
+    Dinleyiciler Engine sınıfına eklenir; get_engine() ile sonradan
+    oluşturulan motorlar da ölçülür. İşlem başına bir kez çalışır.
+    """
+    global _installed
+    
+    with _install_lock:
+        if _installed:
+            return
+        
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+@contextlib.contextmanager
+def _profiling(name):
+    request = _Request(name)
+    token = _current_request.set(request)
+    try:
+        yield request
+    finally:
+        _current_request.reset(token)
+        _finish_request(request)
+
+def profile_request(name):
+    """
+    Kod bloğunu tek bir istek olarak profiller
+    
+    Blok içindeki sorgular sayılır; istek bittiğinde özet QUERY_PROFILE_LOG
+    dosyasına yazılır ve aynı SELECT sorgusu QUERY_N_PLUS_ONE_THRESHOLD kez
+    veya daha fazla tekrarlandıysa olası N+1 olarak işaretlenir. Profilleyici
+    kapalıysa hiçbir şey yapmayan bağlam döndürülür.
+    
+    Args:
+        name: İstek adı (örn. 'page.courses')
+    
+    Örnek:
+        with profile_request("page.courses"):
+            module.show()
+    """
+    if not _installed:
+        return contextlib.nullcontext()
+    return _profiling(name)
+
+def get_slow_queries():
+    """
+    Bu işlemde yakalanan son yavaş sorguları döndürür
+    
+    Returns:
+        Yeniden eskiye yavaş sorgu kayıtları listesi
+    """
+    return list(reversed(_slow_queries))
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    request = _current_request.get()
+    
+    if request is not None:
+        normalized = normalize_statement(statement)
+        stats = request.queries.get(normalized)
+        if stats is None:
+            stats = request.queries[normalized] = [0, 0.0, 0.0]
+        
+        stats[0] += 1
+        stats[1] += duration_ms
+        stats[2] = max(stats[2], duration_ms)
+        request.statements += 1
+        request.duration_ms += duration_ms
+    
+    if duration_ms >= config.SLOW_QUERY_MS:
+        _record_slow_query(conn, statement, parameters, executemany, duration_ms, request)
+
+def _record_slow_query(conn, statement, parameters, executemany, duration_ms, request):
+    """Yavaş sorguyu parametreleri ve (SQLite'ta) sorgu planıyla kaydeder"""
+    entry = {
+        "type": "slow_query",
+        "at": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+        "request": request.name if request else None,
+        "sql": normalize_statement(statement),
+        "params": _truncate(repr(parameters)),
+        "executemany": executemany,
+        "duration_ms": round(duration_ms, 2),
+        "plan": None if executemany else _explain(conn, statement, parameters)
+    }
+    _slow_queries.append(entry)
+    _write_log(entry)
+    
+    log_event(
+        logger, logging.WARNING, "Yavaş sorgu",
+        request=entry["request"],
+        duration_ms=entry["duration_ms"],
+        sql=_truncate(entry["sql"], 200)
+    )
+
+def _explain(conn, statement, parameters):
+    """
+    Sorgunun planını döndürür (yalnızca SQLite)
+    
+    Plan aynı bağlantıda ayrı bir imleçle alınır; sorgu tekrar çalıştırılmaz.
+    Plan alınamazsa None döner.
+    """
+    if conn.dialect.name != "sqlite" or not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+        return None
+    
+    try:
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception:
+        return None
+
+def _finish_request(request):
+    """İstek özetini yazar, olası N+1 sorgularını işaretler"""
+    if not request.statements:
+        return
+    
+    n_plus_one = [
+        {"sql": sql, "count": stats[0]}
+        for sql, stats in request.queries.items()
+        if stats[0] >= config.QUERY_N_PLUS_ONE_THRESHOLD and sql.upper().startswith("SELECT")
+    ]
+    
+    for suspect in n_plus_one:
+        log_event(
+            logger, logging.WARNING, "Olası N+1 sorgu",
+            request=request.name,
+            count=suspect["count"],
+            sql=_truncate(suspect["sql"], 200)
+        )
+    
+    log_event(
+        logger, logging.DEBUG, "İstek sorguları",
+        sample=True,
+        request=request.name,
+        statements=request.statements,
+        duration_ms=round(request.duration_ms, 1)
+    )
+    
+    _write_log({
+        "type": "request",
+        "at": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+        "request": request.name,
+        "statements": request.statements,
+        "duration_ms": round(request.duration_ms, 2),
+        "queries": [
+            {"sql": sql, "count": stats[0], "total_ms": round(stats[1], 2), "max_ms": round(stats[2], 2)}
+            for sql, stats in request.queries.items()
+        ],
+        "n_plus_one": n_plus_one
+    })
+
+def _write_log(entry):
+    """Kaydı QUERY_PROFILE_LOG dosyasına JSON satırı olarak ekler"""
+    if not config.QUERY_PROFILE_LOG:
+        return
+    
+    try:
+        with _log_lock, open(config.QUERY_PROFILE_LOG, "a", encoding="utf-8") as log_file:
+            log_file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        log_event(logger, logging.ERROR, "Sorgu profili yazılamadı", path=config.QUERY_PROFILE_LOG, error=str(e))
+
+def _truncate(text, limit=500):
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def read_profile_log(path):
+    """
+    Sorgu profili dosyasını okur
+    
+    Args:
+        path: QUERY_PROFILE_LOG dosyası
+    
+    Returns:
+        Kayıt listesi (bozuk satırlar atlanır)
+    """
+    entries = []
+    with open(path, encoding="utf-8") as log_file:
+        for line in log_file:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
+def summarize(entries, top=10):
+    """
+    Profil kayıtlarından en maliyetli sorguları özetler
+    
+    Args:
+        entries: read_profile_log() kayıtları
+        top: Her listede gösterilecek kayıt sayısı
+    
+    Returns:
+        {requests, statements, by_total_time, by_count, heaviest_requests,
+        n_plus_one, slow_queries} sözlüğü
+    """
+    requests = [entry for entry in entries if entry.get("type") == "request"]
+    slow_queries = [entry for entry in entries if entry.get("type") == "slow_query"]
+    
+    statements = {}
+    for request in requests:
+        for query in request["queries"]:
+            stats = statements.setdefault(query["sql"], {"sql": query["sql"], "count": 0, "total_ms": 0.0, "max_ms": 0.0, "requests": set()})
+            stats["count"] += query["count"]
+            stats["total_ms"] += query["total_ms"]
+            stats["max_ms"] = max(stats["max_ms"], query["max_ms"])
+            stats["requests"].add(request["request"])
+    
+    for stats in statements.values():
+        stats["total_ms"] = round(stats["total_ms"], 2)
+        stats["avg_ms"] = round(stats["total_ms"] / stats["count"], 3)
+        stats["requests"] = sorted(stats["requests"])
+    
+    per_request = {}
+    for request in requests:
+        stats = per_request.setdefault(request["request"], {"request": request["request"], "runs": 0, "statements": 0, "max_statements": 0, "duration_ms": 0.0})
+        stats["runs"] += 1
+        stats["statements"] += request["statements"]
+        stats["max_statements"] = max(stats["max_statements"], request["statements"])
+        stats["duration_ms"] += request["duration_ms"]
+    
+    for stats in per_request.values():
+        stats["avg_statements"] = round(stats["statements"] / stats["runs"], 1)
+        stats["avg_duration_ms"] = round(stats["duration_ms"] / stats["runs"], 2)
+    
+    n_plus_one = {}
+    for request in requests:
+        for suspect in request.get("n_plus_one", []):
+            key = (request["request"], suspect["sql"])
+            stats = n_plus_one.setdefault(key, {"request": request["request"], "sql": suspect["sql"], "occurrences": 0, "max_count": 0})
+            stats["occurrences"] += 1
+            stats["max_count"] = max(stats["max_count"], suspect["count"])
+    
+    return {
+        "requests": len(requests),
+        "statements": sum(request["statements"] for request in requests),
+        "by_total_time": sorted(statements.values(), key=lambda stats: stats["total_ms"], reverse=True)[:top],
+        "by_count": sorted(statements.values(), key=lambda stats: stats["count"], reverse=True)[:top],
+        "heaviest_requests": sorted(per_request.values(), key=lambda stats: stats["avg_statements"], reverse=True)[:top],
+        "n_plus_one": sorted(n_plus_one.values(), key=lambda stats: stats["max_count"], reverse=True)[:top],
+        "slow_queries": sorted(slow_queries, key=lambda entry: entry["duration_ms"], reverse=True)[:top]
+    }
@@ -0,0 +1,67 @@
+import streamlit as st
+import pandas as pd
+import config
+from utils.metrics import get_metrics, reset_metrics
+from db.profiler import get_slow_queries
+
+def show():
+    """Servis ve sayfa sürelerini gösterir (sadece admin)"""
+    
+    st.title("📈 Performans")
+    
+    if not config.METRICS_ENABLED:
+        st.info("Performans ölçümü kapalı. Açmak için METRICS_ENABLED ayarını 'true' yapın.")
+        return
+    
+    st.caption(
+        f"Süreler bu uygulama işlemi başladığından beri ölçülür; yüzdelikler işlem başına "
+        f"son {config.METRICS_WINDOW} ölçümden hesaplanır. Liste toplam süreye göre sıralıdır."
+    )
+    
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        search = st.text_input("İşlem ara", placeholder="örn. CourseService veya page.")
+    with col2:
+        st.write("")
+        if st.button("🔄 Yenile", use_container_width=True):
+            st.rerun()
+    with col3:
+        st.write("")
+        if st.button("🗑️ Sıfırla", use_container_width=True):
+            reset_metrics()
+            st.rerun()
+    
+    metrics = get_metrics()
+    if search:
+        metrics = [metric for metric in metrics if search.lower() in metric["name"].lower()]
+    
+    if not metrics:
+        st.info("Henüz ölçüm yok.")
+        return
+    
+    st.dataframe(
+        pd.DataFrame(metrics)[["name", "count", "errors", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "total_ms"]].rename(columns={
+            "name": "İşlem",
+            "count": "Çağrı",
+            "errors": "Hata",
+            "avg_ms": "Ort. (ms)",
+            "p50_ms": "p50 (ms)",
+            "p95_ms": "p95 (ms)",
+            "p99_ms": "p99 (ms)",
+            "max_ms": "En fazla (ms)",
+            "total_ms": "Toplam (ms)"
+        }).round(1),
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    # Sorgu profilleyicisi açıksa (QUERY_PROFILER_ENABLED) yakalanan yavaş sorgular
+    slow_queries = get_slow_queries()
+    if slow_queries:
+        with st.expander(f"🐢 Son yavaş sorgular ({len(slow_queries)}, >= {config.SLOW_QUERY_MS:g} ms)"):
+            for entry in slow_queries:
+                st.write(f"**{entry['duration_ms']} ms** · {entry['request'] or '-'} · {entry['at']}")
+                st.code(entry["sql"], language="sql")
+                st.caption(f"Parametreler: {entry['params']}")
+                if entry["plan"]:
+                    st.caption("Plan: " + " → ".join(entry["plan"]))
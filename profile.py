@@ -1,8 +1,6 @@
 import streamlit as st
-from utils.auth_helpers import auth_required
 from services.auth_service import AuthService
 
-@auth_required
 def show():
     """Kullanıcı profil sayfasını gösterir"""
     
@@ -15,9 +13,6 @@ def show():
     
     st.title("👤 Profil")
     
-    # Kullanıcı bilgileri
-    st.sidebar.success(f"Hoş geldiniz, {st.session_state['username']}!")
-    
     # Mevcut kullanıcı bilgilerini al
     user_id = st.session_state.get('user_id')
     user = AuthService.get_user_by_id(user_id)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+HTML -> PDF Türkçe karakter denetimi
+
+Türkçe karakterler içeren örnek sertifikaları HtmlPdfRenderer ile PDF'e
+çevirir, PDF'teki metni geri okur ve karakterlerin kaybolmadığını (■ olarak
+çizilmediğini) denetler. Örnekler uygulamanın varsayılan şablonu gibi
+indirilemeyen Google Fonts ailelerini ve yerleşik font adlarını kullanır.
+Aynı örnekler eğitimin toplu PDF'i gibi tek dosyada birleştirilip birleşik
+PDF'teki metin ve sayfa sayısı da denetlenir.
+
+Önbellek geçici bir klasörde tutulur; mevcut önbellekteki eski PDF'ler
+denetimi etkilemez. Denetimlerden biri başarısız olursa çıkış kodu 1'dir.
+
+Kullanım:
+    python scripts/check_pdf_fonts.py
+"""
+
+import sys
+import os
+import io
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+# .env dosyasını yükle
+load_dotenv()
+
+import config
+
+EXPECTED_TEXT = "ŞĞİışğ"
+
+SAMPLES = {
+    "Google Fonts (Montserrat, Playfair Display, Sacramento)": (
+        "<html><head><meta charset='utf-8'>"
+        "<link href='https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700&family=Playfair+Display:wght@700&family=Sacramento&display=swap' rel='stylesheet'>"
+        "<style>body {{ font-family: 'Montserrat', sans-serif; }} h1 {{ font-family: 'Playfair Display', serif; }} "
+        ".imza {{ font-family: 'Sacramento', cursive; }}</style></head>"
+        "<body><h1>BAŞARI SERTİFİKASI {text}</h1><p>Ayşe Çağlar {text}</p><p class='imza'>İsmail Şahin {text}</p></body></html>"
+    ),
+    "Yerleşik fontlar (Helvetica, Times, Courier)": (
+        "<html><body><p style='font-family: Helvetica'>{text}</p><p style='font-family: Times'><b>{text}</b></p>"
+        "<p style='font-family: Courier'>{text}</p></body></html>"
+    )
+}
+
+def extract_text(pdf_bytes):
+    """PDF'in tüm sayfalarındaki metni döndürür"""
+    from pypdf import PdfReader
+    
+    return "\n".join(page.extract_text() for page in PdfReader(io.BytesIO(pdf_bytes)).pages)
+
+def check_sample(html_content):
+    """
+    Örneği PDF'e çevirip metni denetler
+    
+    Returns:
+        Hata açıklamaları (boşsa başarılı)
+    """
+    from utils.html_pdf_renderer import HtmlPdfRenderer
+    
+    text = extract_text(HtmlPdfRenderer.render(html_content))
+    failures = []
+    if "■" in text:
+        failures.append("fontta olmayan karakterler ■ olarak çizildi")
+    expected_count = html_content.count(EXPECTED_TEXT)
+    if text.count(EXPECTED_TEXT) < expected_count:
+        failures.append(f"'{EXPECTED_TEXT}' {expected_count} yerine {text.count(EXPECTED_TEXT)} kez okundu")
+    return failures
+
+def check_course_pdf(template, student_count=5):
+    """
+    Örneği FileService ile birkaç öğrencilik toplu PDF'e çevirip denetler
+    
+    Returns:
+        Hata açıklamaları (boşsa başarılı)
+    """
+    from pypdf import PdfReader
+    from services.file_service import FileService
+    
+    # Her sayfa farklı olsun diye öğrenci adı alanı eklenir
+    template = template.replace("</body>", "<p>{{ad_soyad}}</p></body>")
+    output = io.BytesIO()
+    replacements_iter = ({"{{ad_soyad}}": f"Öğrenci {i}"} for i in range(student_count))
+    page_count = FileService()._generate_course_html_pdf(template.encode("utf-8"), replacements_iter, output)
+    
+    failures = []
+    reader = PdfReader(io.BytesIO(output.getvalue()))
+    if page_count != len(reader.pages) or len(reader.pages) < student_count:
+        failures.append(f"{student_count} öğrenci için {len(reader.pages)} sayfa okundu (dönen: {page_count})")
+    text = extract_text(output.getvalue())
+    if "■" in text:
+        failures.append("birleşik PDF'te karakterler ■ olarak çizildi")
+    expected_count = template.count(EXPECTED_TEXT) * student_count
+    if text.count(EXPECTED_TEXT) < expected_count:
+        failures.append(f"birleşik PDF'te '{EXPECTED_TEXT}' {expected_count} yerine {text.count(EXPECTED_TEXT)} kez okundu")
+    missing = [i for i in range(student_count) if f"Öğrenci {i}" not in text]
+    if missing:
+        failures.append(f"birleşik PDF'te {len(missing)} öğrencinin adı bulunamadı")
+    return failures
+
+def main():
+    from utils.html_pdf_renderer import HtmlPdfRenderer
+    
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        config.STORAGE_PATH = workdir
+        try:
+            for name, template in SAMPLES.items():
+                html_content = template.format(text=EXPECTED_TEXT)
+                failures = check_sample(html_content) + check_course_pdf(html_content)
+                if failures:
+                    failed = True
+                    print(f"❌ {name}: {'; '.join(failures)}")
+                else:
+                    print(f"✅ {name}")
+        finally:
+            HtmlPdfRenderer.shutdown()
+    
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+SQLite eşzamanlılık denetimi
+
+Geçici bir veritabanında aynı anda çalışan yazıcı ve okuyucu thread'leriyle
+SQLite ayarlarını (db/database.py, SQLITE_* ayarları) dener. Yazıcılar
+içe aktarma ve "tamamlandı" işaretleme gibi kısa işlemler yapar,
+okuyucular bir eğitimin öğrenci listesini okur.
+
+Denetlenenler:
+  - Bağlantılarda WAL, busy_timeout, synchronous ve foreign_keys etkin mi
+  - Hiçbir yazma "database is locked" hatası almadan tamamlanıyor mu
+  - Okumalar yazmalar yüzünden beklemiyor mu (okuma p99 < --max-read-ms)
+
+--compare ile aynı yük eski ayarlarla (rollback günlüğü, synchronous=FULL)
+de çalıştırılıp sonuçlar yan yana yazdırılır. Denetimlerden biri başarısız
+olursa çıkış kodu 1'dir.
+
+Kullanım:
+    python scripts/check_sqlite_concurrency.py
+    python scripts/check_sqlite_concurrency.py --writers 8 --readers 8 --duration 10 --compare
+"""
+
+import sys
+import os
+import json
+import math
+import time
+import tempfile
+import argparse
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+# .env dosyasını yükle
+load_dotenv()
+
+import config
+
+# --compare ile denenen eski (varsayılan SQLite) ayarlar
+LEGACY_SETTINGS = {
+    "SQLITE_WAL": False,
+    "SQLITE_SYNCHRONOUS": "FULL",
+    "SQLITE_CACHE_SIZE_KB": 2000,
+    "SQLITE_MMAP_SIZE_MB": 0
+}
+
+def percentile(values, p):
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik"""
+    if not values:
+        return 0.0
+    return values[max(0, min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1))]
+
+def seed(students):
+    """
+    Test eğitimini ve öğrencilerini ekler
+    
+    Returns:
+        Eğitim ID'si
+    """
+    import datetime
+    from sqlalchemy import insert
+    from db.database import init_db, get_session
+    from db.models import Course, Student
+    
+    init_db()
+    session = get_session()
+    try:
+        course = Course(
+            name="Eşzamanlılık denetimi",
+            start_date=datetime.datetime(2025, 1, 6),
+            end_date=datetime.datetime(2025, 1, 10)
+        )
+        session.add(course)
+        session.flush()
+        session.execute(insert(Student), [
+            {
+                "first_name": f"Öğrenci{i + 1}",
+                "last_name": "Denetim",
+                "email": f"denetim{i + 1}@example.com",
+                "course_id": course.id
+            }
+            for i in range(students)
+        ])
+        session.commit()
+        return course.id
+    finally:
+        session.close()
+
+def read_pragmas():
+    """Havuzdan alınan bir bağlantının PRAGMA değerlerini döndürür"""
+    from sqlalchemy import text
+    from db.database import get_engine
+    
+    with get_engine().connect() as connection:
+        return {
+            name: connection.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "foreign_keys")
+        }
+
+def writer(course_id, index, deadline, stats):
+    """Öğrenci ekleyip tamamlandı olarak işaretleyen kısa işlemler"""
+    from sqlalchemy import update
+    from sqlalchemy.exc import OperationalError
+    from db.database import get_session
+    from db.models import Student
+    
+    counter = 0
+    while time.monotonic() < deadline:
+        counter += 1
+        session = get_session()
+        start = time.perf_counter()
+        try:
+            # İçe aktarma benzeri ekleme ve toplu işaretleme aynı işlemde
+            session.add(Student(
+                first_name=f"Yazıcı{index}",
+                last_name=str(counter),
+                email=f"yazici{index}_{counter}@example.com",
+                course_id=course_id
+            ))
+            session.execute(
+                update(Student)
+                .where(Student.course_id == course_id, Student.id % 50 == counter % 50)
+                .values(has_completed_course=counter % 2 == 0)
+            )
+            session.commit()
+            stats.record("write", (time.perf_counter() - start) * 1000)
+        except OperationalError as e:
+            session.rollback()
+            stats.error("write", str(e.orig))
+        finally:
+            session.close()
+
+def reader(course_id, deadline, stats):
+    """Eğitimin öğrenci listesini okur"""
+    from sqlalchemy.exc import OperationalError
+    from db.database import get_session
+    from db.models import Student
+    
+    while time.monotonic() < deadline:
+        session = get_session()
+        start = time.perf_counter()
+        try:
+            session.query(Student).filter(Student.course_id == course_id).all()
+            stats.record("read", (time.perf_counter() - start) * 1000)
+        except OperationalError as e:
+            stats.error("read", str(e.orig))
+        finally:
+            session.close()
+
+class Stats:
+    """Thread'ler arasında paylaşılan süre ve hata kayıtları"""
+    
+    def __init__(self):
+        self.durations = {"write": [], "read": []}
+        self.errors = {"write": [], "read": []}
+        self._lock = threading.Lock()
+    
+    def record(self, kind, duration_ms):
+        with self._lock:
+            self.durations[kind].append(duration_ms)
+    
+    def error(self, kind, message):
+        with self._lock:
+            self.errors[kind].append(message)
+    
+    def summary(self, elapsed):
+        result = {}
+        for kind, durations in self.durations.items():
+            values = sorted(durations)
+            result[kind] = {
+                "ops": len(values),
+                "ops_per_s": round(len(values) / elapsed, 1),
+                "errors": len(self.errors[kind]),
+                "locked_errors": sum("locked" in message for message in self.errors[kind]),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "max_ms": round(values[-1], 2) if values else 0.0
+            }
+        return result
+
+def run(name, workdir, settings, args):
+    """
+    Ayarları uygulayıp yükü geçici bir veritabanında çalıştırır
+    
+    Her çalıştırma ayrı dosya kullanır; get_engine() DATABASE_URL başına
+    motor tuttuğu için yeni ayarlar yeni bağlantılara uygulanır.
+    """
+    for key, value in settings.items():
+        setattr(config, key, value)
+    config.DATABASE_URL = f"sqlite:///{os.path.join(workdir, name + '.db')}"
+    
+    course_id = seed(args.students)
+    pragmas = read_pragmas()
+    
+    stats = Stats()
+    deadline = time.monotonic() + args.duration
+    threads = [threading.Thread(target=writer, args=(course_id, i, deadline, stats)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(course_id, deadline, stats)) for _ in range(args.readers)]
+    
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    return {"name": name, "pragmas": pragmas, **stats.summary(time.monotonic() - start)}
+
+def check(result, max_read_ms):
+    """Ayarlı çalıştırmanın denetimleri; başarısız olanların listesi"""
+    failures = []
+    pragmas = result["pragmas"]
+    
+    if config.SQLITE_WAL and str(pragmas["journal_mode"]).lower() != "wal":
+        failures.append(f"journal_mode WAL değil: {pragmas['journal_mode']}")
+    if pragmas["busy_timeout"] != config.SQLITE_BUSY_TIMEOUT_MS:
+        failures.append(f"busy_timeout {pragmas['busy_timeout']} (beklenen {config.SQLITE_BUSY_TIMEOUT_MS})")
+    if bool(pragmas["foreign_keys"]) != config.SQLITE_FOREIGN_KEYS:
+        failures.append(f"foreign_keys {pragmas['foreign_keys']}")
+    for kind in ("write", "read"):
+        if result[kind]["errors"]:
+            failures.append(f"{result[kind]['errors']} {kind} hatası ({result[kind]['locked_errors']} 'database is locked')")
+    if result["read"]["p99_ms"] > max_read_ms:
+        failures.append(f"okuma p99 {result['read']['p99_ms']} ms > {max_read_ms:g} ms")
+    
+    return failures
+
+def print_result(result):
+    pragmas = result["pragmas"]
+    print(f"\n⚙️  {result['name']}: journal_mode={pragmas['journal_mode']} synchronous={pragmas['synchronous']} "
+          f"busy_timeout={pragmas['busy_timeout']} cache_size={pragmas['cache_size']} "
+          f"mmap_size={pragmas['mmap_size']} foreign_keys={pragmas['foreign_keys']}")
+    for kind, label in (("write", "Yazma"), ("read", "Okuma")):
+        stats = result[kind]
+        print(f"  {label:<6} {stats['ops']:>7} işlem  {stats['ops_per_s']:>8.1f}/sn  p50 {stats['p50_ms']:>7.2f} ms  "
+              f"p99 {stats['p99_ms']:>8.2f} ms  en fazla {stats['max_ms']:>8.2f} ms  hata {stats['errors']} (kilit {stats['locked_errors']})")
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite ayarlarını eşzamanlı yazıcı ve okuyucularla denetler")
+    parser.add_argument("--writers", type=int, default=4, help="Yazıcı thread sayısı")
+    parser.add_argument("--readers", type=int, default=4, help="Okuyucu thread sayısı")
+    parser.add_argument("--students", type=int, default=2000, help="Okunan eğitimdeki öğrenci sayısı")
+    parser.add_argument("--duration", type=float, default=5, help="Çalışma süresi (sn)")
+    parser.add_argument("--max-read-ms", type=float, default=500, help="Kabul edilen en yüksek okuma p99 süresi (ms)")
+    parser.add_argument("--compare", action="store_true", help="Aynı yükü eski ayarlarla da çalıştır")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        tuned_settings = {key: getattr(config, key) for key in LEGACY_SETTINGS}
+        results = []
+        if args.compare:
+            results.append(run("eski", workdir, LEGACY_SETTINGS, args))
+        tuned = run("ayarlı", workdir, tuned_settings, args)
+        results.append(tuned)
+    
+    failures = check(tuned, args.max_read_ms)
+    
+    if args.json:
+        print(json.dumps({"results": results, "failures": failures}, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔀 {args.writers} yazıcı ve {args.readers} okuyucu, {args.duration:g} sn")
+        for result in results:
+            print_result(result)
+        
+        if failures:
+            print("\n❌ Denetim başarısız:")
+            for failure in failures:
+                print(f"  - {failure}")
+        else:
+            print("\n✅ Kilit hatası yok, okumalar yazmaları beklemedi")
+    
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
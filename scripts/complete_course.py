@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Eğitim tamamlama (toplu sertifika oluşturma ve e-posta gönderimi) scripti
+
+İş kalıcıdır: script yarıda kesilirse aynı komut tekrar çalıştırıldığında
+kaldığı yerden devam eder; sertifikalar yeniden üretilmez, e-postalar
+tekrar gönderilmez.
+
+Kullanım:
+    python scripts/complete_course.py <eğitim_id>
+    python scripts/complete_course.py <eğitim_id> --retry-failed
+    python scripts/complete_course.py --job <iş_id>
+    python scripts/complete_course.py --status <iş_id>
+"""
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+from db.database import init_db
+from services.job_service import JobService
+
+# .env dosyasını yükle
+load_dotenv()
+
+def print_job(job):
+    """İşin durumunu yazdırır"""
+    counts = job["counts"]
+    print(f"📋 İş #{job['id']} ({job['kind']}) - durum: {job['status']}")
+    print(f"   Toplam öğrenci: {job['total']}")
+    for state in ["pending", "rendered", "sending", "emailed", "skipped", "failed"]:
+        print(f"   {state:<9}: {counts.get(state, 0)}")
+    if job["error"]:
+        print(f"   Hata: {job['error']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Eğitimi tamamlar, sertifikaları oluşturur ve e-postaları gönderir")
+    parser.add_argument("course_id", type=int, nargs="?", help="Eğitim ID'si")
+    parser.add_argument("--job", type=int, help="Belirli bir işi devam ettir")
+    parser.add_argument("--status", type=int, metavar="JOB_ID", help="İşin durumunu göster ve çık")
+    parser.add_argument("--retry-failed", action="store_true", help="Başarısız adımları yeniden dene")
+    parser.add_argument("--chunk-size", type=int, help="Her ara kayıtta işlenecek öğrenci sayısı")
+    args = parser.parse_args()
+    
+    # Veritabanını başlat
+    init_db()
+    
+    if args.status:
+        job = JobService.get_job(args.status)
+        if not job:
+            print(f"❌ İş bulunamadı: #{args.status}")
+            sys.exit(1)
+        print_job(job)
+        return
+    
+    job_id = args.job
+    if not job_id:
+        if not args.course_id:
+            parser.error("Eğitim ID'si veya --job gerekli")
+        job_id = JobService.create_completion_job(args.course_id)
+        if not job_id:
+            print(f"❌ Eğitim bulunamadı veya iş oluşturulamadı: #{args.course_id}")
+            sys.exit(1)
+    
+    print(f"🚀 İş #{job_id} çalıştırılıyor...")
+    job = JobService.run_job(job_id, chunk_size=args.chunk_size, retry_failed=args.retry_failed)
+    
+    if not job:
+        print("⚠️  İş başka bir süreç tarafından yürütülüyor; daha sonra tekrar deneyin.")
+        sys.exit(2)
+    
+    print_job(job)
+    if job["status"] != "completed":
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Sentetik veri üretme scripti
+
+Yük testi ve kapasite ölçümü için ayarlı veritabanına gerçekçi ölçekte
+eğitim, öğrenci (Türkçe ad ve soyadlarla), kullanıcı ve sertifika şablonu
+ekler. Kayıtlar toplu INSERT ile parça parça yazılır; tüm kullanıcılar
+aynı şifreyi paylaşır ve bcrypt özeti bir kez hesaplanır.
+
+Mevcut kayıtlar silinmez; --reset ile veritabanı önce sıfırlanır. Aynı
+--seed ile aynı veri üretilir.
+
+Kullanım:
+    python scripts/generate_data.py
+    python scripts/generate_data.py --courses 500 --students 200 --users 50
+    python scripts/generate_data.py --reset --seed 7 --templates 0.8
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+# .env dosyasını yükle
+load_dotenv()
+
+import config
+
+FIRST_NAMES = [
+    "Ahmet", "Mehmet", "Mustafa", "Ali", "Hüseyin", "Hasan", "İbrahim", "Murat", "Ömer", "Emre",
+    "Burak", "Can", "Cem", "Deniz", "Eren", "Furkan", "Gökhan", "Kaan", "Kerem", "Oğuz",
+    "Serkan", "Tolga", "Uğur", "Yusuf", "Barış", "Çağlar", "Şükrü", "Özgür", "İlker", "Onur",
+    "Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Merve", "Büşra", "Esra", "Özlem",
+    "Şeyma", "Gizem", "Ebru", "Derya", "Selin", "Ece", "İrem", "Gül", "Sibel", "Tuğba",
+    "Nur", "Cansu", "Dilara", "Aslı", "Pınar", "Sevgi", "Yağmur", "Çiğdem", "Başak", "Melike"
+]
+
+LAST_NAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+    "Polat", "Korkmaz", "Karataş", "Güneş", "Erdoğan", "Akın", "Tekin", "Aksoy", "Bulut", "Güler",
+    "Uçar", "Taş", "Keskin", "Ünal", "Çakır", "Eren", "Acar", "Işık", "Başaran", "Sarı"
+]
+
+COURSE_TOPICS = [
+    "Python ile Veri Analizi", "İleri Excel", "Proje Yönetimi", "İş Sağlığı ve Güvenliği",
+    "Temel Muhasebe", "Dijital Pazarlama", "Liderlik ve Takım Yönetimi", "SQL ile Raporlama",
+    "Etkili İletişim", "Kalite Yönetim Sistemleri", "Siber Güvenliğe Giriş", "Makine Öğrenmesi",
+    "Web Programlama", "Girişimcilik", "İnsan Kaynakları Yönetimi", "Bulut Bilişim"
+]
+
+EMAIL_DOMAINS = ["example.com", "example.org", "example.net"]
+
+TEMPLATE_HTML = (
+    "<html><head><meta charset='utf-8'></head><body style='text-align:center;font-family:sans-serif'>"
+    "<h1>SERTİFİKA</h1><h2>{{ogrenci_adi}}</h2><p>{{kurs_adi}} · {{egitmen_adi}}</p>"
+    "<p>{{tarih}} · {{sertifika_no}} · {{dogrulama_kodu}}</p><img src='{{qr_kodu}}' width='120'>"
+    "</body></html>"
+)
+
+def chunks(rows, size):
+    """Listeyi size uzunluğunda parçalara böler"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def make_email(first_name, last_name, suffix, rng):
+    """Ad ve soyaddan Türkçe karaktersiz e-posta adresi üretir"""
+    from slugify import slugify
+    
+    local = slugify(f"{first_name} {last_name}", separator=".")
+    return f"{local}.{suffix}@{rng.choice(EMAIL_DOMAINS)}"
+
+def insert_rows(session, model, rows, batch_size):
+    """Kayıtları batch_size'lık toplu INSERT'lerle ekler"""
+    from sqlalchemy import insert
+    
+    for batch in chunks(rows, batch_size):
+        session.execute(insert(model), batch)
+
+def generate_users(session, count, password, batch_size, rng):
+    """
+    Kullanıcıları ekler (yaklaşık onda biri admin)
+    
+    Returns:
+        Eklenen kullanıcı sayısı
+    """
+    from sqlalchemy import select
+    from db.models import User
+    from services.auth_service import AuthService
+    
+    # Aynı e-posta tekrar üretilirse benzersizlik kısıtına takılmasın
+    existing = set(session.execute(select(User.email)).scalars())
+    password_hash = AuthService.hash_password(password)
+    
+    rows = []
+    for i in range(count):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        email = make_email(first_name, last_name, f"u{i + 1}", rng)
+        if email in existing:
+            continue
+        
+        rows.append({
+            "username": f"{first_name} {last_name}",
+            "email": email,
+            "password_hash": password_hash,
+            "role": "admin" if rng.random() < 0.1 else "user"
+        })
+    
+    insert_rows(session, User, rows, batch_size)
+    return len(rows)
+
+def generate_courses(session, count, students, completed_ratio, template_ratio, batch_size, rng):
+    """
+    Eğitimleri, öğrencilerini ve şablonlarını ekler
+    
+    Öğrenci sayısı eğitim başına students değerinin yarısı ile 1,5 katı
+    arasında değişir.
+    
+    Returns:
+        (eklenen eğitim sayısı, eklenen öğrenci sayısı, şablon sayısı)
+    """
+    from sqlalchemy import insert, update
+    from db.models import Course, Student
+    from services.file_service import FileService
+    
+    file_service = FileService()
+    today = datetime.datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    
+    course_rows = []
+    for i in range(count):
+        start_date = today - datetime.timedelta(days=rng.randint(-60, 720))
+        course_rows.append({
+            "name": f"{rng.choice(COURSE_TOPICS)} {i + 1}",
+            "description": "Yük testi için üretilmiş eğitim",
+            "instructor_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "start_date": start_date,
+            "end_date": start_date + datetime.timedelta(days=rng.randint(1, 30)),
+            "is_completed": rng.random() < completed_ratio
+        })
+    
+    course_ids = []
+    for batch in chunks(course_rows, batch_size):
+        course_ids.extend(session.execute(insert(Course).returning(Course.id, sort_by_parameter_order=True), batch).scalars())
+    
+    student_count = 0
+    pending = []
+    for course_id, course in zip(course_ids, course_rows):
+        for i in range(rng.randint(max(1, students // 2), max(1, students * 3 // 2))):
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            pending.append({
+                "first_name": first_name,
+                "last_name": last_name,
+                # Eğitim içinde benzersiz olması için sıra numarası eklenir
+                "email": make_email(first_name, last_name, f"{course_id}.{i + 1}", rng),
+                "phone_number": f"05{rng.randint(30, 59)}{rng.randint(1000000, 9999999)}" if rng.random() < 0.7 else None,
+                "has_completed_course": course["is_completed"] and rng.random() < 0.9,
+                "course_id": course_id
+            })
+        
+        if len(pending) >= batch_size:
+            insert_rows(session, Student, pending, batch_size)
+            student_count += len(pending)
+            pending = []
+    
+    insert_rows(session, Student, pending, batch_size)
+    student_count += len(pending)
+    
+    templates = 0
+    for course_id in course_ids:
+        if rng.random() >= template_ratio:
+            continue
+        
+        template_url = file_service.save_html_template(TEMPLATE_HTML, course_id)
+        if template_url:
+            session.execute(update(Course).where(Course.id == course_id).values(certificate_template_url=template_url))
+            templates += 1
+    
+    return len(course_ids), student_count, templates
+
+def main():
+    parser = argparse.ArgumentParser(description="Yük testi için sentetik eğitim, öğrenci, kullanıcı ve şablon üretir")
+    parser.add_argument("--courses", type=int, default=200, help="Eğitim sayısı")
+    parser.add_argument("--students", type=int, default=100, help="Eğitim başına ortalama öğrenci sayısı")
+    parser.add_argument("--users", type=int, default=20, help="Kullanıcı sayısı")
+    parser.add_argument("--password", default="sifre123", help="Üretilen kullanıcıların şifresi")
+    parser.add_argument("--templates", type=float, default=0.5, help="HTML şablonu atanacak eğitim oranı (0-1)")
+    parser.add_argument("--completed", type=float, default=0.3, help="Tamamlanmış eğitim oranı (0-1)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Toplu INSERT başına satır sayısı")
+    parser.add_argument("--seed", type=int, default=42, help="Rastgele sayı tohumu")
+    parser.add_argument("--reset", action="store_true", help="Önce veritabanını sıfırla (tüm kayıtlar silinir)")
+    args = parser.parse_args()
+    
+    from sqlalchemy.exc import SQLAlchemyError
+    from db.database import Base, get_engine, get_session
+    from utils.bootstrap import init_app
+    
+    if args.reset:
+        print("🗂️  Veritabanı sıfırlanıyor...")
+        Base.metadata.drop_all(get_engine())
+    
+    init_app(create_admin=True)
+    
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    print(f"🏭 {args.courses} eğitim, eğitim başına ~{args.students} öğrenci ve {args.users} kullanıcı üretiliyor...")
+    
+    session = get_session()
+    try:
+        users = generate_users(session, args.users, args.password, args.batch_size, rng)
+        courses, students, templates = generate_courses(
+            session, args.courses, args.students, args.completed, args.templates, args.batch_size, rng
+        )
+        session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"❌ Veri üretilemedi: {str(e)}")
+        sys.exit(1)
+    finally:
+        session.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"✅ {courses} eğitim, {students} öğrenci, {users} kullanıcı ve {templates} şablon eklendi ({elapsed:.1f} sn)")
+    print(f"🔑 Üretilen kullanıcıların şifresi: {args.password}")
+    print(f"🗄️  Veritabanı: {config.DATABASE_URL}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Uygulama hazırlık scripti (deploy sırasında çalıştırılır)
+
+Veritabanı tablolarını oluşturur, eksik sütunları ekler, depolama
+klasörlerini açar ve admin kullanıcısı yoksa oluşturur. Tekrar
+çalıştırılması güvenlidir. Bu script deploy adımında çalıştırılıyorsa
+uygulama DB_AUTO_INIT=false ile açılışta aynı işleri atlayabilir.
+
+Kullanım:
+    python scripts/init_app.py
+    python scripts/init_app.py --skip-admin
+"""
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+# .env dosyasını yükle
+load_dotenv()
+
+from utils.bootstrap import init_app
+import config
+
+def main():
+    parser = argparse.ArgumentParser(description="Veritabanını, depolama klasörlerini ve admin kullanıcısını hazırlar")
+    parser.add_argument("--skip-admin", action="store_true", help="Admin kullanıcısını kontrol etme")
+    args = parser.parse_args()
+
+    print("🗂️  Uygulama hazırlanıyor...")
+
+    try:
+        init_app(create_admin=not args.skip_admin)
+    except Exception as e:
+        print(f"❌ Hata oluştu: {e}")
+        sys.exit(1)
+
+    print(f"✅ Veritabanı hazır: {config.DATABASE_URL}")
+    if config.STORAGE_TYPE == "local":
+        print(f"✅ Depolama klasörleri hazır: {config.STORAGE_PATH}")
+    print("🎉 Hazırlık tamamlandı!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Streamlit sayfaları için yük testi
+
+Tarayıcı açmadan, her biri ayrı bir Streamlit oturumu olan sanal
+kullanıcılarla uygulamaya yük bindirir. Her sanal kullanıcı tarayıcının
+kullandığı websocket protokolüyle (/_stcore/stream) bağlanır, giriş yapar
+ve kenar çubuğundaki menü düğmelerine basarak sayfalar arasında dolaşır.
+Bir sayfa isteğinin süresi, düğmeye basıldığı andan sayfa scriptinin
+bitmesine kadar geçen süredir (st.rerun ile yapılan yönlendirme dahil).
+
+Eşzamanlı oturum sayısı kademe kademe artırılır; her kademe için saniyedeki
+sayfa sayısı, p50/p95/p99 süreleri ve hatalar raporlanır. Oturum sayısı
+arttığı halde verim belirgin artmıyorsa (--min-gain) veya p95 --slo-ms'i
+aşıyorsa tek Streamlit işlemi doymuş kabul edilir.
+
+--url verilmezse uygulama ayarlı veritabanıyla ayrı bir işlemde başlatılır.
+Gerçekçi sonuç için önce scripts/generate_data.py ile veri üretin.
+
+Kullanım:
+    python scripts/load_test.py
+    python scripts/load_test.py --sessions 1,2,4,8,16,32 --duration 30
+    python scripts/load_test.py --url http://127.0.0.1:8501 --pages courses,students --json
+"""
+
+import sys
+import os
+import json
+import math
+import time
+import asyncio
+import argparse
+import importlib.util
+import itertools
+import subprocess
+import urllib.request
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+# .env dosyasını yükle
+load_dotenv()
+
+import config
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+class LoadTestError(Exception):
+    """Sanal kullanıcılar giriş yapamadı veya sayfalar bulunamadı"""
+
+class VirtualUser:
+    """Tek bir Streamlit oturumunu websocket üzerinden süren sanal kullanıcı"""
+    
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.websocket = None
+        # Widget anahtarı -> Streamlit widget kimliği (son çizimden)
+        self.widgets = {}
+    
+    async def connect(self):
+        import websockets
+        
+        self.websocket = await websockets.connect(
+            self.url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream",
+            subprotocols=["streamlit"],
+            max_size=None
+        )
+    
+    async def close(self):
+        if self.websocket is not None:
+            await self.websocket.close()
+    
+    async def rerun(self, widget_states=()):
+        """
+        Sayfa scriptini verilen widget durumlarıyla yeniden çalıştırır
+        
+        Script st.rerun ile yeniden başlarsa son çalıştırmanın bitmesi beklenir.
+        
+        Args:
+            widget_states: WidgetState listesi (düğme basışı, metin girişi vb.)
+        
+        Returns:
+            Sayfada gösterilen hata (exception) mesajları listesi
+        """
+        return await asyncio.wait_for(self._rerun(widget_states), self.timeout)
+    
+    async def _rerun(self, widget_states):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.widget_states.widgets.extend(widget_states)
+        await self.websocket.send(message.SerializeToString())
+        
+        widgets = {}
+        exceptions = []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof("type")
+            
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    exceptions.append(element.exception.message)
+                    continue
+                
+                widget_id = getattr(getattr(element, element_type), "id", "")
+                if widget_id:
+                    # Kimlik '$$ID-<özet>-<anahtar>' biçimindedir
+                    widgets[widget_id.split("-", 2)[-1]] = widget_id
+            elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                self.widgets = widgets
+                return exceptions
+    
+    async def login(self, email, password):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        
+        await self.rerun()
+        try:
+            states = [
+                WidgetState(id=self.widgets["login_email"], string_value=email),
+                WidgetState(id=self.widgets["login_password"], string_value=password),
+                WidgetState(id=self.widgets["FormSubmitter:login_form-Giriş Yap"], trigger_value=True)
+            ]
+        except KeyError:
+            raise LoadTestError("Giriş formu bulunamadı")
+        
+        await self.rerun(states)
+        if "nav_logout" not in self.widgets:
+            raise LoadTestError(f"Giriş başarısız: {email}")
+    
+    async def open_page(self, page):
+        """
+        Kenar çubuğundaki menü düğmesiyle sayfayı açar
+        
+        Returns:
+            Sayfada gösterilen hata mesajları listesi
+        """
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        
+        widget_id = self.widgets[f"nav_{page}"]
+        return await self.rerun([WidgetState(id=widget_id, trigger_value=True)])
+
+def percentile(values, p):
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1))
+    return values[index]
+
+def summarize_latencies(latencies):
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "avg_ms": round(sum(values) / len(values), 1) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 1),
+        "p95_ms": round(percentile(values, 95), 1),
+        "p99_ms": round(percentile(values, 99), 1),
+        "max_ms": round(values[-1], 1) if values else 0.0
+    }
+
+async def run_user(user, pages, deadline, think_time, offset, samples, errors):
+    """Sanal kullanıcının süre dolana kadar sayfaları dolaşması"""
+    # Kullanıcılar aynı sayfadan başlamasın
+    for page in itertools.islice(itertools.cycle(pages), offset, None):
+        if time.monotonic() >= deadline:
+            return
+        
+        start = time.perf_counter()
+        try:
+            exceptions = await user.open_page(page)
+        except Exception as e:
+            # Zaman aşımı veya kopan bağlantı; kullanıcı devam etmez
+            errors.append(f"{page}: {type(e).__name__}: {str(e)}")
+            return
+        
+        duration_ms = (time.perf_counter() - start) * 1000
+        if exceptions:
+            errors.extend(f"{page}: {message}" for message in exceptions)
+        else:
+            samples.append((page, duration_ms))
+        
+        if think_time:
+            await asyncio.sleep(think_time)
+
+async def run_level(args, sessions):
+    """
+    Bir kademeyi çalıştırır: sessions kadar kullanıcı giriş yapar, ardından
+    --duration saniye boyunca sayfaları dolaşır
+    
+    Returns:
+        Kademe sonuç sözlüğü
+    """
+    users = [VirtualUser(args.url, args.timeout) for _ in range(sessions)]
+    samples = []
+    errors = []
+    
+    try:
+        # Giriş ve ilk çizim ölçüme dahil değildir
+        for user in users:
+            await user.connect()
+        await asyncio.gather(*(user.login(args.email, args.password) for user in users))
+        
+        missing = [page for page in args.pages if f"nav_{page}" not in users[0].widgets]
+        if missing:
+            raise LoadTestError(f"Menüde olmayan sayfalar: {', '.join(missing)}")
+        
+        started = time.monotonic()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            run_user(user, args.pages, deadline, args.think_ms / 1000, index, samples, errors)
+            for index, user in enumerate(users)
+        ))
+        elapsed = time.monotonic() - started
+    finally:
+        await asyncio.gather(*(user.close() for user in users), return_exceptions=True)
+    
+    result = {
+        "sessions": sessions,
+        "duration_s": round(elapsed, 2),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "errors": len(errors),
+        **summarize_latencies([duration_ms for _, duration_ms in samples]),
+        "pages": {
+            page: summarize_latencies([duration_ms for name, duration_ms in samples if name == page])
+            for page in args.pages
+        },
+        "error_samples": errors[:5]
+    }
+    return result
+
+def find_saturation(levels, min_gain, slo_ms):
+    """
+    Tek işlemin doyduğu kademeyi bulur
+    
+    Returns:
+        {sessions, reason} (doyma görülmediyse sessions None)
+    """
+    for previous, level in zip([None] + levels[:-1], levels):
+        if level["p95_ms"] > slo_ms:
+            return {"sessions": level["sessions"], "reason": f"p95 {level['p95_ms']} ms > {slo_ms:g} ms"}
+        if level["errors"]:
+            return {"sessions": level["sessions"], "reason": f"{level['errors']} hata"}
+        if previous and previous["throughput_rps"] and level["throughput_rps"] < previous["throughput_rps"] * (1 + min_gain):
+            gain = level["throughput_rps"] / previous["throughput_rps"] - 1
+            return {"sessions": level["sessions"], "reason": f"verim artışı %{gain * 100:.0f} < %{min_gain * 100:.0f}"}
+    return {"sessions": None, "reason": "denenen kademelerde doyma görülmedi"}
+
+def start_server(port):
+    """Uygulamayı ayrı bir işlemde başlatır ve hazır olmasını bekler"""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--browser.gatherUsageStats", "false"
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Uygulama başlatılamadı (çıkış kodu {process.returncode})")
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process, url
+        except OSError:
+            time.sleep(0.5)
+    
+    process.terminate()
+    raise RuntimeError("Uygulama 60 saniye içinde hazır olmadı")
+
+def print_report(levels, saturation):
+    """Sonuçları okunabilir biçimde yazdırır"""
+    print(f"\n{'Oturum':>7} {'Sayfa/sn':>9} {'İstek':>7} {'Hata':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'En fazla':>9}")
+    for level in levels:
+        print(
+            f"{level['sessions']:>7} {level['throughput_rps']:>9.2f} {level['requests']:>7} {level['errors']:>5} "
+            f"{level['p50_ms']:>8.1f} {level['p95_ms']:>8.1f} {level['p99_ms']:>8.1f} {level['max_ms']:>9.1f}"
+        )
+    
+    last = levels[-1]
+    print(f"\n📄 Sayfa bazında ({last['sessions']} oturum):")
+    for page, stats in last["pages"].items():
+        print(f"  {page:<15} {stats['requests']:>6} istek  p50 {stats['p50_ms']:>8.1f} ms  p95 {stats['p95_ms']:>8.1f} ms")
+    
+    for level in levels:
+        for error in level["error_samples"]:
+            print(f"⚠️  {level['sessions']} oturum: {error}")
+    
+    if saturation["sessions"] is None:
+        print(f"\n✅ {saturation['reason']} (en fazla {last['sessions']} oturum)")
+    else:
+        print(f"\n🔥 Tek Streamlit işlemi {saturation['sessions']} eşzamanlı oturumda doydu: {saturation['reason']}")
+
+async def run(args):
+    levels = []
+    for sessions in args.sessions:
+        print(f"⏳ {sessions} eşzamanlı oturum, {args.duration:g} sn...", file=sys.stderr)
+        levels.append(await run_level(args, sessions))
+        
+        saturation = find_saturation(levels, args.min_gain, args.slo_ms)
+        if saturation["sessions"] is not None and not args.no_stop:
+            break
+    
+    return levels, find_saturation(levels, args.min_gain, args.slo_ms)
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamlit sayfalarına eşzamanlı oturumlarla yük bindirir")
+    parser.add_argument("--url", help="Çalışan uygulamanın adresi (verilmezse uygulama başlatılır)")
+    parser.add_argument("--port", type=int, default=8599, help="Başlatılan uygulamanın portu")
+    parser.add_argument("--email", default=config.get_secret("ADMIN_EMAIL", "admin@example.com"), help="Giriş e-postası")
+    parser.add_argument("--password", default=config.get_secret("ADMIN_PASSWORD", "admin123"), help="Giriş şifresi")
+    parser.add_argument("--pages", default="dashboard,courses,students,certificates", help="Dolaşılacak sayfalar (virgülle)")
+    parser.add_argument("--sessions", default="1,2,4,8,16", help="Eşzamanlı oturum kademeleri (virgülle)")
+    parser.add_argument("--duration", type=float, default=20, help="Kademe başına ölçüm süresi (sn)")
+    parser.add_argument("--think-ms", type=float, default=0, help="Sayfalar arası bekleme (ms)")
+    parser.add_argument("--timeout", type=float, default=60, help="Tek sayfa isteği için zaman aşımı (sn)")
+    parser.add_argument("--slo-ms", type=float, default=2000, help="Kabul edilebilir en yüksek p95 (ms)")
+    parser.add_argument("--min-gain", type=float, default=0.1, help="Bir sonraki kademede beklenen en az verim artışı (0-1)")
+    parser.add_argument("--no-stop", action="store_true", help="Doyma görülse de tüm kademeleri çalıştır")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    args.pages = [page.strip() for page in args.pages.split(",") if page.strip()]
+    args.sessions = sorted({int(value) for value in args.sessions.split(",")})
+    
+    if importlib.util.find_spec("websockets") is None:
+        print("❌ websockets paketi bulunamadı (pip install websockets)")
+        sys.exit(1)
+    
+    process = None
+    if not args.url:
+        print(f"🚀 Uygulama başlatılıyor (port {args.port})...", file=sys.stderr)
+        try:
+            process, args.url = start_server(args.port)
+        except RuntimeError as e:
+            print(f"❌ {str(e)}")
+            sys.exit(1)
+    
+    try:
+        levels, saturation = asyncio.run(run(args))
+    except (LoadTestError, OSError) as e:
+        print(f"❌ {str(e)}")
+        sys.exit(1)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+    
+    if args.json:
+        print(json.dumps({
+            "url": args.url,
+            "pages": args.pages,
+            "duration_s": args.duration,
+            "think_ms": args.think_ms,
+            "levels": levels,
+            "saturation": saturation
+        }, indent=2, ensure_ascii=False))
+        return
+    
+    print_report(levels, saturation)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Sorgu profili raporu
+
+Uygulama QUERY_PROFILER_ENABLED=true ile çalışırken her sayfa çizimi ve
+arka plan işi için sorgu özetleri, SLOW_QUERY_MS'i aşan sorgular ise
+parametreleri ve planlarıyla QUERY_PROFILE_LOG dosyasına yazılır. Bu script
+dosyayı okuyup en maliyetli sorguları, en çok sorgu çalıştıran istekleri,
+olası N+1 sorgularını ve yavaş sorguları listeler.
+
+--workload ile uygulamayı açmadan, ayarlı veritabanı üzerinde servislerin
+okuma yolları (eğitim listesi, eğitimin öğrencileri, öğrenci ve sertifika
+linki sorgulama) profillenir ve sonuç aynı dosyaya eklenir.
+
+Kullanım:
+    python scripts/query_report.py
+    python scripts/query_report.py --log /tmp/query_profile.jsonl --top 20
+    python scripts/query_report.py --workload --sample 20 --json
+"""
+
+import sys
+import os
+import json
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+# .env dosyasını yükle
+load_dotenv()
+
+import config
+from db.profiler import install_profiler, profile_request, read_profile_log, summarize
+
+def run_workload(sample):
+    """Servislerin okuma yollarını istek istek profiller"""
+    from services.course_service import CourseService
+    from services.student_service import StudentService
+    
+    install_profiler()
+    
+    with profile_request("workload.course_list"):
+        courses = CourseService.get_all_courses()
+    
+    students = []
+    for course in courses[:sample]:
+        with profile_request("workload.course_students"):
+            students.extend(StudentService.get_students_by_course(course["id"]))
+    
+    for student in students[:sample]:
+        with profile_request("workload.student_by_id"):
+            StudentService.get_student_by_id(student["id"])
+        
+        if student.get("certificate_access_token"):
+            with profile_request("workload.student_by_token"):
+                StudentService.get_student_by_token(student["certificate_access_token"])
+    
+    print(f"🔎 {len(courses[:sample])} eğitim ve {len(students[:sample])} öğrenci için sorgular profillendi", file=sys.stderr)
+
+def print_report(report):
+    """Raporu okunabilir biçimde yazdırır"""
+    print(f"📊 {report['requests']} istek, {report['statements']} sorgu")
+    
+    print("\n⏱️  Toplam süreye göre en maliyetli sorgular:")
+    for stats in report["by_total_time"]:
+        print(f"  {stats['total_ms']:>9.1f}ms  {stats['count']:>6}x  ort. {stats['avg_ms']:.2f}ms  {stats['sql'][:110]}")
+    
+    print("\n🔁 En sık çalışan sorgular:")
+    for stats in report["by_count"]:
+        print(f"  {stats['count']:>6}x  {stats['total_ms']:>9.1f}ms  {stats['sql'][:110]}")
+        print(f"          istekler: {', '.join(stats['requests'])}")
+    
+    print("\n📄 İstek başına en çok sorgu çalıştıranlar:")
+    for stats in report["heaviest_requests"]:
+        print(f"  {stats['request']:<30} ort. {stats['avg_statements']:>6} sorgu (en fazla {stats['max_statements']})  ort. {stats['avg_duration_ms']}ms  {stats['runs']} kez")
+    
+    print("\n⚠️  Olası N+1 sorguları:")
+    if not report["n_plus_one"]:
+        print("  (yok)")
+    for stats in report["n_plus_one"]:
+        print(f"  {stats['request']:<30} {stats['max_count']:>5}x tekrar ({stats['occurrences']} istekte)  {stats['sql'][:100]}")
+    
+    print(f"\n🐢 Yavaş sorgular (>= {config.SLOW_QUERY_MS:g}ms):")
+    if not report["slow_queries"]:
+        print("  (yok)")
+    for entry in report["slow_queries"]:
+        print(f"  {entry['duration_ms']:>9.1f}ms  {entry['request'] or '-'}  {entry['sql'][:110]}")
+        print(f"          parametreler: {entry['params']}")
+        for step in entry["plan"] or []:
+            print(f"          plan: {step}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Sorgu profili dosyasından en maliyetli sorguları raporlar")
+    parser.add_argument("--log", default=config.QUERY_PROFILE_LOG, help="Profil dosyası (varsayılan: QUERY_PROFILE_LOG)")
+    parser.add_argument("--top", type=int, default=10, help="Her listede gösterilecek kayıt sayısı")
+    parser.add_argument("--workload", action="store_true", help="Raporlamadan önce servislerin okuma yollarını profille")
+    parser.add_argument("--sample", type=int, default=10, help="--workload ile profillenecek eğitim ve öğrenci sayısı")
+    parser.add_argument("--json", action="store_true", help="Raporu JSON olarak yazdır")
+    args = parser.parse_args()
+    
+    if not args.log:
+        print("❌ Profil dosyası belirtilmedi (--log veya QUERY_PROFILE_LOG)")
+        sys.exit(1)
+    
+    if args.workload:
+        config.QUERY_PROFILE_LOG = args.log
+        run_workload(args.sample)
+    
+    if not os.path.exists(args.log):
+        print(f"❌ Profil dosyası bulunamadı: {args.log}")
+        print("   Uygulamayı QUERY_PROFILER_ENABLED=true ile çalıştırın veya --workload kullanın.")
+        sys.exit(1)
+    
+    report = summarize(read_profile_log(args.log), top=args.top)
+    
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    
+    print_report(report)
+
+if __name__ == "__main__":
+    main()
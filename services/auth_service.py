@@ -5,7 +5,9 @@ import bcrypt
 import jwt
 import datetime
 import config
+from utils.metrics import instrument
 
+@instrument
 class AuthService:
     """Kimlik doğrulama işlemleri için servis sınıfı"""
     
@@ -231,6 +233,32 @@ class AuthService:
         finally:
             session.close()
     
+    @staticmethod
+    def ensure_admin_user():
+        """
+        Admin kullanıcısı yoksa ayarlardaki bilgilerle oluşturur
+        
+        Bilgiler ADMIN_USERNAME, ADMIN_EMAIL ve ADMIN_PASSWORD ayarlarından alınır.
+        
+        Returns:
+            Admin oluşturulduysa True, zaten varsa veya oluşturulamadıysa False
+        """
+        if AuthService.check_admin_exists():
+            return False
+        
+        admin_email = config.get_secret("ADMIN_EMAIL", "admin@example.com")
+        success = AuthService.register(
+            username=config.get_secret("ADMIN_USERNAME", "admin"),
+            email=admin_email,
+            password=config.get_secret("ADMIN_PASSWORD", "admin123"),
+            role="admin"
+        )
+        
+        if success:
+            print(f"✅ Admin kullanıcısı oluşturuldu: {admin_email}")
+        
+        return success
+    
     @staticmethod
     def create_default_admin():
         """
@@ -1,11 +1,20 @@
 from sqlalchemy.exc import SQLAlchemyError
 from db.database import get_session
-from db.models import Course, Student
+from db.models import Course, Student, CertificateDerivative, Job, JobItem
 import datetime
 import os
+import uuid
+import base64
+import json
+import hashlib
 import config
-from services.file_service import FileService
+from services.file_service import FileService, CERTIFICATE_RENDERER_VERSION
+from utils.qr_helper import QRCodeGenerator
+from utils.certificate_generator import CertificateGenerator
+from utils.html_pdf_renderer import RENDERER_VERSION as HTML_PDF_RENDERER_VERSION
+from utils.metrics import instrument
 
+@instrument
 class CourseService:
     """Eğitim işlemleri için servis sınıfı"""
     
@@ -175,6 +184,14 @@ class CourseService:
             if not course:
                 return False
                 
+            # Eğitimin işlerini ve öğrencilerine ait iş adımlarını sil (yabancı anahtarlar denetlenir)
+            student_ids = session.query(Student.id).filter(Student.course_id == course_id)
+            job_ids = session.query(Job.id).filter(Job.course_id == course_id)
+            session.query(JobItem).filter(
+                JobItem.job_id.in_(job_ids.scalar_subquery()) | JobItem.student_id.in_(student_ids.scalar_subquery())
+            ).delete(synchronize_session=False)
+            session.query(Job).filter(Job.course_id == course_id).delete(synchronize_session=False)
+            
             # Öğrencileri ve sertifikaları da sil (cascade delete)
             session.delete(course)
             session.commit()
@@ -268,6 +285,9 @@ class CourseService:
         """
         Eğitimi tamamlar ve sertifika oluşturur
         
+        İşlem kalıcı bir iş olarak yürütülür (bkz. JobService); yarıda kalan
+        bir tamamlama tekrar çağrıldığında kaldığı yerden devam eder.
+        
         Args:
             course_id: Eğitim ID'si
             email_service: E-posta servisi (opsiyonel)
@@ -276,66 +296,293 @@ class CourseService:
         Returns:
             Başarılı tamamlama durumunda True, başarısız durumda False
         """
-        if not email_service:
-            from services.email_service import EmailService
-            email_service = EmailService()
+        from services.job_service import JobService
+            
+        job_id = JobService.create_completion_job(course_id)
+        if not job_id:
+            return False
+            
+        job = JobService.run_job(job_id, email_service=email_service, file_service=file_service)
+        return bool(job) and job["status"] == "completed"
+    
+    @staticmethod
+    def build_certificate_number(student, issued_at):
+        """
+        Sertifika numarasını oluşturur (veriliş tarihi + öğrenci ID'si)
+        
+        Args:
+            student: Öğrenci nesnesi
+            issued_at: Veriliş tarihi
+        
+        Returns:
+            Sertifika numarası
+        """
+        return f"{issued_at.strftime('%Y%m%d')}{student.id:04d}"
+    
+    @staticmethod
+    def build_certificate_replacements(student, course):
+        """
+        Sertifika şablonunda değiştirilecek alanları hazırlar
+        
+        Args:
+            student: Öğrenci nesnesi
+            course: Eğitim nesnesi
             
+        Returns:
+            Placeholder -> değer sözlüğü
+        """
+        # Değerler öğrencide saklanan bilgilerden türetilir; aynı sertifika her
+        # üretimde aynı içeriğe sahip olur
+        issued_at = student.certificate_issued_at or datetime.datetime.now()
+        certificate_number = student.certificate_number or CourseService.build_certificate_number(student, issued_at)
+        
+        verification_url = QRCodeGenerator.verification_url(student.certificate_access_token)
+        qr_png = QRCodeGenerator.generate_png(verification_url)
+        
+        return {
+            "{{ogrenci_adi}}": f"{student.first_name} {student.last_name}",
+            "{{kurs_adi}}": course.name,
+            "{{egitmen_adi}}": course.instructor_name or "Eğitmen Adı",
+            "{{tarih}}": issued_at.strftime("%d.%m.%Y"),
+            "{{sertifika_no}}": certificate_number,
+            "{{dogrulama_kodu}}": CertificateGenerator.verification_code(
+                certificate_number,
+                student.certificate_access_token,
+                issued_at
+            ),
+            "{{dogrulama_linki}}": verification_url,
+            "{{qr_kodu}}": f"data:image/png;base64,{base64.b64encode(qr_png).decode('ascii')}"
+        }
+    
+    @staticmethod
+    def build_certificate_fingerprint(replacements, template_version):
+        """
+        Sertifikayı belirleyen girdilerin parmak izini oluşturur
+        
+        Şablon sürümü, alan değerleri, çizim kodu sürümleri ve üretilen
+        türevler aynı kaldıkça parmak izi de aynı kalır.
+        
+        Args:
+            replacements: Değiştirilecek alanlar
+            template_version: Şablon dosyasının özeti
+        
+        Returns:
+            SHA-256 parmak izi (hex)
+        """
+        payload = json.dumps({
+            "template": template_version,
+            "renderer": CERTIFICATE_RENDERER_VERSION,
+            "html_pdf_renderer": HTML_PDF_RENDERER_VERSION,
+            "derivatives": sorted(config.CERTIFICATE_DERIVATIVES),
+            "replacements": replacements
+        }, sort_keys=True, ensure_ascii=False)
+        
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def issue_certificate(student, course, file_service, template_version=None, force=False, obsolete_files=None):
+        """
+        Öğrencinin sertifikasını ve ayarlarda tanımlı türevlerini oluşturur
+        
+        Girdileri son üretimden bu yana değişmemişse sertifika yeniden
+        üretilmez. Sertifika yolu, türevler ve parmak izi öğrenci nesnesine
+        işlenir; commit işlemi çağıran tarafa aittir. Yeniden üretimde eski
+        sertifika ve türev dosyaları silinmez, yolları obsolete_files
+        listesine eklenir; çağıran taraf commit başarılı olduktan sonra siler
+        (commit başarısız olursa kayıtlar hâlâ eski dosyaları gösterir).
+        
+        Args:
+            student: Öğrenci nesnesi (açık bir oturuma bağlı)
+            course: Eğitim nesnesi
+            file_service: Dosya servisi
+            template_version: Şablon özeti (verilmezse şablondan hesaplanır)
+            force: True ise parmak izi aynı olsa da yeniden üretir
+            obsolete_files: Artık kullanılmayan dosya yollarının ekleneceği liste (opsiyonel)
+            
+        Returns:
+            (sertifika dosyasının yolu, yeniden üretildiyse True) ikilisi
+        """
+        # Numara ve tarih ilk oluşturmada sabitlenir; yeniden üretimde değişmez
+        if not student.certificate_issued_at:
+            student.certificate_issued_at = datetime.datetime.now()
+        if not student.certificate_number:
+            student.certificate_number = CourseService.build_certificate_number(student, student.certificate_issued_at)
+        
+        replacements = CourseService.build_certificate_replacements(student, course)
+        
+        if template_version is None:
+            template_version = file_service.get_file_version(course.certificate_template_url)
+        
+        fingerprint = CourseService.build_certificate_fingerprint(replacements, template_version)
+        if not force and student.certificate_url and student.certificate_fingerprint == fingerprint:
+            return student.certificate_url, False
+        
+        # Yeni yollar kaydedilmeden önce eski dosyalar toplanır
+        previous_files = {student.certificate_url} | {derivative.file_url for derivative in student.derivatives}
+        
+        certificate_path = file_service.generate_certificate(
+            course.certificate_template_url,
+            replacements
+        )
+        student.certificate_url = certificate_path
+        
+        derivatives = file_service.generate_derivatives(
+            certificate_path,
+            config.CERTIFICATE_DERIVATIVES,
+            verification_url=replacements["{{dogrulama_linki}}"]
+        )
+        
+        # Aynı türdeki mevcut kayıt güncellenir (öğrenci + tür benzersizdir)
+        existing = {derivative.kind: derivative for derivative in student.derivatives}
+        updated = []
+        for kind, file_url in derivatives.items():
+            derivative = existing.get(kind) or CertificateDerivative(kind=kind)
+            derivative.file_url = file_url
+            updated.append(derivative)
+        student.derivatives = updated
+        student.certificate_fingerprint = fingerprint
+        
+        if obsolete_files is not None:
+            current_files = {certificate_path} | set(derivatives.values())
+            obsolete_files.extend(sorted(path for path in previous_files - current_files if path))
+        
+        return certificate_path, True
+    
+    @staticmethod
+    def generate_course_certificates_pdf(course_id, file_service=None):
+        """
+        Eğitimi tamamlayan tüm öğrencilerin sertifikalarını tek bir PDF'te toplar
+        
+        Öğrenciler veritabanından parça parça okunur ve her biri üretildiği anda
+        PDF'e sayfa olarak eklenir; tüm kohort belleğe alınmaz.
+        
+        Args:
+            course_id: Eğitim ID'si
+            file_service: Dosya servisi (opsiyonel)
+            
+        Returns:
+            PDF dosyasının depo köküne göre yolu (exports/...), başarısız durumda None
+        """
         if not file_service:
-            from services.file_service import FileService
             file_service = FileService()
             
         try:
             session = get_session()
             course = session.query(Course).filter(Course.id == course_id).first()
             
-            if not course:
-                return False
-                
-            # Eğitimi tamamlandı olarak işaretle
-            course.is_completed = True
+            if not course or not course.certificate_template_url:
+                return None
             
-            # Eğitimi tamamlamış öğrencileri bul
             completed_students = session.query(Student).filter(
                 Student.course_id == course_id,
                 Student.has_completed_course == True
-            ).all()
-            
-            # Her öğrenci için sertifika oluştur ve e-posta gönder
-            for student in completed_students:
-                # Sertifika için değiştirilecek alanlar
-                replacements = {
-                    "{{ogrenci_adi}}": f"{student.first_name} {student.last_name}",
-                    "{{kurs_adi}}": course.name,
-                    "{{egitmen_adi}}": course.instructor_name or "Eğitmen Adı",
-                    "{{tarih}}": datetime.datetime.now().strftime("%d.%m.%Y"),
-                    "{{sertifika_no}}": f"{datetime.datetime.now().strftime('%Y%m%d')}{student.id:04d}"
-                }
-                
-                # Sertifika oluştur
-                certificate_path = file_service.generate_certificate(
+            ).order_by(Student.first_name, Student.last_name).yield_per(200)
+            
+            replacements_iter = (
+                CourseService.build_certificate_replacements(student, course)
+                for student in completed_students
+            )
+            
+            return CourseService._write_export(
+                f"course_{course_id}_certificates.pdf",
+                lambda output_path: file_service.generate_course_pdf(
                     course.certificate_template_url,
-                    replacements
+                    replacements_iter,
+                    output_path
                 )
-                
-                # Öğrenci bilgilerini güncelle
-                student.certificate_url = certificate_path
-                
-                # E-posta gönder
-                certificate_link = f"{config.BASE_URL}/?token={student.certificate_access_token}"
-                email_service.send_certificate_email(
-                    student.email,
-                    f"{student.first_name} {student.last_name}",
-                    certificate_link
+            )
+        except SQLAlchemyError as e:
+            print(f"Veritabanı hatası: {str(e)}")
+            return None
+        except Exception as e:
+            print(f"Toplu sertifika oluşturma hatası: {str(e)}")
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _write_export(file_name, write):
+        """
+        Dışa aktarma dosyasını benzersiz geçici adla yazar ve yerine taşır
+        
+        Aynı eğitim için eşzamanlı dışa aktarmalar birbirinin dosyasını ezmez;
+        dosya os.replace ile tek adımda yerine geçer, indirilmekte olan eski
+        dosya yarım kalmaz.
+        
+        Args:
+            file_name: exports klasöründeki dosya adı
+            write: Tam dosya yolunu alıp yazılan kayıt sayısını döndüren fonksiyon
+        
+        Returns:
+            Dosyanın depo köküne göre yolu, hiç kayıt yazılmadıysa None
+        """
+        export_folder = os.path.join(config.STORAGE_PATH, "exports")
+        os.makedirs(export_folder, exist_ok=True)
+        temp_path = os.path.join(export_folder, f".{file_name}.{uuid.uuid4().hex}.tmp")
+        
+        try:
+            if write(temp_path) == 0:
+                return None
+            
+            os.replace(temp_path, os.path.join(export_folder, file_name))
+            return os.path.join("exports", file_name)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    @staticmethod
+    def export_course_certificates_zip(course_id, file_service=None):
+        """
+        Eğitimin tüm sertifikalarını manifest dosyası ile birlikte ZIP arşivine aktarır
+        
+        Args:
+            course_id: Eğitim ID'si
+            file_service: Dosya servisi (opsiyonel)
+            
+        Returns:
+            ZIP dosyasının depo köküne göre yolu (exports/...), başarısız durumda None
+        """
+        from slugify import slugify
+        
+        if not file_service:
+            file_service = FileService()
+            
+        try:
+            session = get_session()
+            course = session.query(Course).filter(Course.id == course_id).first()
+            
+            if not course:
+                return None
+            
+            students = session.query(Student).filter(
+                Student.course_id == course_id,
+                Student.certificate_url != None,
+                Student.certificate_url != ""
+            ).order_by(Student.first_name, Student.last_name).yield_per(200)
+            
+            entries = (
+                (
+                    slugify(f"{student.first_name} {student.last_name}") or f"ogrenci-{student.id}",
+                    student.certificate_url,
+                    {
+                        "Ad": student.first_name,
+                        "Soyad": student.last_name,
+                        "E-posta": student.email,
+                        "Sertifika Linki": f"{config.BASE_URL}/?token={student.certificate_access_token}"
+                    }
                 )
+                for student in students
+            )
             
-            session.commit()
-            return True
+            return CourseService._write_export(
+                f"course_{course_id}_certificates.zip",
+                lambda output_path: file_service.export_certificates_zip(entries, output_path)
+            )
         except SQLAlchemyError as e:
-            session.rollback()
             print(f"Veritabanı hatası: {str(e)}")
-            return False
+            return None
         except Exception as e:
-            print(f"Sertifika oluşturma hatası: {str(e)}")
-            return False
+            print(f"Sertifika arşivi oluşturma hatası: {str(e)}")
+            return None
         finally:
             session.close()
@@ -1,12 +1,33 @@
 import smtplib
+import asyncio
+import logging
+import time
+import datetime
+from collections import Counter
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from db.database import get_session
+from db.models import EmailQuota
 import config
-import datetime
+from utils.email_template import CertificateEmailTemplate
+from utils.log_helper import get_logger, log_event
+from utils.rate_limiter import get_token_bucket
+from utils.metrics import instrument, track
+from utils.metrics_exporter import EMAILS, SMTP_SEND_SECONDS
+
+logger = get_logger("email")
 
+class EmailQuotaExceeded(Exception):
+    """Günlük e-posta gönderim kotası doldu"""
+
+@instrument
 class EmailService:
     """E-posta işlemleri için servis sınıfı"""
     
+    # Ayarlar işlem başına bir kez kaydedilir
+    _settings_logged = False
+    
     def __init__(self):
         """
         E-posta servisi başlatma
@@ -17,13 +38,26 @@ class EmailService:
         self.smtp_password = config.SMTP_PASSWORD
         self.sender_email = config.SMTP_SENDER_EMAIL
         self.sender_name = config.SMTP_SENDER_NAME
+        self.use_tls = config.SMTP_USE_TLS
+        self._certificate_template = None
+        
+        # Aynı hesabı kullanan tüm servis nesneleri ve thread'ler tek sınırı paylaşır
+        self.rate_limiter = get_token_bucket(
+            f"{self.smtp_server}:{self.smtp_username}",
+            config.SMTP_RATE_PER_MINUTE,
+            config.SMTP_BURST
+        )
         
         # E-posta ayarlarını logla
-        print(f"[EMAIL SERVICE] SMTP Server: {self.smtp_server}")
-        print(f"[EMAIL SERVICE] SMTP Port: {self.smtp_port}")
-        print(f"[EMAIL SERVICE] SMTP Username: {self.smtp_username}")
-        print(f"[EMAIL SERVICE] Sender Email: {self.sender_email}")
-        print(f"[EMAIL SERVICE] Sender Name: {self.sender_name}")
+        if not EmailService._settings_logged:
+            EmailService._settings_logged = True
+            log_event(
+                logger, logging.DEBUG, "E-posta ayarları",
+                server=f"{self.smtp_server}:{self.smtp_port}",
+                username=self.smtp_username,
+                sender=self.sender_email,
+                tls=self.use_tls
+            )
     
     def send_email(self, to, subject, body, is_html=True):
         """
@@ -38,75 +72,100 @@ class EmailService:
         Returns:
             Başarılı gönderim durumunda True, başarısız durumda False
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[EMAIL SERVICE] [{timestamp}] E-posta gönderimi başlatılıyor...")
-        print(f"[EMAIL SERVICE] [{timestamp}] Alıcı: {to}")
-        print(f"[EMAIL SERVICE] [{timestamp}] Konu: {subject}")
-        print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - SMTP Username: {self.smtp_username}")
-        print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - SMTP Password Length: {len(self.smtp_password) if self.smtp_password else 0}")
+        # E-posta oluştur
+        message = self._build_message(to, subject, body, is_html)
         
-        try:
-            # E-posta ayarları yoksa uyarı ver ve çık
-            if not self.smtp_server or not self.smtp_username or not self.smtp_password:
-                print(f"[EMAIL SERVICE] [{timestamp}] HATA: E-posta ayarları yapılandırılmamış!")
-                print(f"[EMAIL SERVICE] [{timestamp}] SMTP Server: {self.smtp_server}")
-                print(f"[EMAIL SERVICE] [{timestamp}] SMTP Username: {self.smtp_username}")
-                print(f"[EMAIL SERVICE] [{timestamp}] SMTP Password: {'***' if self.smtp_password else 'None'}")
+        result = self._send_with_quota(to, message)
+        log_event(logger, logging.INFO if result else logging.WARNING, "E-posta gönderimi", to=to, subject=subject, sent=result)
+        return result
+    
+    def _send_with_quota(self, to, message):
+        """
+        Günlük kotadan bir hak ayırıp tek bir mesajı gönderir
+        
+        Returns:
+            Başarılı gönderim durumunda True, başarısız veya kota dolu ise False
+        """
+        # E-posta ayarları yoksa uyarı ver ve çık
+        if not self._is_configured():
+            return False
+        
+        if not self._reserve_daily_quota(1):
+            log_event(logger, logging.WARNING, "Günlük e-posta kotası doldu", to=to, limit=config.SMTP_DAILY_LIMIT)
+            EMAILS.inc(result="quota_skipped")
+            return False
+        
+        result = self._deliver(to, message)
+        EMAILS.inc(result={True: "sent", False: "failed", None: "quota_skipped"}[result])
+        if not result:
+            self._release_daily_quota(1)
+        
+        # Sağlayıcı kotanın dolduğunu bildirdiyse sayaç da bugün için kapatılır
+        if result is None:
+            self._exhaust_daily_quota()
+        return bool(result)
+    
+    def _deliver(self, to, message):
+        """
+        Hazırlanmış mesajı hız sınırına uyarak SMTP ile gönderir
+        
+        Sunucu geçici bir hata (4xx, örn. "çok hızlı gönderiyorsunuz")
+        döndürürse mesaj kabul edilmemiştir; hız sınırlayıcı tüm göndericileri
+        bekletir ve mesaj SMTP_MAX_RETRIES kez yeniden denenir.
+        
+        Args:
+            to: Alıcı e-posta adresi
+            message: MIME mesajı veya gönderime hazır bytes
+        
+        Returns:
+            Başarılı gönderimde True, başarısızda False, sağlayıcı günlük
+            kotanın dolduğunu bildirdiyse None
+        """
+        for attempt in range(config.SMTP_MAX_RETRIES + 1):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            
+            try:
+                # E-posta gönder (süre hız sınırı beklemesi hariç ölçülür)
+                with track("EmailService.smtp_send"), SMTP_SEND_SECONDS.time(mode="sync"):
+                    with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=config.SMTP_TIMEOUT) as server:
+                        if self.use_tls:
+                            server.starttls()  # TLS güvenliği
+                        server.login(self.smtp_username, self.smtp_password)
+                        if isinstance(message, bytes):
+                            server.sendmail(self.sender_email, [to], message)
+                        else:
+                            server.send_message(message)
+                
+                log_event(logger, logging.DEBUG, "E-posta gönderildi", sample=True, to=to)
+                return True
+            except smtplib.SMTPAuthenticationError as e:
+                # Genellikle 2 adımlı doğrulama kapalı veya uygulama şifresi kullanılmıyor
+                log_event(
+                    logger, logging.ERROR, "SMTP kimlik doğrulama hatası",
+                    username=self.smtp_username,
+                    error=str(e),
+                    hint="2 adımlı doğrulama ve uygulama şifresi (App Password) ayarlarını kontrol edin"
+                )
                 return False
+            except Exception as e:
+                error_kind = self._classify_error(e)
                 
-            print(f"[EMAIL SERVICE] [{timestamp}] SMTP bağlantısı kuruluyor...")
-            
-            # E-posta oluştur
-            message = MIMEMultipart()
-            message["From"] = f"{self.sender_name} <{self.sender_email}>"
-            message["To"] = to
-            message["Subject"] = subject
-            
-            # İçerik türünü ayarla
-            if is_html:
-                message.attach(MIMEText(body, "html"))
-                print(f"[EMAIL SERVICE] [{timestamp}] HTML formatında e-posta oluşturuldu")
-            else:
-                message.attach(MIMEText(body, "plain"))
-                print(f"[EMAIL SERVICE] [{timestamp}] Plain text formatında e-posta oluşturuldu")
-            
-            print(f"[EMAIL SERVICE] [{timestamp}] SMTP sunucusuna bağlanılıyor: {self.smtp_server}:{self.smtp_port}")
-            
-            # E-posta gönder
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                print(f"[EMAIL SERVICE] [{timestamp}] SMTP bağlantısı başarılı")
-                print(f"[EMAIL SERVICE] [{timestamp}] TLS başlatılıyor...")
-                server.starttls()  # TLS güvenliği
-                print(f"[EMAIL SERVICE] [{timestamp}] TLS başarılı")
-                print(f"[EMAIL SERVICE] [{timestamp}] SMTP girişi yapılıyor...")
-                print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - Giriş denemesi: {self.smtp_username}")
-                server.login(self.smtp_username, self.smtp_password)
-                print(f"[EMAIL SERVICE] [{timestamp}] SMTP girişi başarılı")
-                print(f"[EMAIL SERVICE] [{timestamp}] E-posta gönderiliyor...")
-                server.send_message(message)
-                print(f"[EMAIL SERVICE] [{timestamp}] ✅ E-posta başarıyla gönderildi!")
+                if error_kind == "quota":
+                    log_event(logger, logging.WARNING, "Sağlayıcı günlük kotanın dolduğunu bildirdi", to=to, error=str(e))
+                    return None
                 
-            return True
-        except smtplib.SMTPAuthenticationError as e:
-            print(f"[EMAIL SERVICE] [{timestamp}] ❌ SMTP Kimlik Doğrulama Hatası: {str(e)}")
-            print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - Bu hata genellikle şu nedenlerden kaynaklanır:")
-            print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - 1. 2 Adımlı Doğrulama açık değil")
-            print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - 2. App Password kullanılmıyor")
-            print(f"[EMAIL SERVICE] [{timestamp}] DEBUG - 3. 'Daha az güvenli uygulama erişimi' kapalı")
-            return False
-        except smtplib.SMTPConnectError as e:
-            print(f"[EMAIL SERVICE] [{timestamp}] ❌ SMTP Bağlantı Hatası: {str(e)}")
-            return False
-        except smtplib.SMTPRecipientsRefused as e:
-            print(f"[EMAIL SERVICE] [{timestamp}] ❌ Alıcı Reddedildi: {str(e)}")
-            return False
-        except smtplib.SMTPServerDisconnected as e:
-            print(f"[EMAIL SERVICE] [{timestamp}] ❌ SMTP Sunucu Bağlantısı Kesildi: {str(e)}")
-            return False
-        except Exception as e:
-            print(f"[EMAIL SERVICE] [{timestamp}] ❌ E-posta gönderme hatası: {str(e)}")
-            print(f"[EMAIL SERVICE] [{timestamp}] Hata türü: {type(e).__name__}")
-            return False
+                if error_kind == "temporary" and attempt < config.SMTP_MAX_RETRIES:
+                    time.sleep(self._back_off(attempt, to, e))
+                    continue
+                
+                if isinstance(e, (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected)):
+                    log_event(logger, logging.WARNING, "SMTP bağlantı hatası", to=to, error_type=type(e).__name__, error=str(e))
+                elif isinstance(e, smtplib.SMTPRecipientsRefused):
+                    log_event(logger, logging.WARNING, "Alıcı reddedildi", to=to, error=str(e))
+                else:
+                    log_event(logger, logging.WARNING, "E-posta gönderme hatası", to=to, error_type=type(e).__name__, error=str(e))
+                return False
     
     def send_certificate_email(self, to, student_name, certificate_link):
         """
@@ -120,45 +179,428 @@ class EmailService:
         Returns:
             Başarılı gönderim durumunda True, başarısız durumda False
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[EMAIL SERVICE] [{timestamp}] Sertifika e-postası gönderiliyor...")
-        print(f"[EMAIL SERVICE] [{timestamp}] Öğrenci: {student_name}")
-        print(f"[EMAIL SERVICE] [{timestamp}] Sertifika Linki: {certificate_link}")
-        
-        subject = "Eğitim Sertifikanız Hazır!"
-        body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 5px;">
-                <div style="text-align: center; padding: 10px; background-color: #f8f9fa; margin-bottom: 20px;">
-                    <h2 style="color: #2c3e50;">Tebrikler, {student_name}!</h2>
-                </div>
-                
-                <p>Eğitimi başarıyla tamamladınız ve sertifikanız hazır.</p>
-                
-                <p>Sertifikanızı görüntülemek ve indirmek için aşağıdaki bağlantıya tıklayın:</p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{certificate_link}" style="background-color: #3498db; color: white; padding: 12px 20px; text-decoration: none; border-radius: 4px; font-weight: bold;">Sertifikanızı Görüntüleyin</a>
-                </div>
+        message = self._get_certificate_template().render(to, student_name, certificate_link)
+        return self._send_with_quota(to, message)
+    
+    def send_certificate_emails(self, recipients, concurrency=None, on_sent=None):
+        """
+        Birden çok sertifika e-postasını eşzamanlı olarak gönderir
+        
+        E-postalar asyncio ile en fazla `concurrency` SMTP bağlantısı
+        üzerinden aynı anda gönderilir. Her bağlantı bir kez açılıp oturum
+        açıldıktan sonra birden çok e-posta için kullanılır; e-posta başına
+        bağlantı, TLS ve giriş maliyeti ortadan kalkar. aiosmtplib kurulu
+        değilse e-postalar sırayla gönderilir.
+        
+        Gönderimler sağlayıcı sınırlarına göre planlanır: önce günlük kotadan
+        yer ayrılır, bağlantılar ortak hız sınırlayıcıdan sıra alır. Kotaya
+        sığmayan alıcılara gönderim denenmez.
+        
+        Args:
+            recipients: (alıcı e-posta adresi, öğrenci adı, sertifika linki) listesi
+            concurrency: Aynı anda açık bağlantı sayısı (varsayılan: SMTP_CONCURRENCY)
+            on_sent: Her alıcının gönderimi bittiğinde çağrılır (opsiyonel); False
+                döndürürse kalan alıcılara gönderim yapılmaz ve başarısız sayılır
+        
+        Returns:
+            Her alıcı için sırasıyla başarılı gönderimde True, başarısızda
+            False, günlük kota dolduğu için denenmediyse None
+        """
+        recipients = list(recipients)
+        
+        if not recipients:
+            return []
+        
+        if not self._is_configured():
+            return [False] * len(recipients)
+        
+        start = time.perf_counter()
+        errors = Counter()
+        
+        granted = self._reserve_daily_quota(len(recipients))
+        results = [None] * len(recipients)
+        
+        if granted:
+            try:
+                import aiosmtplib
+            except ImportError:
+                log_event(logger, logging.WARNING, "'aiosmtplib' paketi yok, e-postalar sırayla gönderiliyor")
+                concurrency = 1
+                template = self._get_certificate_template()
+                for index, (to, student_name, certificate_link) in enumerate(recipients[:granted]):
+                    results[index] = self._deliver(to, template.render(to, student_name, certificate_link))
+                    if results[index] is None:
+                        break
+                    if on_sent is not None and on_sent() is False:
+                        results[index + 1:granted] = [False] * (granted - index - 1)
+                        break
+            else:
+                concurrency = max(1, min(concurrency or config.SMTP_CONCURRENCY, granted))
+                results[:granted] = asyncio.run(
+                    self._send_certificate_emails_async(aiosmtplib, recipients[:granted], concurrency, errors, on_sent)
+                )
+        
+        # Ayrılıp kullanılmayan kota geri bırakılır
+        sent = results.count(True)
+        self._release_daily_quota(granted - sent)
+        
+        # Sağlayıcı kotanın dolduğunu bildirdiyse sayaç da bugün için kapatılır
+        if None in results[:granted]:
+            self._exhaust_daily_quota()
+        
+        # Toplu gönderim için tek özet kaydı
+        skipped = results.count(None)
+        EMAILS.inc(sent, result="sent")
+        EMAILS.inc(len(results) - sent - skipped, result="failed")
+        EMAILS.inc(skipped, result="quota_skipped")
+        log_event(
+            logger, logging.INFO if sent == len(results) else logging.WARNING, "Toplu sertifika e-postası gönderimi",
+            recipients=len(results),
+            sent=sent,
+            failed=len(results) - sent - skipped,
+            quota_skipped=skipped,
+            concurrency=concurrency if granted else 0,
+            duration_ms=round((time.perf_counter() - start) * 1000),
+            errors=dict(errors)
+        )
+        return results
+    
+    async def _send_certificate_emails_async(self, aiosmtplib, recipients, concurrency, errors, on_sent=None):
+        """
+        Alıcıları ortak bir kuyruktan alan `concurrency` adet gönderici çalıştırır
+        
+        Bir gönderimde bağlantı koparsa o e-posta başarısız sayılır (sunucu
+        almış olabileceğinden tekrar denenmez); sonraki e-posta için yeni
+        bağlantı açılır. Sunucu geçici hata (4xx) döndürürse mesaj kabul
+        edilmemiştir; tüm göndericiler bekletilip mesaj yeniden denenir.
+        Kimlik doğrulama hatasında kalan e-postalar gönderilmez ve başarısız
+        sayılır; sağlayıcı günlük kotanın dolduğunu bildirirse kalanlar
+        denenmez (None). on_sent ayrı bir iş parçacığında çağrılır; False
+        döndürürse göndericiler durur, sırada kalanlar başarısız sayılır.
+        Hata türleri `errors` sayacına eklenir.
+        """
+        results = [False] * len(recipients)
+        template = self._get_certificate_template()
+        authentication_failed = asyncio.Event()
+        quota_exhausted = asyncio.Event()
+        stopped = asyncio.Event()
+        queue = asyncio.Queue()
+        for index, recipient in enumerate(recipients):
+            queue.put_nowait((index, recipient))
+        
+        async def sender():
+            smtp = None
+            sent_on_connection = 0
+            
+            try:
+                # Kimlik doğrulama hatasında hesap kilitlenmesin diye gönderim durdurulur
+                while not queue.empty() and not authentication_failed.is_set() and not quota_exhausted.is_set() and not stopped.is_set():
+                    index, (to, student_name, certificate_link) = queue.get_nowait()
+                    message = template.render(to, student_name, certificate_link)
+                    
+                    for attempt in range(config.SMTP_MAX_RETRIES + 1):
+                        # Bağlantılar sırayla ve sağlayıcının izin verdiği hızda gönderir
+                        if self.rate_limiter:
+                            await self.rate_limiter.acquire_async()
+                        
+                        try:
+                            # Sunucuların bağlantı başına e-posta sınırına takılmamak için bağlantı yenilenir
+                            if smtp is not None and sent_on_connection >= config.SMTP_MESSAGES_PER_CONNECTION:
+                                await self._close_async_connection(smtp)
+                                smtp = None
+                        
+                            if smtp is None or not smtp.is_connected:
+                                smtp = await self._open_async_connection(aiosmtplib)
+                                sent_on_connection = 0
+                        
+                            with track("EmailService.smtp_send_async"), SMTP_SEND_SECONDS.time(mode="async"):
+                                await smtp.sendmail(self.sender_email, [to], message)
+                            sent_on_connection += 1
+                            results[index] = True
+                            log_event(logger, logging.DEBUG, "E-posta gönderildi", sample=True, to=to)
+                        except aiosmtplib.SMTPAuthenticationError as e:
+                            errors[type(e).__name__] += 1
+                            if not authentication_failed.is_set():
+                                log_event(logger, logging.ERROR, "SMTP kimlik doğrulama hatası", username=self.smtp_username, error=str(e))
+                            authentication_failed.set()
+                        except Exception as e:
+                            errors[type(e).__name__] += 1
+                            error_kind = self._classify_error(e)
+                            
+                            # Bağlantı koptuysa veya sunucu yavaşlama istediyse yeniden bağlanılır
+                            if error_kind == "temporary" or isinstance(e, (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, ConnectionError)):
+                                await self._close_async_connection(smtp)
+                                smtp = None
+                            
+                            if error_kind == "quota":
+                                results[index] = None
+                                if not quota_exhausted.is_set():
+                                    log_event(logger, logging.WARNING, "Sağlayıcı günlük kotanın dolduğunu bildirdi", error=str(e))
+                                quota_exhausted.set()
+                            elif error_kind == "temporary" and attempt < config.SMTP_MAX_RETRIES:
+                                await asyncio.sleep(self._back_off(attempt, to, e))
+                                continue
+                            else:
+                                log_event(logger, logging.WARNING, "E-posta gönderilemedi", sample=True, to=to, error_type=type(e).__name__, error=str(e))
+                        break
+                    
+                    # Geri çağrı veritabanına yazabilir; olay döngüsünü bekletmemesi
+                    # için ayrı bir iş parçacığında çalıştırılır
+                    if on_sent is not None and await asyncio.to_thread(on_sent) is False:
+                        stopped.set()
+            finally:
+                if smtp is not None:
+                    await self._close_async_connection(smtp)
+        
+        await asyncio.gather(*(sender() for _ in range(concurrency)))
+        
+        # Kota dolduğu için sırada kalan alıcılara gönderim denenmedi
+        if quota_exhausted.is_set():
+            while not queue.empty():
+                index, _ = queue.get_nowait()
+                results[index] = None
+        
+        return results
+    
+    async def _open_async_connection(self, aiosmtplib):
+        """SMTP bağlantısı açar, gerekirse TLS başlatır ve oturum açar"""
+        smtp = aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            start_tls=self.use_tls,
+            timeout=config.SMTP_TIMEOUT
+        )
+        await smtp.connect()
+        
+        try:
+            await smtp.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            smtp.close()
+            raise
+        
+        return smtp
+    
+    async def _close_async_connection(self, smtp):
+        """SMTP bağlantısını kapatır; kapanış hataları yok sayılır"""
+        if smtp is None:
+            return
+        
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+    
+    @staticmethod
+    def _classify_error(error):
+        """
+        SMTP hatasının türünü belirler
+        
+        Args:
+            error: smtplib veya aiosmtplib hatası
+        
+        Returns:
+            'quota' (günlük kota doldu), 'temporary' (4xx, mesaj kabul
+            edilmedi, yeniden denenebilir) veya None
+        """
+        code = getattr(error, "smtp_code", None) or getattr(error, "code", None)
+        
+        # Tek alıcılı gönderimde alıcı reddi: smtplib sözlük, aiosmtplib liste kullanır
+        recipients = getattr(error, "recipients", None)
+        if recipients:
+            refused = list(recipients.values())[0] if isinstance(recipients, dict) else recipients[0]
+            code = refused[0] if isinstance(refused, tuple) else getattr(refused, "code", None)
+        
+        # Gmail: "550 5.4.5 Daily user sending limit exceeded"
+        if "5.4.5" in str(error):
+            return "quota"
+        if isinstance(code, int) and 400 <= code < 500:
+            return "temporary"
+        return None
+    
+    @staticmethod
+    def _backoff_seconds(attempt):
+        """Art arda geçici hatalarda katlanarak artan bekleme süresi"""
+        return config.SMTP_THROTTLE_BACKOFF * 2 ** attempt
+    
+    def _back_off(self, attempt, to, error):
+        """
+        Sunucu geçici hata döndürdüğünde gönderimi yavaşlatır
+        
+        Hız sınırlayıcı varsa aynı hesabı kullanan tüm göndericiler birlikte
+        bekletilir; sıradaki jeton bekleme bitince verilir.
+        
+        Returns:
+            Çağıranın ayrıca beklemesi gereken süre (saniye)
+        """
+        seconds = self._backoff_seconds(attempt)
+        log_event(
+            logger, logging.WARNING, "Sunucu geçici hata döndürdü, gönderim yavaşlatılıyor",
+            to=to, attempt=attempt + 1, wait_s=seconds, error=str(error)
+        )
+        
+        if self.rate_limiter:
+            self.rate_limiter.pause(seconds)
+            return 0
+        return seconds
+    
+    def _quota_key(self):
+        """Günlük sayacın hesap ve gün (UTC) anahtarı"""
+        return self.smtp_username or self.sender_email, datetime.datetime.utcnow().strftime("%Y-%m-%d")
+    
+    def daily_quota_remaining(self):
+        """
+        Bugün için kalan gönderim kotasını döndürür
+        
+        Returns:
+            Kalan e-posta sayısı, kota sınırı yoksa None
+        """
+        if config.SMTP_DAILY_LIMIT <= 0:
+            return None
+        
+        account, day = self._quota_key()
+        
+        try:
+            session = get_session()
+            sent = session.query(EmailQuota.sent).filter(
+                EmailQuota.account == account,
+                EmailQuota.day == day
+            ).scalar() or 0
+            return max(config.SMTP_DAILY_LIMIT - sent, 0)
+        except SQLAlchemyError as e:
+            log_event(logger, logging.WARNING, "E-posta kotası okunamadı", error=str(e))
+            return None
+        finally:
+            session.close()
+    
+    def _reserve_daily_quota(self, count):
+        """
+        Günlük kotadan en fazla `count` gönderim hakkı ayırır
+        
+        Sayaç veritabanında tutulur; uygulama yeniden başlasa veya birden çok
+        süreç aynı hesapla gönderse de kota aşılmaz. Sayaç yalnızca okunan
+        değer değişmediyse güncellenir, eşzamanlı ayırmalar çakışmaz.
+        
+        Args:
+            count: İstenen gönderim sayısı
+        
+        Returns:
+            Ayrılan gönderim sayısı (0..count)
+        """
+        if config.SMTP_DAILY_LIMIT <= 0 or count <= 0:
+            return count
+        
+        account, day = self._quota_key()
+        
+        try:
+            session = get_session()
+            
+            if not session.query(EmailQuota.id).filter(EmailQuota.account == account, EmailQuota.day == day).first():
+                try:
+                    session.add(EmailQuota(account=account, day=day, sent=0))
+                    session.commit()
+                except IntegrityError:
+                    # Sayaç başka bir süreç tarafından oluşturuldu
+                    session.rollback()
+            
+            while True:
+                sent = session.query(EmailQuota.sent).filter(
+                    EmailQuota.account == account,
+                    EmailQuota.day == day
+                ).scalar()
                 
-                <p>Bu link size özeldir ve sertifikanızın doğruluğunu ispat etmek için kullanılabilir.</p>
+                granted = min(count, max(config.SMTP_DAILY_LIMIT - sent, 0))
+                if not granted:
+                    return 0
                 
-                <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+                updated = session.query(EmailQuota).filter(
+                    EmailQuota.account == account,
+                    EmailQuota.day == day,
+                    EmailQuota.sent == sent
+                ).update({"sent": EmailQuota.sent + granted}, synchronize_session=False)
+                session.commit()
                 
-                <p style="font-size: 12px; color: #777; text-align: center;">
-                    Bu e-posta otomatik olarak gönderilmiştir. Lütfen yanıtlamayınız.
-                </p>
-            </div>
-        </body>
-        </html>
+                if updated:
+                    return granted
+        except SQLAlchemyError as e:
+            # Sayaç kullanılamıyorsa gönderim engellenmez; hız sınırı yine uygulanır
+            session.rollback()
+            log_event(logger, logging.WARNING, "E-posta kotası ayrılamadı", error=str(e))
+            return count
+        finally:
+            session.close()
+    
+    def _release_daily_quota(self, count):
         """
+        Ayrılıp gönderilmeyen hakları kotaya geri verir
         
-        result = self.send_email(to, subject, body)
+        Args:
+            count: Geri verilecek gönderim sayısı
+        """
+        if config.SMTP_DAILY_LIMIT <= 0 or count <= 0:
+            return
         
-        if result:
-            print(f"[EMAIL SERVICE] [{timestamp}] ✅ Sertifika e-postası başarıyla gönderildi: {to}")
-        else:
-            print(f"[EMAIL SERVICE] [{timestamp}] ❌ Sertifika e-postası gönderilemedi: {to}")
+        account, day = self._quota_key()
         
-        return result
+        try:
+            session = get_session()
+            session.query(EmailQuota).filter(
+                EmailQuota.account == account,
+                EmailQuota.day == day,
+                EmailQuota.sent >= count
+            ).update({"sent": EmailQuota.sent - count}, synchronize_session=False)
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            log_event(logger, logging.WARNING, "E-posta kotası güncellenemedi", error=str(e))
+        finally:
+            session.close()
+    
+    def _exhaust_daily_quota(self):
+        """Sağlayıcı kotanın dolduğunu bildirdiğinde bugünün kalan hakkını kapatır"""
+        remaining = self.daily_quota_remaining()
+        if remaining:
+            self._reserve_daily_quota(remaining)
+    
+    def _build_message(self, to, subject, body, is_html=True):
+        """
+        Gönderilecek MIME mesajını oluşturur
+        
+        Args:
+            to: Alıcı e-posta adresi
+            subject: E-posta konusu
+            body: E-posta içeriği
+            is_html: HTML formatında mı? (varsayılan: True)
+        
+        Returns:
+            MIMEMultipart mesajı
+        """
+        message = MIMEMultipart()
+        message["From"] = f"{self.sender_name} <{self.sender_email}>"
+        message["To"] = to
+        message["Subject"] = subject
+        message.attach(MIMEText(body, "html" if is_html else "plain"))
+        return message
+    
+    def _get_certificate_template(self):
+        """
+        Sertifika e-postası şablonunu döndürür
+        
+        Şablon servis nesnesi başına bir kez derlenir; toplu gönderimde tüm
+        alıcılar aynı başlıkları ve sabit parçaları kullanır.
+        """
+        if self._certificate_template is None:
+            self._certificate_template = CertificateEmailTemplate(self.sender_name, self.sender_email)
+        return self._certificate_template
+                
+    def _is_configured(self):
+        """SMTP ayarları eksikse hata kaydı yazar ve False döndürür"""
+        if self.smtp_server and self.smtp_username and self.smtp_password:
+            return True
+
+        log_event(
+            logger, logging.ERROR, "E-posta ayarları yapılandırılmamış",
+            server=self.smtp_server,
+            username=self.smtp_username,
+            password_set=bool(self.smtp_password)
+        )
+        return False
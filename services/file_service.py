@@ -2,15 +2,21 @@ import os
 import shutil
 from datetime import datetime
 import uuid
-from PIL import Image, ImageDraw, ImageFont
+import csv
+import zipfile
+import hashlib
+from urllib.parse import quote, urlencode
 import io
 import config
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from utils.qr_helper import QRCodeGenerator
+from utils.metrics import instrument
+from utils.metrics_exporter import CERTIFICATES_RENDERED, CERTIFICATE_RENDER_SECONDS
 
+# Sertifika çizim kodunda çıktıyı etkileyen bir değişiklik yapıldığında artırılmalı
+# (tüm sertifikaların yeniden üretilmesini sağlar)
+CERTIFICATE_RENDERER_VERSION = "1"
+
+@instrument
 class FileService:
     """Dosya işlemleri için servis sınıfı"""
     
@@ -221,6 +227,210 @@ class FileService:
             print(f"S3 okuma hatası: {str(e)}")
             raise
     
+    def get_file_version(self, file_path):
+        """
+        Dosya içeriğinin özetini döndürür
+        
+        Şablon değişikliklerini algılamak için kullanılır; içerik aynı kaldıkça
+        özet de aynı kalır.
+        
+        Args:
+            file_path: Dosya yolu
+        
+        Returns:
+            SHA-256 özeti (hex)
+        """
+        digest = hashlib.sha256()
+        for chunk in self.iter_file(file_path):
+            digest.update(chunk)
+        return digest.hexdigest()
+    
+    def iter_file(self, file_path, chunk_size=1024 * 1024):
+        """
+        Dosyayı parça parça okur
+        
+        Büyük dosyaların tamamı belleğe alınmadan işlenebilmesi için kullanılır.
+        
+        Args:
+            file_path: Dosya yolu
+            chunk_size: Her parçanın en fazla bayt sayısı
+            
+        Yields:
+            Dosya içeriğinin parçaları (bytes)
+        """
+        if config.STORAGE_TYPE == "local":
+            full_path = os.path.join(config.STORAGE_PATH, file_path)
+            
+            if not os.path.exists(full_path):
+                raise FileNotFoundError(f"Dosya bulunamadı: {full_path}")
+            
+            with open(full_path, "rb") as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        elif config.STORAGE_TYPE == "s3":
+            import boto3
+            
+            s3_client = boto3.client(
+                's3',
+                aws_access_key_id=config.S3_ACCESS_KEY,
+                aws_secret_access_key=config.S3_SECRET_KEY,
+                region_name=config.S3_REGION
+            )
+            
+            response = s3_client.get_object(
+                Bucket=config.S3_BUCKET,
+                Key=file_path
+            )
+            
+            yield from response['Body'].iter_chunks(chunk_size)
+        else:
+            raise ValueError(f"Geçersiz depolama türü: {config.STORAGE_TYPE}")
+    
+    def get_file_url(self, file_path, download_name=None):
+        """
+        Dosyanın tarayıcıdan doğrudan indirilebileceği URL'i döndürür
+        
+        Yerel depolamada sertifika dosya sunucusu (yalnızca FILE_SERVER_URL
+        ayarlıysa), S3'te süreli imzalı URL kullanılır. Böylece dosya içeriği Streamlit bağlantısından geçmez ve
+        tarayıcı tarafından önbelleklenebilir.
+        
+        Args:
+            file_path: Dosya yolu
+            download_name: Verilirse tarayıcı dosyayı bu adla indirir
+        
+        Returns:
+            Dosya URL'i, doğrudan erişim mümkün değilse None
+        """
+        try:
+            if config.STORAGE_TYPE == "local":
+                if not config.FILE_SERVER_ENABLED or not config.FILE_SERVER_URL:
+                    return None
+                
+                url = f"{config.FILE_SERVER_URL.rstrip('/')}/{quote(file_path.replace(os.sep, '/'))}"
+                if download_name:
+                    url += "?" + urlencode({"download": download_name})
+                return url
+            elif config.STORAGE_TYPE == "s3":
+                import boto3
+                
+                s3_client = boto3.client(
+                    's3',
+                    aws_access_key_id=config.S3_ACCESS_KEY,
+                    aws_secret_access_key=config.S3_SECRET_KEY,
+                    region_name=config.S3_REGION
+                )
+                
+                params = {"Bucket": config.S3_BUCKET, "Key": file_path}
+                if download_name:
+                    params["ResponseContentDisposition"] = f"attachment; filename*=UTF-8''{quote(download_name)}"
+                
+                return s3_client.generate_presigned_url("get_object", Params=params, ExpiresIn=3600)
+            else:
+                raise ValueError(f"Geçersiz depolama türü: {config.STORAGE_TYPE}")
+        except Exception as e:
+            print(f"Dosya URL'i oluşturma hatası: {str(e)}")
+            return None
+    
+    def get_export_url(self, file_path, download_name):
+        """
+        Toplu dışa aktarma dosyası (ZIP, toplu PDF) için indirme URL'i döndürür
+        
+        Dışa aktarmalar her zaman yerel dışa aktarma klasörüne yazılır. S3'te
+        dosya diskten parça parça yüklenir ve süreli imzalı URL döndürülür.
+        Yerel depolamada dosya sunucusu yalnızca sertifikaları sunar (kimlik
+        doğrulaması yoktur, arşivler iletişim bilgisi içerir); None döner.
+        
+        Args:
+            file_path: Depo köküne göre dosya yolu (örn. exports/course_1_certificates.zip)
+            download_name: Tarayıcının kaydedeceği dosya adı
+        
+        Returns:
+            İndirme URL'i, doğrudan erişim mümkün değilse None
+        """
+        if config.STORAGE_TYPE != "s3":
+            return None
+        
+        try:
+            import boto3
+            
+            s3_client = boto3.client(
+                's3',
+                aws_access_key_id=config.S3_ACCESS_KEY,
+                aws_secret_access_key=config.S3_SECRET_KEY,
+                region_name=config.S3_REGION
+            )
+            
+            s3_client.upload_file(os.path.join(config.STORAGE_PATH, file_path), config.S3_BUCKET, file_path)
+            return self.get_file_url(file_path, download_name=download_name)
+        except Exception as e:
+            print(f"Dışa aktarma yükleme hatası: {str(e)}")
+            return None
+    
+    def export_certificates_zip(self, entries, output, chunk_size=1024 * 1024):
+        """
+        Sertifikaları bir ZIP arşivine akış halinde yazar
+        
+        Her dosya iter_file ile parça parça okunup arşive yazılır, bu nedenle
+        bellek kullanımı arşiv boyutundan bağımsızdır. Arşive öğrenci
+        bilgilerini içeren bir manifest.csv dosyası da eklenir.
+        
+        Args:
+            entries: (dosya adı, sertifika yolu, manifest satırı) üçlülerini üreten iterable
+            output: Çıktı dosyası yolu veya yazılabilir dosya nesnesi
+            chunk_size: Okuma/yazma parça boyutu
+            
+        Returns:
+            Arşive eklenen sertifika sayısı
+        """
+        # Zaten sıkıştırılmış formatlar tekrar sıkıştırılmaz
+        stored_extensions = {".pdf", ".png", ".jpg", ".jpeg"}
+        used_names = set()
+        manifest_rows = []
+        
+        try:
+            with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for file_name, certificate_path, manifest_row in entries:
+                    ext = os.path.splitext(certificate_path)[1].lower()
+                    
+                    # Aynı isimli öğrenciler için dosya adını benzersiz yap
+                    base_name = file_name
+                    counter = 2
+                    while f"{file_name}{ext}" in used_names:
+                        file_name = f"{base_name}-{counter}"
+                        counter += 1
+                    arcname = f"{file_name}{ext}"
+                    used_names.add(arcname)
+                    
+                    info = zipfile.ZipInfo(arcname, date_time=datetime.now().timetuple()[:6])
+                    info.compress_type = zipfile.ZIP_STORED if ext in stored_extensions else zipfile.ZIP_DEFLATED
+                    
+                    try:
+                        with archive.open(info, "w", force_zip64=True) as target:
+                            for chunk in self.iter_file(certificate_path, chunk_size):
+                                target.write(chunk)
+                        manifest_rows.append(dict(manifest_row, Dosya=arcname))
+                    except FileNotFoundError as e:
+                        print(f"Sertifika dosyası atlandı: {str(e)}")
+                        manifest_rows.append(dict(manifest_row, Dosya=""))
+                
+                # Manifest dosyası
+                with archive.open("manifest.csv", "w") as manifest_file:
+                    text_stream = io.TextIOWrapper(manifest_file, encoding="utf-8-sig", newline="")
+                    if manifest_rows:
+                        writer = csv.DictWriter(text_stream, fieldnames=list(manifest_rows[0].keys()))
+                        writer.writeheader()
+                        writer.writerows(manifest_rows)
+                    text_stream.flush()
+                    text_stream.detach()
+            
+            return sum(1 for row in manifest_rows if row["Dosya"])
+        except Exception as e:
+            print(f"ZIP dışa aktarma hatası: {str(e)}")
+            raise
+    
     def delete_file(self, file_path):
         """
         Dosyayı siler
@@ -306,29 +516,166 @@ class FileService:
         Returns:
             Oluşturulan sertifika dosyasının yolu
         """
+        # Dosya uzantısını al
+        ext = os.path.splitext(template_path)[1].lower()
+        template_type = {".html": "html", ".pdf": "pdf"}.get(ext, "image")
+        
         try:
-            # Şablon dosyasını oku
-            template_data = self.get_file(template_path)
+            with CERTIFICATE_RENDER_SECONDS.time(template_type=template_type):
+                # Şablon dosyasını oku
+                template_data = self.get_file(template_path)
             
-            # Dosya uzantısını al
-            ext = os.path.splitext(template_path)[1].lower()
+                # HTML şablonu ise HTML olarak oluştur
+                if ext == ".html":
+                    certificate_path = self._generate_html_certificate(template_data, replacements)
+                # PDF şablonu ise PDF olarak oluştur
+                elif ext == ".pdf":
+                    certificate_path = self._generate_pdf_certificate(template_data, replacements)
+                # Resim şablonu ise görüntü olarak oluştur
+                elif ext in [".jpg", ".jpeg", ".png"]:
+                    certificate_path = self._generate_image_certificate(template_data, replacements, ext)
+                else:
+                    # Desteklenmeyen format
+                    raise ValueError(f"Desteklenmeyen şablon formatı: {ext}")
             
-            # HTML şablonu ise HTML olarak oluştur
-            if ext == ".html":
-                return self._generate_html_certificate(template_data, replacements)
-            # PDF şablonu ise PDF olarak oluştur
-            elif ext == ".pdf":
-                return self._generate_pdf_certificate(template_data, replacements)
-            # Resim şablonu ise görüntü olarak oluştur
-            elif ext in [".jpg", ".jpeg", ".png"]:
-                return self._generate_image_certificate(template_data, replacements, ext)
-            else:
-                # Desteklenmeyen format
-                raise ValueError(f"Desteklenmeyen şablon formatı: {ext}")
+            CERTIFICATES_RENDERED.inc(template_type=template_type, status="success")
+            return certificate_path
         except Exception as e:
+            CERTIFICATES_RENDERED.inc(template_type=template_type, status="error")
             print(f"Sertifika oluşturma hatası: {str(e)}")
             raise
     
+    def generate_derivatives(self, certificate_path, kinds, verification_url=None):
+        """
+        Sertifikanın hazır türevlerini (PDF, web PNG, küçük resim, QR kod) üretir
+        
+        Türevler sertifika ile aynı klasöre, aynı temel adla kaydedilir. Bir
+        türev üretilemezse atlanır; sertifikanın kendisi etkilenmez.
+        
+        Args:
+            certificate_path: Sertifika dosyasının yolu
+            kinds: Üretilecek türler ('pdf', 'png', 'thumbnail', 'qr')
+            verification_url: QR koda yazılacak doğrulama linki
+            
+        Returns:
+            Tür -> dosya yolu sözlüğü
+        """
+        from PIL import Image
+        from utils.certificate_generator import CertificateGenerator
+        
+        derivatives = {}
+        if not kinds:
+            return derivatives
+        
+        base_path, ext = os.path.splitext(certificate_path)
+        ext = ext.lower()
+        certificate_data = self.get_file(certificate_path)
+        
+        # PDF türevi
+        pdf_bytes = None
+        try:
+            if ext == ".pdf":
+                pdf_bytes = certificate_data
+                if "pdf" in kinds:
+                    derivatives["pdf"] = certificate_path
+            elif ext == ".html":
+                pdf_bytes = CertificateGenerator.convert_html_to_pdf(certificate_data)
+            elif ext in [".jpg", ".jpeg", ".png"]:
+                pdf_bytes = CertificateGenerator.convert_image_to_pdf(certificate_data, cache_key=certificate_path)
+            
+            if "pdf" in kinds and ext != ".pdf" and pdf_bytes:
+                derivatives["pdf"] = self._save_derivative(f"{base_path}.pdf", pdf_bytes)
+        except Exception as e:
+            print(f"PDF türevi oluşturulamadı: {str(e)}")
+        
+        # Doğrulama QR kodu (görüntüleme sayfası her ziyarette yeniden üretmez)
+        if "qr" in kinds and verification_url:
+            try:
+                derivatives["qr"] = self._save_derivative(
+                    f"{base_path}_qr.png",
+                    QRCodeGenerator.generate_png(verification_url)
+                )
+            except Exception as e:
+                print(f"QR kod türevi oluşturulamadı: {str(e)}")
+        
+        # Resim türevleri tek bir kaynak görüntüden küçültülür
+        image_kinds = [kind for kind in ("png", "thumbnail") if kind in kinds]
+        if not image_kinds:
+            return derivatives
+        
+        try:
+            if ext in [".jpg", ".jpeg", ".png"]:
+                source_image = Image.open(io.BytesIO(certificate_data))
+            elif pdf_bytes:
+                source_image = self._rasterize_pdf(pdf_bytes, config.CERTIFICATE_WEB_WIDTH)
+            else:
+                source_image = None
+            
+            if source_image is None:
+                return derivatives
+            
+            source_image = source_image.convert("RGB")
+            widths = {
+                "png": config.CERTIFICATE_WEB_WIDTH,
+                "thumbnail": config.CERTIFICATE_THUMBNAIL_WIDTH
+            }
+            suffixes = {"png": "_web.png", "thumbnail": "_thumb.png"}
+            
+            for kind in image_kinds:
+                resized = source_image.copy()
+                resized.thumbnail((widths[kind], widths[kind]), Image.LANCZOS)
+                
+                buffer = io.BytesIO()
+                resized.save(buffer, format="PNG", optimize=True)
+                derivatives[kind] = self._save_derivative(f"{base_path}{suffixes[kind]}", buffer.getvalue())
+        except Exception as e:
+            print(f"Resim türevi oluşturulamadı: {str(e)}")
+        
+        return derivatives
+    
+    def _rasterize_pdf(self, pdf_bytes, width):
+        """
+        PDF'in ilk sayfasını verilen genişlikte resme çevirir
+        
+        Args:
+            pdf_bytes: PDF dosyasının bytes'ı
+            width: Hedef genişlik (piksel)
+            
+        Returns:
+            PIL Image nesnesi, pypdfium2 kurulu değilse None
+        """
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            print("PDF'ten resim üretmek için 'pypdfium2' paketi gerekli")
+            return None
+        
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            page = pdf[0]
+            return page.render(scale=width / page.get_width()).to_pil()
+        finally:
+            pdf.close()
+    
+    def _save_derivative(self, derivative_path, data):
+        """
+        Türev dosyasını depoya kaydeder
+        
+        Args:
+            derivative_path: Göreceli dosya yolu
+            data: Dosya içeriği (bytes)
+            
+        Returns:
+            Kaydedilen dosyanın göreceli yolu
+        """
+        full_path = os.path.join(config.STORAGE_PATH, derivative_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        
+        with open(full_path, "wb") as f:
+            f.write(data)
+        
+        return derivative_path
+    
     def _generate_html_certificate(self, template_data, replacements):
         """
         HTML sertifikası oluşturur
@@ -341,15 +688,7 @@ class FileService:
             Oluşturulan sertifika dosyasının yolu
         """
         try:
-            # HTML içeriğini string'e çevir
-            if isinstance(template_data, bytes):
-                html_content = template_data.decode('utf-8')
-            else:
-                html_content = str(template_data)
-            
-            # Placeholder'ları değiştir
-            for key, value in replacements.items():
-                html_content = html_content.replace(key, str(value))
+            html_content = self._fill_html_template(template_data, replacements)
             
             # Çıktı dosyası için geçici dosya oluştur
             output_filename = f"certificate_{uuid.uuid4()}.html"
@@ -368,6 +707,30 @@ class FileService:
             print(f"HTML sertifika oluşturma hatası: {str(e)}")
             raise
     
+    @staticmethod
+    def _fill_html_template(template_data, replacements):
+        """
+        HTML şablonundaki alanları doldurur
+        
+        Args:
+            template_data: HTML şablon içeriği
+            replacements: Değiştirilecek alanlar
+        
+        Returns:
+            Doldurulmuş HTML içeriği
+        """
+        # HTML içeriğini string'e çevir
+        if isinstance(template_data, bytes):
+            html_content = template_data.decode('utf-8')
+        else:
+            html_content = str(template_data)
+        
+        # Placeholder'ları değiştir
+        for key, value in replacements.items():
+            html_content = html_content.replace(key, str(value))
+        
+        return html_content
+    
     def _generate_pdf_certificate(self, template_data, replacements):
         """
         PDF sertifikası oluşturur
@@ -379,6 +742,9 @@ class FileService:
         Returns:
             Oluşturulan sertifika dosyasının yolu
         """
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4, landscape
+        
         # Bu örnekte basit bir PDF oluşturuyoruz
         # Gerçek uygulamada şablonu düzenlemek için PyPDF2 veya benzeri bir kütüphane kullanılabilir
         
@@ -391,44 +757,241 @@ class FileService:
         os.makedirs(os.path.dirname(full_output_path), exist_ok=True)
         
         # Yeni PDF oluştur
-        c = canvas.Canvas(full_output_path, pagesize=landscape(A4))
+        c = canvas.Canvas(full_output_path, pagesize=landscape(A4), invariant=1)
         width, height = landscape(A4)
         
-        # Font kaydet
+        self._draw_pdf_certificate_page(c, width, height, replacements)
+        
+        c.save()
+        
+        return output_path
+    
+    def generate_course_pdf(self, template_path, replacements_iter, output):
+        """
+        Bir eğitimin tüm sertifikalarını tek bir çok sayfalı PDF'te birleştirir
+        
+        Şablon dosyası bir kez okunur. Resim şablonları PDF'e tek bir form
+        nesnesi olarak gömülür ve her sayfada yeniden kullanılır; fontlar da
+        belge başına bir kez gömülür. Sayfalar üretildikleri anda sıkıştırılır.
+        HTML şablonları tek tek sertifikalarla aynı görünümde olsun diye her
+        öğrenci için HtmlPdfRenderer ile çizilip birleştirilir (bkz.
+        _generate_course_html_pdf).
+        
+        Args:
+            template_path: Şablon dosyasının yolu
+            replacements_iter: Her öğrenci için değiştirilecek alanları üreten iterable
+            output: Çıktı dosyası yolu veya yazılabilir dosya nesnesi
+            
+        Returns:
+            Oluşturulan sayfa sayısı
+        """
+        from PIL import Image
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.utils import ImageReader
+        
         try:
-            # Varsayılan font
-            pdfmetrics.registerFont(TTFont('DejaVuSans', 'DejaVuSans.ttf'))
-        except:
-            # Font bulunamazsa, yerleşik font kullan
-            pass
+            # Şablonu yalnızca bir kez oku
+            template_data = self.get_file(template_path)
+            ext = os.path.splitext(template_path)[1].lower()
+            
+            if ext == ".html":
+                return self._generate_course_html_pdf(template_data, replacements_iter, output)
+            
+            background = None
+            page_size = landscape(A4)
+            if ext in [".jpg", ".jpeg", ".png"]:
+                img = Image.open(io.BytesIO(template_data))
+                page_size = img.size
+                background = ImageReader(img)
+            
+            c = canvas.Canvas(output, pagesize=page_size, pageCompression=1, invariant=1)
+            width, height = page_size
+            
+            # Arka plan resmini tüm sayfaların paylaştığı bir form olarak kaydet
+            if background:
+                c.beginForm("sertifika_sablonu")
+                c.drawImage(background, 0, 0, width=width, height=height)
+                c.endForm()
+            
+            page_count = 0
+            for replacements in replacements_iter:
+                if background:
+                    c.doForm("sertifika_sablonu")
+                    self._draw_image_template_page(c, width, height, replacements)
+                else:
+                    # PDF şablonları için standart sayfa düzeni
+                    self._draw_pdf_certificate_page(c, width, height, replacements)
+                
+                c.showPage()
+                page_count += 1
+            
+            c.save()
+            return page_count
+        except Exception as e:
+            print(f"Toplu PDF oluşturma hatası: {str(e)}")
+            raise
+    
+    def _generate_course_html_pdf(self, template_data, replacements_iter, output):
+        """
+        HTML şablonlu eğitimin sertifikalarını tek PDF'te birleştirir
+        
+        Her öğrencinin HTML'i HtmlPdfRenderer ile PDF'e çevrilir; sonuçlar
+        HTML özetine göre önbelleklendiği için daha önce üretilmiş
+        sertifikalar yeniden çizilmez. Sayfalar PdfPageStreamWriter ile
+        çevrildikleri anda çıktıya yazılır, böylece bellek kullanımı eğitimdeki
+        öğrenci sayısıyla büyümez; sertifikalar arasında tekrarlanan resimler
+        tek nesneye indirilir.
+        
+        Args:
+            template_data: HTML şablon içeriği
+            replacements_iter: Her öğrenci için değiştirilecek alanları üreten iterable
+            output: Çıktı dosyası yolu veya yazılabilir dosya nesnesi
+        
+        Returns:
+            Oluşturulan sayfa sayısı
+        """
+        from utils.html_pdf_renderer import HtmlPdfRenderer
+        from utils.pdf_stream_writer import PdfPageStreamWriter
+        
+        with PdfPageStreamWriter(output) as writer:
+            for replacements in replacements_iter:
+                writer.append(HtmlPdfRenderer.render(self._fill_html_template(template_data, replacements)))
+        
+        return writer.page_count
+    
+    @staticmethod
+    def _get_pdf_fonts():
+        """
+        PDF sertifikalarında kullanılacak fontları döndürür
+        
+        DejaVuSans bulunursa bir kez kaydedilir (Türkçe karakter desteği),
+        bulunamazsa yerleşik Helvetica fontları kullanılır.
+        
+        Returns:
+            (normal font adı, kalın font adı)
+        """
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        
+        registered = pdfmetrics.getRegisteredFontNames()
+        if "DejaVuSans" not in registered:
+            try:
+                pdfmetrics.registerFont(TTFont('DejaVuSans', 'DejaVuSans.ttf'))
+                pdfmetrics.registerFont(TTFont('DejaVuSans-Bold', 'DejaVuSans-Bold.ttf'))
+            except Exception:
+                # Font bulunamazsa, yerleşik font kullan
+                return "Helvetica", "Helvetica-Bold"
+        return "DejaVuSans", "DejaVuSans-Bold"
+    
+    def _draw_pdf_certificate_page(self, c, width, height, replacements):
+        """
+        Standart PDF sertifika sayfasını çizer
+        
+        Args:
+            c: ReportLab canvas nesnesi
+            width: Sayfa genişliği
+            height: Sayfa yüksekliği
+            replacements: Değiştirilecek alanlar
+        """
+        normal_font, bold_font = self._get_pdf_fonts()
         
         # Başlık
-        c.setFont("Helvetica-Bold", 24)
+        c.setFont(bold_font, 24)
         c.drawCentredString(width/2, height-50, "SERTİFİKA")
         
         # Tarih
-        c.setFont("Helvetica", 12)
-        c.drawRightString(width-50, height-100, f"Tarih: {replacements.get('{{CompletionDate}}', datetime.now().strftime('%d.%m.%Y'))}")
+        c.setFont(normal_font, 12)
+        c.drawRightString(width-50, height-100, f"Tarih: {replacements.get('{{tarih}}', datetime.now().strftime('%d.%m.%Y'))}")
         
         # İçerik
-        c.setFont("Helvetica", 12)
-        text = f"Bu sertifika, {replacements.get('{{StudentName}}', 'Öğrenci')} isimli katılımcının"
+        c.setFont(normal_font, 12)
+        text = f"Bu sertifika, {replacements.get('{{ogrenci_adi}}', 'Öğrenci')} isimli katılımcının"
         c.drawCentredString(width/2, height/2 + 50, text)
         
-        c.setFont("Helvetica-Bold", 16)
-        course_name = replacements.get('{{CourseName}}', 'Eğitim')
+        c.setFont(bold_font, 16)
+        course_name = replacements.get('{{kurs_adi}}', 'Eğitim')
         c.drawCentredString(width/2, height/2, f'"{course_name}"')
         
-        c.setFont("Helvetica", 12)
+        c.setFont(normal_font, 12)
         c.drawCentredString(width/2, height/2 - 50, "eğitimini başarıyla tamamladığını belgelemektedir.")
         
         # İmza
         c.drawString(width-150, height/4, "____________________")
         c.drawString(width-150, height/4 - 20, "Yetkili İmza")
+    
+        # Doğrulama QR kodu
+        self._draw_pdf_qr_code(c, 50, 50, 100, replacements, normal_font)
+    
+    def _draw_image_template_page(self, c, width, height, replacements):
+        """
+        Resim şablonu üzerine sertifika metinlerini PDF olarak çizer
         
-        c.save()
+        Konumlar _generate_image_certificate ile aynıdır; PDF koordinat
+        sistemi alttan başladığı için y eksenleri çevrilir.
         
-        return output_path
+        Args:
+            c: ReportLab canvas nesnesi
+            width: Sayfa genişliği
+            height: Sayfa yüksekliği
+            replacements: Değiştirilecek alanlar
+        """
+        normal_font, bold_font = self._get_pdf_fonts()
+        c.setFillColorRGB(0, 0, 0)
+        
+        # Başlık
+        c.setFont(bold_font, 36)
+        c.drawCentredString(width/2, height - 50 - 36, "SERTİFİKA")
+        
+        # Tarih
+        completion_date = replacements.get('{{tarih}}', datetime.now().strftime('%d.%m.%Y'))
+        c.setFont(normal_font, 18)
+        c.drawRightString(width-50, height - 100 - 18, f"Tarih: {completion_date}")
+        
+        # İçerik
+        student_name = replacements.get('{{ogrenci_adi}}', 'Öğrenci')
+        c.setFont(normal_font, 24)
+        c.drawCentredString(width/2, height/2 + 50, f"Bu sertifika, {student_name} isimli katılımcının")
+        
+        course_name = replacements.get('{{kurs_adi}}', 'Eğitim')
+        c.setFont(bold_font, 36)
+        c.drawCentredString(width/2, height/2 - 12, f'"{course_name}"')
+        
+        c.setFont(normal_font, 24)
+        c.drawCentredString(width/2, height/2 - 58, "eğitimini başarıyla tamamladığını belgelemektedir.")
+        
+        # İmza
+        c.setFont(normal_font, 18)
+        c.drawString(width-150, 100 - 18, "____________________")
+        c.drawString(width-150, 70 - 18, "Yetkili İmza")
+        
+        # Doğrulama QR kodu
+        self._draw_pdf_qr_code(c, 50, 50, 100, replacements, normal_font)
+    
+    def _draw_pdf_qr_code(self, c, x, y, size, replacements, font_name):
+        """
+        Doğrulama linkinin QR kodunu PDF sayfasına çizer
+        
+        Args:
+            c: ReportLab canvas nesnesi
+            x: Sol alt köşe x koordinatı
+            y: Sol alt köşe y koordinatı
+            size: QR kodun kenar uzunluğu
+            replacements: Değiştirilecek alanlar
+            font_name: Alt yazı fontu
+        """
+        from reportlab.lib.utils import ImageReader
+        
+        verification_url = replacements.get('{{dogrulama_linki}}')
+        if not verification_url:
+            return
+        
+        qr_png = QRCodeGenerator.generate_png(verification_url)
+        c.drawImage(ImageReader(io.BytesIO(qr_png)), x, y, width=size, height=size)
+        c.setFont(font_name, 8)
+        c.drawCentredString(x + size/2, y - 10, "Doğrulama Kodu")
+        if replacements.get('{{dogrulama_kodu}}'):
+            c.drawCentredString(x + size/2, y - 20, replacements['{{dogrulama_kodu}}'])
     
     def _generate_image_certificate(self, template_data, replacements, ext):
         """
@@ -442,6 +1005,8 @@ class FileService:
         Returns:
             Oluşturulan sertifika dosyasının yolu
         """
+        from PIL import Image, ImageDraw, ImageFont
+        
         # Şablon görüntüsünü aç
         img = Image.open(io.BytesIO(template_data))
         draw = ImageDraw.Draw(img)
@@ -464,15 +1029,15 @@ class FileService:
         draw.text((width/2, 50), "SERTİFİKA", font=font_large, fill=(0, 0, 0), anchor="mt")
         
         # Tarih
-        completion_date = replacements.get('{{CompletionDate}}', datetime.now().strftime('%d.%m.%Y'))
+        completion_date = replacements.get('{{tarih}}', datetime.now().strftime('%d.%m.%Y'))
         draw.text((width-50, 100), f"Tarih: {completion_date}", font=font_small, fill=(0, 0, 0), anchor="rt")
         
         # İçerik
-        student_name = replacements.get('{{StudentName}}', 'Öğrenci')
+        student_name = replacements.get('{{ogrenci_adi}}', 'Öğrenci')
         text = f"Bu sertifika, {student_name} isimli katılımcının"
         draw.text((width/2, height/2 - 50), text, font=font_medium, fill=(0, 0, 0), anchor="mm")
         
-        course_name = replacements.get('{{CourseName}}', 'Eğitim')
+        course_name = replacements.get('{{kurs_adi}}', 'Eğitim')
         draw.text((width/2, height/2), f'"{course_name}"', font=font_large, fill=(0, 0, 0), anchor="mm")
         
         draw.text((width/2, height/2 + 50), "eğitimini başarıyla tamamladığını belgelemektedir.", 
@@ -482,6 +1047,18 @@ class FileService:
         draw.text((width-150, height-100), "____________________", font=font_small, fill=(0, 0, 0))
         draw.text((width-150, height-70), "Yetkili İmza", font=font_small, fill=(0, 0, 0))
         
+        # Doğrulama QR kodu (PDF çıktısıyla aynı konumda)
+        verification_url = replacements.get('{{dogrulama_linki}}')
+        if verification_url:
+            qr_size = max(100, min(width, height) // 8)
+            qr_img = Image.open(io.BytesIO(QRCodeGenerator.generate_png(verification_url)))
+            qr_img = qr_img.convert(img.mode).resize((qr_size, qr_size), Image.NEAREST)
+            img.paste(qr_img, (50, height - 50 - qr_size))
+        
+            verification_code = replacements.get('{{dogrulama_kodu}}')
+            if verification_code:
+                draw.text((50 + qr_size/2, height - 40), verification_code, font=font_small, fill=(0, 0, 0), anchor="mt")
+        
         # Çıktı dosyası için geçici dosya oluştur
         output_filename = f"certificate_{uuid.uuid4()}{ext}"
         output_path = os.path.join("certificates", output_filename)
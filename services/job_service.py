@@ -0,0 +1,638 @@
+from sqlalchemy import or_, and_, func
+from sqlalchemy.exc import SQLAlchemyError
+from db.database import get_session
+from db.models import Course, Student, Job, JobItem
+import datetime
+import os
+import socket
+import threading
+import config
+
+# İş türleri ve adımların başlangıç durumu
+JOB_KINDS = {
+    "complete_course": "pending",  # Eğitimi tamamla, tüm sertifikaları üret ve gönder
+    "generate_certificates": "pending",  # Sertifikası olmayan öğrencilere üret ve gönder
+    "send_emails": "rendered"  # Sertifikası olan öğrencilere yalnızca e-posta gönder
+}
+
+# Bu durumlardaki adımlar tamamlanmış sayılır
+FINISHED_ITEM_STATES = ["emailed", "skipped", "failed"]
+
+class JobLeaseLost(Exception):
+    """İş, kira süresi dolduğu için başka bir süreç tarafından devralındı"""
+
+class JobService:
+    """Kalıcı, kaldığı yerden devam edebilen toplu işler için servis sınıfı"""
+    
+    @staticmethod
+    def create_completion_job(course_id):
+        """
+        Eğitim tamamlama işini oluşturur
+        
+        Eğitim tamamlandı olarak işaretlenir ve eğitimi tamamlayan her öğrenci
+        için sertifika üretme ve e-posta gönderme adımı kaydedilir.
+        
+        Args:
+            course_id: Eğitim ID'si
+        
+        Returns:
+            İş ID'si, başarısız durumda None
+        """
+        return JobService.create_job(course_id, "complete_course")
+    
+    @staticmethod
+    def create_job(course_id, kind):
+        """
+        Eğitim için toplu iş oluşturur
+        
+        İşin türüne göre seçilen her öğrenci için bir adım kaydedilir (bkz.
+        JOB_KINDS). Aynı eğitim için aynı türde yarım kalmış bir iş varsa yeni
+        iş açılmaz; mevcut işe henüz adımı olmayan öğrenciler eklenir ve iş
+        yeniden kuyruğa alınarak döndürülür.
+        
+        Args:
+            course_id: Eğitim ID'si
+            kind: İş türü ('complete_course', 'generate_certificates', 'send_emails')
+        
+        Returns:
+            İş ID'si, başarısız durumda None
+        """
+        if kind not in JOB_KINDS:
+            print(f"Bilinmeyen iş türü: {kind}")
+            return None
+        
+        try:
+            session = get_session()
+            course = session.query(Course).filter(Course.id == course_id).first()
+            
+            if not course:
+                return None
+            
+            # Yarım kalmış (bekleyen, çalışan veya hata ile kesilmiş) iş varsa ondan devam edilir
+            job = session.query(Job).filter(
+                Job.kind == kind,
+                Job.course_id == course_id,
+                Job.status.in_(["pending", "running", "failed"])
+            ).order_by(Job.id.desc()).first()
+            
+            if job:
+                if job.status == "failed":
+                    job.status = "pending"
+            else:
+                if kind == "complete_course":
+                    # Eğitimi tamamlandı olarak işaretle
+                    course.is_completed = True
+            
+                job = Job(kind=kind, course_id=course_id, status="pending")
+                session.add(job)
+                session.flush()
+            
+            # Mevcut işte adımı olmayan öğrenciler eklenir; iş oluşturulduktan
+            # sonra tamamladı olarak işaretlenen öğrenciler de böylece işlenir
+            students_query = session.query(Student.id).filter(
+                Student.course_id == course_id,
+                Student.has_completed_course == True,
+                ~Student.id.in_(session.query(JobItem.student_id).filter(JobItem.job_id == job.id))
+            )
+            if kind == "generate_certificates":
+                students_query = students_query.filter(Student.certificate_url == None)
+            elif kind == "send_emails":
+                students_query = students_query.filter(Student.certificate_url != None)
+            
+            student_ids = [student_id for (student_id,) in students_query.order_by(Student.id)]
+            
+            # E-posta işinde sertifika üretme adımı atlanır
+            initial_state = JOB_KINDS[kind]
+            session.bulk_insert_mappings(JobItem, [
+                {"job_id": job.id, "student_id": student_id, "state": initial_state}
+                for student_id in student_ids
+            ])
+            job.total = (job.total or 0) + len(student_ids)
+            
+            session.commit()
+            return job.id
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"Veritabanı hatası: {str(e)}")
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def requeue_job(job_id, retry_failed=False):
+        """
+        Biten veya hata ile kesilen işi arka planda tekrar çalışmak üzere kuyruğa alır
+        
+        Args:
+            job_id: İş ID'si
+            retry_failed: True ise başarısız adımlar yeniden denenir
+        
+        Returns:
+            Başarılı durumda True, başarısız durumda False
+        """
+        try:
+            session = get_session()
+            job = session.query(Job).filter(Job.id == job_id).first()
+            
+            if not job:
+                return False
+            
+            if retry_failed:
+                session.query(JobItem).filter(
+                    JobItem.job_id == job_id,
+                    JobItem.state == "failed"
+                ).update({"state": "pending"}, synchronize_session=False)
+            
+            if job.status != "running":
+                job.status = "pending"
+            
+            session.commit()
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"Veritabanı hatası: {str(e)}")
+            return False
+        finally:
+            session.close()
+    
+    @staticmethod
+    def next_runnable_job():
+        """
+        Arka planda çalıştırılacak sıradaki işi bulur
+        
+        Bekleyen işler ile süreci ölmüş (kira süresi dolmuş) çalışan işler
+        en eskiden başlayarak seçilir. Hata ile kesilen işler kullanıcı
+        yeniden başlatmadıkça seçilmez.
+        
+        Returns:
+            İş ID'si, çalıştırılacak iş yoksa None
+        """
+        lease_expired = datetime.datetime.utcnow() - datetime.timedelta(seconds=config.JOB_LEASE_SECONDS)
+        
+        try:
+            session = get_session()
+            job = session.query(Job.id).filter(
+                or_(
+                    Job.status == "pending",
+                    and_(
+                        Job.status == "running",
+                        or_(Job.heartbeat_at == None, Job.heartbeat_at < lease_expired)
+                    )
+                )
+            ).order_by(Job.id).first()
+            
+            return job.id if job else None
+        except SQLAlchemyError as e:
+            print(f"Veritabanı hatası: {str(e)}")
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def run_job(job_id, email_service=None, file_service=None, chunk_size=None, retry_failed=False):
+        """
+        Toplu işi yürütür
+        
+        Öğrenciler parça parça işlenir. Her öğrenciden ve her e-postadan
+        sonra işin kirası yenilenir; iş bu arada başka bir sürece geçtiyse
+        (ör. bu süreç JOB_LEASE_SECONDS süresinden uzun takıldıysa) yürütme
+        durur. İş yarıda kesilirse (hata, yeniden başlatma) tekrar
+        çağrıldığında yalnızca kalan adımlar yapılır: sertifikası üretilmiş
+        öğrenciler yeniden üretilmez, e-postası gönderilmiş öğrencilere
+        tekrar gönderilmez.
+        
+        Args:
+            job_id: İş ID'si
+            email_service: E-posta servisi (opsiyonel)
+            file_service: Dosya servisi (opsiyonel)
+            chunk_size: Bir seferde okunan ve e-postaları birlikte gönderilen öğrenci sayısı (opsiyonel)
+            retry_failed: True ise başarısız adımlar yeniden denenir
+        
+        Returns:
+            İşin son durumu (bkz. get_job), iş başka bir süreçte çalışıyorsa None
+        """
+        if not email_service:
+            from services.email_service import EmailService
+            email_service = EmailService()
+        
+        if not file_service:
+            from services.file_service import FileService
+            file_service = FileService()
+        
+        chunk_size = chunk_size or config.JOB_CHUNK_SIZE
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        
+        try:
+            session = get_session()
+            # İlerleme her öğrenciden sonra kaydedilir; nesneler her kayıttan sonra yeniden okunmaz
+            session.expire_on_commit = False
+            
+            if not JobService._claim_job(session, job_id, worker_id):
+                print(f"İş #{job_id} başka bir süreç tarafından yürütülüyor veya bitmiş")
+                return None
+            
+            job = session.query(Job).filter(Job.id == job_id).first()
+            course = session.query(Course).filter(Course.id == job.course_id).first()
+            
+            try:
+                # Gönderim sırasında kesilen adımlarda e-posta gitmiş olabilir; tekrar
+                # gönderilmez, başarısız olarak işaretlenir (retry_failed ile yeniden denenir)
+                session.query(JobItem).filter(
+                    JobItem.job_id == job_id,
+                    JobItem.state == "sending"
+                ).update({
+                    "state": "failed",
+                    "error": "E-posta gönderimi yarıda kesildi, gönderilmiş olabilir"
+                }, synchronize_session=False)
+                session.commit()
+                
+                if retry_failed:
+                    session.query(JobItem).filter(
+                        JobItem.job_id == job_id,
+                        JobItem.state == "failed"
+                    ).update({"state": "pending"}, synchronize_session=False)
+                    session.commit()
+                
+                # Şablon bir kez okunur; özet tüm öğrencilerin parmak izine girer
+                template_version = None
+                if course.certificate_template_url:
+                    template_version = file_service.get_file_version(course.certificate_template_url)
+                
+                while True:
+                    # Önce sertifikası üretilmiş ama e-postası gitmemiş öğrenciler
+                    items = JobService._next_items(session, job_id, "rendered", chunk_size)
+                    if items:
+                        JobService._email_items(session, job_id, worker_id, items, email_service)
+                        continue
+                    
+                    items = JobService._next_items(session, job_id, "pending", chunk_size)
+                    if not items:
+                        break
+                    
+                    JobService._render_items(session, job_id, worker_id, course, items, file_service, template_version)
+                
+                JobService._finish_job(session, job_id, worker_id, {"status": "completed"})
+                
+                # İş biterken create_job ile yeni öğrenci eklendiyse iş yeniden kuyruğa alınır
+                if JobService._next_items(session, job_id, "pending", 1):
+                    JobService.requeue_job(job_id)
+            except JobLeaseLost:
+                # İşi devralan süreç kalan adımlara devam eder; bu süreç hiçbir şey yazmaz
+                print(f"İş #{job_id} başka bir sürece geçti, bu süreçte durduruldu")
+                return None
+            except Exception as e:
+                # Kaydedilen ilerleme korunur; iş tekrar çalıştırıldığında devam eder
+                session.rollback()
+                try:
+                    JobService._finish_job(session, job_id, worker_id, {"status": "failed", "error": str(e)})
+                except JobLeaseLost:
+                    return None
+                print(f"İş #{job_id} başarısız oldu: {str(e)}")
+            
+            return JobService.get_job(job_id)
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"Veritabanı hatası: {str(e)}")
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def get_job(job_id):
+        """
+        İşin durumunu ve ilerlemesini getirir
+        
+        Args:
+            job_id: İş ID'si
+        
+        Returns:
+            İş bilgileri, bulunamazsa None
+        """
+        try:
+            session = get_session()
+            job = session.query(Job).filter(Job.id == job_id).first()
+            
+            if not job:
+                return None
+            
+            return JobService._job_to_dict(session, job)
+        except SQLAlchemyError as e:
+            print(f"Veritabanı hatası: {str(e)}")
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def list_jobs(course_id=None, limit=10):
+        """
+        Son işleri listeler
+        
+        Args:
+            course_id: Yalnızca bu eğitimin işleri (opsiyonel)
+            limit: En fazla kaç iş döndürüleceği
+        
+        Returns:
+            İş bilgileri listesi (en yeni önce)
+        """
+        try:
+            session = get_session()
+            query = session.query(Job)
+            
+            if course_id is not None:
+                query = query.filter(Job.course_id == course_id)
+            
+            jobs = query.order_by(Job.id.desc()).limit(limit).all()
+            return [JobService._job_to_dict(session, job) for job in jobs]
+        except SQLAlchemyError as e:
+            print(f"Veritabanı hatası: {str(e)}")
+            return []
+        finally:
+            session.close()
+    
+    @staticmethod
+    def get_job_failures(job_id, limit=100):
+        """
+        İşin başarısız adımlarını getirir
+        
+        Args:
+            job_id: İş ID'si
+            limit: En fazla kaç adım döndürüleceği
+        
+        Returns:
+            Öğrenci bilgisi ve hata mesajı içeren liste
+        """
+        try:
+            session = get_session()
+            rows = session.query(JobItem, Student).outerjoin(
+                Student, Student.id == JobItem.student_id
+            ).filter(
+                JobItem.job_id == job_id,
+                JobItem.state == "failed"
+            ).order_by(JobItem.id).limit(limit).all()
+            
+            return [
+                {
+                    "student_id": item.student_id,
+                    "name": f"{student.first_name} {student.last_name}" if student else "",
+                    "email": student.email if student else "",
+                    "error": item.error,
+                    "attempts": item.attempts,
+                    "updated_at": item.updated_at
+                }
+                for item, student in rows
+            ]
+        except SQLAlchemyError as e:
+            print(f"Veritabanı hatası: {str(e)}")
+            return []
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _job_to_dict(session, job):
+        """
+        İş kaydını adım sayıları, ilerleme ve tahmini kalan süre ile sözlüğe çevirir
+        
+        Tahmini kalan süre, iş başladığından beri tamamlanan adımların hızından
+        hesaplanır.
+        """
+        counts = dict(
+            session.query(JobItem.state, func.count(JobItem.id))
+            .filter(JobItem.job_id == job.id)
+            .group_by(JobItem.state)
+            .all()
+        )
+        
+        processed = sum(counts.get(state, 0) for state in FINISHED_ITEM_STATES)
+        remaining = max(job.total - processed, 0)
+        
+        elapsed_seconds = None
+        eta_seconds = None
+        if job.started_at:
+            end = job.finished_at if job.status in ["completed", "failed"] else datetime.datetime.utcnow()
+            elapsed_seconds = max((end - job.started_at).total_seconds(), 0)
+            
+            if job.status == "running" and processed and remaining:
+                eta_seconds = elapsed_seconds / processed * remaining
+        
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "course_id": job.course_id,
+            "total": job.total,
+            "counts": counts,
+            "processed": processed,
+            "progress": processed / job.total if job.total else 1.0,
+            "elapsed_seconds": elapsed_seconds,
+            "eta_seconds": eta_seconds,
+            "error": job.error,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at
+        }
+    
+    @staticmethod
+    def _claim_job(session, job_id, worker_id):
+        """
+        İşi bu süreç adına kilitler
+        
+        Bekleyen işler ile ilerleme kaydı JOB_LEASE_SECONDS süresinden eski
+        olan (süreci ölmüş) çalışan işler devralınabilir. Koşullu tek bir
+        UPDATE kullanıldığından aynı işi iki süreç birden alamaz.
+        
+        Returns:
+            İş alındıysa True
+        """
+        now = datetime.datetime.utcnow()
+        lease_expired = now - datetime.timedelta(seconds=config.JOB_LEASE_SECONDS)
+        
+        claimed = session.query(Job).filter(
+            Job.id == job_id,
+            or_(
+                Job.status.in_(["pending", "failed"]),
+                and_(
+                    Job.status == "running",
+                    or_(Job.heartbeat_at == None, Job.heartbeat_at < lease_expired)
+                )
+            )
+        ).update({
+            "status": "running",
+            "worker_id": worker_id,
+            "heartbeat_at": now,
+            "error": None,
+            "finished_at": None,
+            "started_at": func.coalesce(Job.started_at, now)
+        }, synchronize_session=False)
+        session.commit()
+        
+        return claimed == 1
+    
+    @staticmethod
+    def _next_items(session, job_id, state, limit):
+        """Verilen durumdaki sıradaki adımları getirir"""
+        return session.query(JobItem).filter(
+            JobItem.job_id == job_id,
+            JobItem.state == state
+        ).order_by(JobItem.id).limit(limit).all()
+    
+    @staticmethod
+    def _extend_lease(session, job_id, worker_id, values=None):
+        """
+        İş hâlâ bu süreçteyse kirasını uzatır (ve verilen alanları yazar)
+        
+        Koşullu tek bir UPDATE kullanılır; iş başka bir sürece geçtiyse
+        hiçbir satır değişmez.
+        
+        Returns:
+            Kira uzatıldıysa True
+        """
+        renewed = session.query(Job).filter(
+            Job.id == job_id,
+            Job.worker_id == worker_id,
+            Job.status == "running"
+        ).update({"heartbeat_at": datetime.datetime.utcnow(), **(values or {})}, synchronize_session=False)
+        
+        return renewed == 1
+    
+    @staticmethod
+    def _checkpoint(session, job_id, worker_id):
+        """
+        İlerlemeyi kaydeder ve işin kira süresini uzatır
+        
+        İş başka bir sürece geçtiyse kaydedilmemiş değişiklikler geri alınır
+        ve JobLeaseLost yükseltilir.
+        """
+        if not JobService._extend_lease(session, job_id, worker_id):
+            session.rollback()
+            raise JobLeaseLost(f"İş #{job_id} başka bir süreç tarafından devralındı")
+        session.commit()
+    
+    @staticmethod
+    def _finish_job(session, job_id, worker_id, values):
+        """İşi verilen durumla bitirir; iş başka bir sürece geçtiyse JobLeaseLost"""
+        if not JobService._extend_lease(session, job_id, worker_id, {"finished_at": datetime.datetime.utcnow(), **values}):
+            session.rollback()
+            raise JobLeaseLost(f"İş #{job_id} başka bir süreç tarafından devralındı")
+        session.commit()
+    
+    @staticmethod
+    def _renew_lease(job_id, worker_id):
+        """
+        İşin kirasını ayrı bir oturumda uzatır (toplu gönderim sürerken)
+        
+        Returns:
+            İş başka bir sürece geçtiyse False
+        """
+        try:
+            session = get_session()
+            renewed = JobService._extend_lease(session, job_id, worker_id)
+            session.commit()
+            return renewed
+        except SQLAlchemyError as e:
+            # Tek bir yenileme kaçırılırsa kira hemen dolmaz; gönderim sürer
+            session.rollback()
+            print(f"Veritabanı hatası: {str(e)}")
+            return True
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _render_items(session, job_id, worker_id, course, items, file_service, template_version):
+        """
+        Bir parça öğrencinin sertifikasını üretir ve her öğrenciden sonra ilerlemeyi kaydeder
+        
+        Girdileri değişmemiş sertifikalar 'skipped' olarak işaretlenir ve
+        e-postaları tekrar gönderilmez; daha önce başarısız olmuş adımlar ise
+        yeniden denenirken e-posta adımına geçer. Yeniden üretilen
+        sertifikaların eski dosyaları ilerleme kaydedildikten sonra silinir.
+        """
+        from services.course_service import CourseService
+        
+        students = {
+            student.id: student
+            for student in session.query(Student).filter(Student.id.in_([item.student_id for item in items]))
+        }
+        
+        for item in items:
+            student = students.get(item.student_id)
+            retrying = item.error is not None
+            item.attempts += 1
+            item.error = None
+            obsolete_files = []
+            
+            # Öğrenci silinmiş veya tamamlama durumu geri alınmışsa atla
+            if student is None or not student.has_completed_course:
+                item.state = "skipped"
+            else:
+                try:
+                    _, rendered = CourseService.issue_certificate(
+                        student, course, file_service, template_version, obsolete_files=obsolete_files
+                    )
+                    item.state = "rendered" if rendered or retrying else "skipped"
+                except Exception as e:
+                    item.state = "failed"
+                    item.error = f"Sertifika oluşturulamadı: {str(e)}"
+            
+            JobService._checkpoint(session, job_id, worker_id)
+            
+            for file_path in obsolete_files:
+                file_service.delete_file(file_path)
+    
+    @staticmethod
+    def _email_items(session, job_id, worker_id, items, email_service):
+        """
+        Sertifikası üretilmiş öğrencilere e-posta gönderir
+        
+        Parçadaki e-postalar eşzamanlı gönderilir (bkz.
+        EmailService.send_certificate_emails). Gönderimden önce adımlar
+        'sending' olarak kaydedilir; iş kesilse bile aynı öğrenciye ikinci
+        kez e-posta gitmez. Kira her gönderimden sonra yenilenir; iş başka bir
+        sürece geçtiyse kalan e-postalar gönderilmez. Günlük kota dolduğu için gönderilmeyen adımlar
+        'rendered' durumuna döner ve iş durdurulur; iş devam ettirildiğinde
+        bu öğrencilere gönderilir.
+        """
+        from services.email_service import EmailQuotaExceeded
+        
+        students = {
+            student.id: student
+            for student in session.query(Student).filter(Student.id.in_([item.student_id for item in items]))
+        }
+        
+        sending_items = []
+        recipients = []
+        for item in items:
+            student = students.get(item.student_id)
+            if student is None:
+                item.state = "skipped"
+                continue
+            
+            item.state = "sending"
+            sending_items.append(item)
+            recipients.append((
+                student.email,
+                f"{student.first_name} {student.last_name}",
+                f"{config.BASE_URL}/?token={student.certificate_access_token}"
+            ))
+            
+        # Gönderimden önce kayıt: süreç bu noktada ölürse öğrenciler tekrar e-posta almaz
+        JobService._checkpoint(session, job_id, worker_id)
+        
+        results = email_service.send_certificate_emails(
+            recipients,
+            on_sent=lambda: JobService._renew_lease(job_id, worker_id)
+        )
+        
+        quota_exhausted = False
+        for item, sent in zip(sending_items, results):
+            if sent:
+                item.state = "emailed"
+            elif sent is None:
+                item.state = "rendered"
+                quota_exhausted = True
+            else:
+                item.state = "failed"
+                item.error = "E-posta gönderilemedi"
+        JobService._checkpoint(session, job_id, worker_id)
+
+        if quota_exhausted:
+            raise EmailQuotaExceeded("Günlük e-posta kotası doldu; kalan e-postalar iş devam ettirildiğinde gönderilir")
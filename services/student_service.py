@@ -1,14 +1,19 @@
 from sqlalchemy.exc import SQLAlchemyError
 from db.database import get_session
-from db.models import Student, Course
+from db.models import Student, Course, CertificateDerivative, JobItem
 import uuid
-import pandas as pd
 import io
 import config
 from services.file_service import FileService
 from services.email_service import EmailService
-import datetime
+from utils.certificate_generator import CertificateGenerator
+from utils.log_helper import get_logger, log_event
+import logging
+from utils.metrics import instrument
 
+logger = get_logger("student")
+
+@instrument
 class StudentService:
     """Öğrenci işlemleri için servis sınıfı"""
     
@@ -33,6 +38,12 @@ class StudentService:
                 
             students = session.query(Student).filter(Student.course_id == course_id).all()
             
+            # Tüm türevleri tek sorguda al
+            derivatives = StudentService._get_derivatives_by_student(
+                session,
+                CertificateDerivative.student.has(Student.course_id == course_id)
+            )
+            
             result = []
             for student in students:
                 result.append({
@@ -44,13 +55,17 @@ class StudentService:
                     "has_completed_course": student.has_completed_course,
                     "certificate_url": student.certificate_url,
                     "certificate_access_token": student.certificate_access_token,
+                    "certificate_number": student.certificate_number,
+                    "certificate_issued_at": student.certificate_issued_at,
+                    "verification_code": StudentService._get_verification_code(student),
                     "course_id": student.course_id,
-                    "course_name": course.name
+                    "course_name": course.name,
+                    "derivatives": derivatives.get(student.id, {})
                 })
             
             return result
         except SQLAlchemyError as e:
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return []
         finally:
             session.close()
@@ -84,11 +99,15 @@ class StudentService:
                 "has_completed_course": student.has_completed_course,
                 "certificate_url": student.certificate_url,
                 "certificate_access_token": student.certificate_access_token,
+                "certificate_number": student.certificate_number,
+                "certificate_issued_at": student.certificate_issued_at,
+                "verification_code": StudentService._get_verification_code(student),
                 "course_id": student.course_id,
-                "course_name": course.name if course else ""
+                "course_name": course.name if course else "",
+                "derivatives": {d.kind: d.file_url for d in student.derivatives}
             }
         except SQLAlchemyError as e:
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return None
         finally:
             session.close()
@@ -124,15 +143,97 @@ class StudentService:
                 "has_completed_course": student.has_completed_course,
                 "certificate_url": student.certificate_url,
                 "certificate_access_token": student.certificate_access_token,
+                "certificate_number": student.certificate_number,
+                "certificate_issued_at": student.certificate_issued_at,
+                "verification_code": StudentService._get_verification_code(student),
                 "course_id": student.course_id,
-                "course_name": course.name if course else ""
+                "course_name": course.name if course else "",
+                "derivatives": {d.kind: d.file_url for d in student.derivatives}
             }
         except SQLAlchemyError as e:
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return None
         finally:
             session.close()
     
+    @staticmethod
+    def get_student_by_certificate_code(certificate_number, code):
+        """
+        Sertifika numarası ve doğrulama kodu ile öğrenci bilgilerini getirir
+        
+        Basılı sertifikada token yer almadığından sertifika üzerindeki numara
+        ve doğrulama kodu ile doğrulama yapılır (bkz. CertificateGenerator.verify_code).
+        
+        Args:
+            certificate_number: Sertifika numarası
+            code: Doğrulama kodu
+        
+        Returns:
+            Öğrenci bilgileri (bkz. get_student_by_token), kod eşleşmezse None
+        """
+        try:
+            session = get_session()
+            student = session.query(Student).filter(
+                Student.certificate_number == certificate_number.strip()
+            ).first()
+            
+            if not student or not student.certificate_issued_at:
+                return None
+            
+            if not CertificateGenerator.verify_code(
+                code,
+                student.certificate_number,
+                student.certificate_access_token,
+                student.certificate_issued_at
+            ):
+                return None
+            
+            access_token = student.certificate_access_token
+        except SQLAlchemyError as e:
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
+            return None
+        finally:
+            session.close()
+        
+        return StudentService.get_student_by_token(access_token)
+    
+    @staticmethod
+    def _get_derivatives_by_student(session, criterion):
+        """
+        Sertifika türevlerini öğrenci bazında gruplar
+        
+        Args:
+            session: Veritabanı oturumu
+            criterion: CertificateDerivative sorgusu için filtre
+            
+        Returns:
+            Öğrenci ID -> {tür: dosya yolu} sözlüğü
+        """
+        result = {}
+        for derivative in session.query(CertificateDerivative).filter(criterion):
+            result.setdefault(derivative.student_id, {})[derivative.kind] = derivative.file_url
+        return result
+    
+    @staticmethod
+    def _get_verification_code(student):
+        """
+        Öğrencinin sertifika doğrulama kodunu döndürür
+        
+        Args:
+            student: Öğrenci nesnesi
+        
+        Returns:
+            Doğrulama kodu, sertifika henüz verilmediyse None
+        """
+        if not student.certificate_number or not student.certificate_issued_at:
+            return None
+        
+        return CertificateGenerator.verification_code(
+            student.certificate_number,
+            student.certificate_access_token,
+            student.certificate_issued_at
+        )
+    
     @staticmethod
     def create_student(student_data):
         """
@@ -159,7 +260,7 @@ class StudentService:
             ).first()
             
             if existing_student:
-                print(f"Bu e-posta adresi ile aynı kursa daha önce kayıt yapılmış: {student_data['email']}")
+                log_event(logger, logging.WARNING, "Bu e-posta adresi ile aynı kursa daha önce kayıt yapılmış", email=student_data["email"], course_id=student_data["course_id"])
                 return False
                 
             new_student = Student(
@@ -178,10 +279,10 @@ class StudentService:
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return False
         except KeyError as e:
-            print(str(e))
+            log_event(logger, logging.WARNING, str(e))
             return False
         finally:
             session.close()
@@ -215,10 +316,10 @@ class StudentService:
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return False
         except KeyError as e:
-            print(str(e))
+            log_event(logger, logging.WARNING, str(e))
             return False
         finally:
             session.close()
@@ -240,16 +341,18 @@ class StudentService:
             
             if not student:
                 raise KeyError(f"Öğrenci bulunamadı: ID {student_id}")
-                
+            
+            # Öğrencinin iş adımlarını sil (yabancı anahtarlar denetlenir)
+            session.query(JobItem).filter(JobItem.student_id == student_id).delete(synchronize_session=False)
             session.delete(student)
             session.commit()
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return False
         except KeyError as e:
-            print(str(e))
+            log_event(logger, logging.WARNING, str(e))
             return False
         finally:
             session.close()
@@ -266,6 +369,9 @@ class StudentService:
         Returns:
             Başarılı içe aktarma durumunda True, başarısız durumda False
         """
+        # pandas yalnızca içe aktarmada gerekir; sertifika görüntüleme sayfası yüklemez
+        import pandas as pd
+        
         try:
             session = get_session()
             
@@ -330,13 +436,13 @@ class StudentService:
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return False
         except (KeyError, ValueError) as e:
-            print(str(e))
+            log_event(logger, logging.WARNING, str(e))
             return False
         except Exception as e:
-            print(f"Excel okuma hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Excel okuma hatası", error=str(e))
             return False
         finally:
             session.close()
@@ -364,7 +470,7 @@ class StudentService:
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return False
         finally:
             session.close()
@@ -392,11 +498,158 @@ class StudentService:
             return True
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
             return False
         finally:
             session.close()
     
+    @staticmethod
+    def _set_completion(session, student_ids, completed):
+        """
+        Öğrencilerin tamamlama durumunu parça parça UPDATE ile değiştirir
+        
+        Her parça tek bir UPDATE ... WHERE id IN (...) sorgusudur; durumu zaten
+        istenen değerde olanlar sayılmaz. İşlemi çağıran onaylar.
+        
+        Returns:
+            Durumu değişen öğrenci sayısı
+        """
+        ids = list(dict.fromkeys(student_ids))
+        chunk_size = max(1, config.BULK_UPDATE_CHUNK_SIZE)
+        updated = 0
+        
+        for start in range(0, len(ids), chunk_size):
+            updated += session.query(Student).filter(
+                Student.id.in_(ids[start:start + chunk_size]),
+                Student.has_completed_course.is_not(completed)
+            ).update({Student.has_completed_course: completed}, synchronize_session=False)
+        
+        return updated
+    
+    @staticmethod
+    def mark_students_by_ids(student_ids, completed=True, course_id=None):
+        """
+        Seçilen öğrencileri tek işlemde tamamladı/tamamlamadı olarak işaretler
+        
+        Args:
+            student_ids: Öğrenci ID'leri listesi (tekrarlananlar bir kez sayılır)
+            completed: Yeni tamamlama durumu
+            course_id: Verilirse yalnızca bu eğitimin öğrencileri işaretlenir
+        
+        Returns:
+            {"requested", "updated"} sözlüğü, başarısız durumda None
+        """
+        # Liste bir kez tekilleştirilir; iterator verilse de aşağıda tekrar okunabilir
+        student_ids = list(dict.fromkeys(student_ids))
+        
+        try:
+            session = get_session()
+            
+            ids = student_ids
+            if course_id is not None and ids:
+                # Başka eğitimin öğrencileri seçimde olsa bile değiştirilmez
+                chunk_size = max(1, config.BULK_UPDATE_CHUNK_SIZE)
+                ids = [
+                    student_id
+                    for start in range(0, len(ids), chunk_size)
+                    for (student_id,) in session.query(Student.id).filter(
+                        Student.id.in_(ids[start:start + chunk_size]),
+                        Student.course_id == course_id
+                    )
+                ]
+            
+            updated = StudentService._set_completion(session, ids, completed)
+            session.commit()
+            
+            log_event(logger, logging.INFO, "Toplu durum güncellendi", course_id=course_id, completed=completed, requested=len(student_ids), updated=updated)
+            return {"requested": len(student_ids), "updated": updated}
+        except SQLAlchemyError as e:
+            session.rollback()
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def mark_all_students_in_course(course_id, completed=True):
+        """
+        Eğitimin tüm öğrencilerini tek UPDATE ile işaretler
+        
+        Args:
+            course_id: Eğitim ID'si
+            completed: Yeni tamamlama durumu
+        
+        Returns:
+            {"updated"} sözlüğü, başarısız durumda None
+        """
+        try:
+            session = get_session()
+            updated = session.query(Student).filter(
+                Student.course_id == course_id,
+                Student.has_completed_course.is_not(completed)
+            ).update({Student.has_completed_course: completed}, synchronize_session=False)
+            session.commit()
+            
+            log_event(logger, logging.INFO, "Toplu durum güncellendi", course_id=course_id, completed=completed, updated=updated)
+            return {"updated": updated}
+        except SQLAlchemyError as e:
+            session.rollback()
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
+            return None
+        finally:
+            session.close()
+    
+    @staticmethod
+    def mark_students_by_emails(course_id, emails, completed=True):
+        """
+        E-posta listesindeki öğrencileri tek işlemde işaretler (yoklama listesi vb.)
+        
+        E-postalar büyük/küçük harf ve baştaki/sondaki boşluklar gözetilmeden
+        eşleştirilir. Aynı e-postayla kayıtlı birden çok öğrenci varsa hepsi
+        işaretlenir.
+        
+        Args:
+            course_id: Eğitim ID'si
+            emails: E-posta adresleri listesi
+            completed: Yeni tamamlama durumu
+        
+        Returns:
+            {"matched", "updated", "not_found"} sözlüğü, başarısız durumda None
+        """
+        from sqlalchemy import func
+        
+        wanted = list(dict.fromkeys(email.strip().lower() for email in emails if email and email.strip()))
+        
+        try:
+            session = get_session()
+            
+            chunk_size = max(1, config.BULK_UPDATE_CHUNK_SIZE)
+            ids = []
+            found = set()
+            for start in range(0, len(wanted), chunk_size):
+                rows = session.query(Student.id, func.lower(Student.email)).filter(
+                    Student.course_id == course_id,
+                    func.lower(Student.email).in_(wanted[start:start + chunk_size])
+                ).all()
+                ids.extend(student_id for student_id, _ in rows)
+                found.update(email for _, email in rows)
+            
+            updated = StudentService._set_completion(session, ids, completed)
+            session.commit()
+            
+            log_event(logger, logging.INFO, "Toplu durum güncellendi", course_id=course_id, completed=completed, emails=len(wanted), updated=updated)
+            return {
+                "matched": len(ids),
+                "updated": updated,
+                "not_found": [email for email in wanted if email not in found]
+            }
+        except SQLAlchemyError as e:
+            session.rollback()
+            log_event(logger, logging.ERROR, "Veritabanı hatası", error=str(e))
+            return None
+        finally:
+            session.close()
+    
     @staticmethod
     def send_certificate_email(student_id):
         """
@@ -408,108 +661,63 @@ class StudentService:
         Returns:
             Başarılı gönderim durumunda True, başarısız durumda False
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[STUDENT SERVICE] [{timestamp}] Sertifika e-postası gönderimi başlatılıyor...")
-        print(f"[STUDENT SERVICE] [{timestamp}] Öğrenci ID: {student_id}")
-        
         try:
             session = get_session()
             student = session.query(Student).filter(Student.id == student_id).first()
             
             if not student:
-                print(f"[STUDENT SERVICE] [{timestamp}] ❌ Öğrenci bulunamadı: ID {student_id}")
+                log_event(logger, logging.WARNING, "Öğrenci bulunamadı", student_id=student_id)
                 return False
                 
-            print(f"[STUDENT SERVICE] [{timestamp}] Öğrenci bulundu: {student.first_name} {student.last_name}")
-            print(f"[STUDENT SERVICE] [{timestamp}] E-posta: {student.email}")
-            print(f"[STUDENT SERVICE] [{timestamp}] Eğitimi tamamladı mı: {student.has_completed_course}")
-            
             if not student.has_completed_course:
-                print(f"[STUDENT SERVICE] [{timestamp}] ❌ Öğrenci eğitimi tamamlamamış!")
+                log_event(logger, logging.WARNING, "Öğrenci eğitimi tamamlamamış", student_id=student_id)
                 return False
                 
             course = session.query(Course).filter(Course.id == student.course_id).first()
             if not course:
-                print(f"[STUDENT SERVICE] [{timestamp}] ❌ Eğitim bulunamadı: ID {student.course_id}")
+                log_event(logger, logging.WARNING, "Eğitim bulunamadı", student_id=student_id, course_id=student.course_id)
                 return False
                 
-            print(f"[STUDENT SERVICE] [{timestamp}] Eğitim bulundu: {course.name}")
-            print(f"[STUDENT SERVICE] [{timestamp}] Sertifika URL: {student.certificate_url}")
+            email_service = EmailService()
+            certificate_created = False
             
             # Sertifika yoksa oluştur
             if not student.certificate_url:
-                print(f"[STUDENT SERVICE] [{timestamp}] Sertifika oluşturuluyor...")
                 file_service = FileService()
-                email_service = EmailService()
-                
-                # Sertifika için değiştirilecek alanlar
-                replacements = {
-                    "{{ogrenci_adi}}": f"{student.first_name} {student.last_name}",
-                    "{{kurs_adi}}": course.name,
-                    "{{egitmen_adi}}": course.instructor_name or "Eğitmen Adı",
-                    "{{tarih}}": datetime.datetime.now().strftime("%d.%m.%Y"),
-                    "{{sertifika_no}}": f"{datetime.datetime.now().strftime('%Y%m%d')}{student.id:04d}"
-                }
                 
-                print(f"[STUDENT SERVICE] [{timestamp}] Sertifika şablonu: {course.certificate_template_url}")
-                print(f"[STUDENT SERVICE] [{timestamp}] Değiştirilecek alanlar: {replacements}")
-                
-                # Sertifika oluştur
-                certificate_path = file_service.generate_certificate(
-                    course.certificate_template_url,
-                    replacements
-                )
+                # Sertifikayı ve türevlerini oluştur
+                from services.course_service import CourseService
+                certificate_path, _ = CourseService.issue_certificate(student, course, file_service)
                 
-                if certificate_path:
-                    print(f"[STUDENT SERVICE] [{timestamp}] ✅ Sertifika oluşturuldu: {certificate_path}")
-                    student.certificate_url = certificate_path
-                    session.commit()
-                else:
-                    print(f"[STUDENT SERVICE] [{timestamp}] ❌ Sertifika oluşturulamadı!")
+                if not certificate_path:
+                    log_event(logger, logging.ERROR, "Sertifika oluşturulamadı", student_id=student_id, template=course.certificate_template_url)
                     return False
                 
-                # E-posta gönder
-                certificate_link = f"{config.BASE_URL}/?token={student.certificate_access_token}"
-                print(f"[STUDENT SERVICE] [{timestamp}] Sertifika linki: {certificate_link}")
+                session.commit()
+                certificate_created = True
                 
-                email_result = email_service.send_certificate_email(
-                    student.email,
-                    f"{student.first_name} {student.last_name}",
-                    certificate_link
-                )
-                
-                if email_result:
-                    print(f"[STUDENT SERVICE] [{timestamp}] ✅ Sertifika e-postası başarıyla gönderildi!")
-                else:
-                    print(f"[STUDENT SERVICE] [{timestamp}] ❌ Sertifika e-postası gönderilemedi!")
-                
-                return email_result
-            else:
-                print(f"[STUDENT SERVICE] [{timestamp}] Sertifika zaten mevcut, sadece e-posta gönderiliyor...")
-                # Sertifika zaten var, sadece e-posta gönder
-                email_service = EmailService()
-                certificate_link = f"{config.BASE_URL}/?token={student.certificate_access_token}"
-                print(f"[STUDENT SERVICE] [{timestamp}] Sertifika linki: {certificate_link}")
-                
-                email_result = email_service.send_certificate_email(
-                    student.email,
-                    f"{student.first_name} {student.last_name}",
-                    certificate_link
-                )
-                
-                if email_result:
-                    print(f"[STUDENT SERVICE] [{timestamp}] ✅ Sertifika e-postası başarıyla gönderildi!")
-                else:
-                    print(f"[STUDENT SERVICE] [{timestamp}] ❌ Sertifika e-postası gönderilemedi!")
+            # E-posta gönder
+            certificate_link = f"{config.BASE_URL}/?token={student.certificate_access_token}"
+            email_result = email_service.send_certificate_email(
+                student.email,
+                f"{student.first_name} {student.last_name}",
+                certificate_link
+            )
                 
-                return email_result
+            log_event(
+                logger, logging.INFO if email_result else logging.WARNING, "Sertifika e-postası",
+                student_id=student_id,
+                course_id=course.id,
+                certificate_created=certificate_created,
+                sent=email_result
+            )
+            return email_result
         except SQLAlchemyError as e:
             session.rollback()
-            print(f"[STUDENT SERVICE] [{timestamp}] ❌ Veritabanı hatası: {str(e)}")
+            log_event(logger, logging.ERROR, "Veritabanı hatası", student_id=student_id, error=str(e))
             return False
         except Exception as e:
-            print(f"[STUDENT SERVICE] [{timestamp}] ❌ Genel hata: {str(e)}")
-            print(f"[STUDENT SERVICE] [{timestamp}] Hata türü: {type(e).__name__}")
+            log_event(logger, logging.ERROR, "Sertifika e-postası hatası", student_id=student_id, error_type=type(e).__name__, error=str(e))
             return False
         finally:
             session.close()
@@ -5,7 +5,7 @@ setup(
     version="1.0.0",
     packages=find_packages(),
     install_requires=[
-        "streamlit>=1.32.0",
+        "streamlit>=1.52.0",
         "pandas>=2.2.0",
         "pillow>=10.4.0",
         "openpyxl>=3.1.4",
@@ -20,6 +20,9 @@ setup(
         "email-validator>=2.2.0",
         "altair>=5.3.0",
         "cryptography>=42.0.0",
+        "xhtml2pdf>=0.2.16",
+        "pypdf>=5.0.0",
+        "pypdfium2>=4.30.0",
     ],
     python_requires=">=3.11",
     author="Certificate System",
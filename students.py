@@ -1,12 +1,10 @@
 import streamlit as st
 import pandas as pd
 import io
-from utils.auth_helpers import auth_required
 from services.course_service import CourseService
 from services.student_service import StudentService
 from utils.excel_helper import ExcelHelper
 
-@auth_required
 def show():
     """Öğrenciler sayfasını gösterir"""
     
@@ -19,39 +17,6 @@ def show():
     
     st.title("Öğrenciler")
     
-    # Kullanıcı bilgileri
-    st.sidebar.success(f"Hoş geldiniz, {st.session_state['username']}!")
-    
-    # Navigasyon
-    with st.sidebar:
-        st.title("Menü")
-        if st.button("Ana Sayfa", use_container_width=True):
-            st.session_state["current_page"] = "dashboard"
-            st.rerun()
-        
-        if st.button("Eğitimler", use_container_width=True):
-            st.session_state["current_page"] = "courses"
-            st.rerun()
-            
-        if st.button("Öğrenciler", use_container_width=True):
-            st.session_state["current_page"] = "students"
-            st.rerun()
-            
-        if st.button("Sertifikalar", use_container_width=True):
-            st.session_state["current_page"] = "certificates"
-            st.rerun()
-            
-        if st.button("Çıkış Yap", use_container_width=True):
-            # Oturum bilgilerini temizle
-            st.session_state.pop("token", None)
-            st.session_state.pop("user_id", None)
-            st.session_state.pop("username", None)
-            st.session_state.pop("email", None)
-            st.session_state.pop("role", None)
-            
-            st.session_state["current_page"] = "login"
-            st.rerun()
-    
     # Servis nesnelerini oluştur
     course_service = CourseService()
     student_service = StudentService()
@@ -150,32 +115,88 @@ def show():
         
         with col1:
             if st.button("Tümünü Tamamladı İşaretle", use_container_width=True):
-                success_count = 0
-                for student in students:
-                    if not student['has_completed_course']:
-                        if student_service.mark_student_as_completed(student['id']):
-                            success_count += 1
+                result = student_service.mark_all_students_in_course(selected_course_id, completed=True)
                 
-                if success_count > 0:
-                    st.success(f"{success_count} öğrenci başarıyla tamamladı olarak işaretlendi!")
+                if result is None:
+                    st.error("İşlem sırasında bir hata oluştu!")
+                elif result["updated"] > 0:
+                    st.success(f"{result['updated']} öğrenci başarıyla tamamladı olarak işaretlendi!")
                     st.rerun()
                 else:
                     st.info("İşaretlenecek öğrenci bulunamadı.")
         
         with col2:
             if st.button("Tümünü Tamamlamadı İşaretle", use_container_width=True):
-                success_count = 0
-                for student in students:
-                    if student['has_completed_course']:
-                        if student_service.mark_student_as_not_completed(student['id']):
-                            success_count += 1
+                result = student_service.mark_all_students_in_course(selected_course_id, completed=False)
                 
-                if success_count > 0:
-                    st.success(f"{success_count} öğrenci başarıyla tamamlamadı olarak işaretlendi!")
+                if result is None:
+                    st.error("İşlem sırasında bir hata oluştu!")
+                elif result["updated"] > 0:
+                    st.success(f"{result['updated']} öğrenci başarıyla tamamlamadı olarak işaretlendi!")
                     st.rerun()
                 else:
                     st.info("İşaretlenecek öğrenci bulunamadı.")
         
+        # Seçilen öğrencileri işaretle (filtre ve sıralama seçeneklere uygulanır)
+        student_labels = {s["id"]: f"{s['first_name']} {s['last_name']} ({s['email'] or 'e-posta yok'})" for s in sorted_students}
+        selection_key = f"bulk_selection_{selected_course_id}"
+        selected_ids = st.multiselect(
+            "Öğrenci seçin",
+            options=list(student_labels.keys()),
+            format_func=lambda x: student_labels.get(x, str(x)),
+            key=selection_key,
+            placeholder="İşaretlenecek öğrencileri seçin"
+        )
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            mark_selected = st.button("Seçilenleri Tamamladı İşaretle", use_container_width=True, disabled=not selected_ids)
+        with col2:
+            unmark_selected = st.button("Seçilenleri Tamamlamadı İşaretle", use_container_width=True, disabled=not selected_ids)
+        
+        if mark_selected or unmark_selected:
+            result = student_service.mark_students_by_ids(selected_ids, completed=mark_selected, course_id=selected_course_id)
+            
+            if result is None:
+                st.error("İşlem sırasında bir hata oluştu!")
+            else:
+                st.success(f"{result['updated']} öğrenci güncellendi ({result['requested']} seçili).")
+                del st.session_state[selection_key]
+                st.rerun()
+        
+        # Yoklama listesi gibi bir e-posta listesinden işaretle
+        with st.expander("📋 E-posta listesinden işaretle"):
+            st.write("Excel ('E-posta' sütunu) veya her satırda bir adres olan metin/CSV dosyası yükleyin.")
+            
+            email_file = st.file_uploader("E-posta listesi", type=["xlsx", "xls", "csv", "txt"], key=f"bulk_emails_{selected_course_id}")
+            mark_as = st.radio("Durum", ["Tamamladı", "Tamamlamadı"], horizontal=True, key=f"bulk_emails_status_{selected_course_id}")
+            
+            if email_file is not None and st.button("Listedekileri İşaretle"):
+                try:
+                    emails = ExcelHelper.read_email_list(email_file.getvalue(), email_file.name)
+                except Exception as e:
+                    st.error(f"Dosya okunamadı: {str(e)}")
+                    emails = None
+                
+                if emails is not None and not emails:
+                    st.warning("Dosyada e-posta adresi bulunamadı.")
+                elif emails:
+                    result = student_service.mark_students_by_emails(selected_course_id, emails, completed=mark_as == "Tamamladı")
+                    
+                    if result is None:
+                        st.error("İşlem sırasında bir hata oluştu!")
+                    else:
+                        # Liste yenilendikten sonra gösterilir
+                        st.session_state["bulk_email_result"] = {"emails": len(emails), **result}
+                        st.rerun()
+            
+            result = st.session_state.pop("bulk_email_result", None)
+            if result:
+                st.success(f"{result['emails']} adresten {result['matched']} öğrenci eşleşti, {result['updated']} öğrenci güncellendi.")
+                if result["not_found"]:
+                    st.warning(f"Bu eğitimde bulunamayan {len(result['not_found'])} adres: " + ", ".join(result["not_found"][:20]) + (" ..." if len(result["not_found"]) > 20 else ""))
+        
         # col3 kaldırıldı - "Tamamlayanlara Mail Gönder" butonu kaldırıldı
         
         # Öğrenci listesi
@@ -1,11 +1,9 @@
 import streamlit as st
-from utils.auth_helpers import auth_required, admin_required
 from services.auth_service import AuthService
 from services.email_service import EmailService
 import secrets
 import string
 
-@admin_required
 def show():
     """Kullanıcı yönetimi sayfasını gösterir (sadece admin)"""
     
@@ -18,9 +16,6 @@ def show():
     
     st.title("👥 Kullanıcı Yönetimi")
     
-    # Kullanıcı bilgileri
-    st.sidebar.success(f"Hoş geldiniz, {st.session_state['username']}!")
-    
     # Tab'lar
     tab1, tab2 = st.tabs(["📋 Kullanıcı Listesi", "➕ Yeni Kullanıcı Ekle"])
     
@@ -1,7 +1,9 @@
 import jwt
+import uuid
 import streamlit as st
 import datetime
 import config
+from utils.metrics_exporter import session_seen, session_ended
 
 def check_jwt():
     """
@@ -34,6 +36,11 @@ def check_jwt():
         if now_timestamp > exp_timestamp:
             return False
         
+        # Etkin oturum sayısı metriği için tarayıcı oturumu işaretlenir
+        if "session_id" not in st.session_state:
+            st.session_state["session_id"] = uuid.uuid4().hex
+        session_seen(st.session_state["session_id"])
+        
         return True
         
     except jwt.ExpiredSignatureError:
@@ -133,6 +140,10 @@ def logout():
     """
     Kullanıcı oturumunu sonlandırır
     """
+    # Oturum etkin oturumlardan çıkarılır
+    if "session_id" in st.session_state:
+        session_ended(st.session_state.pop("session_id"))
+    
     # Kullanıcı bilgilerini temizle
     st.session_state["user_id"] = None
     st.session_state["username"] = None
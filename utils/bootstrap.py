@@ -0,0 +1,84 @@
+import os
+import threading
+import config
+
+# Yerel depolamada açılışta hazırlanan klasörler
+STORAGE_FOLDERS = ["certificate-templates", "certificates"]
+
+_bootstrapped = False
+_bootstrap_lock = threading.Lock()
+
+def init_app(create_admin=True):
+    """
+    Uygulamanın kalıcı kaynaklarını hazırlar
+    
+    Veritabanı tablolarını oluşturur, eksik sütunları ekler, depolama
+    klasörlerini açar ve admin kullanıcısı yoksa oluşturur. Tekrar
+    çalıştırılması güvenlidir; deploy sırasında scripts/init_app.py ile de
+    çağrılır.
+    
+    Args:
+        create_admin: False ise admin kullanıcısı kontrol edilmez
+    """
+    from db.database import init_db
+    
+    # Modellerin tabloları metadata'ya kaydolsun diye yüklenir; tablolar
+    # tüm modeller yüklendikten sonra oluşturulur
+    import db.models  # noqa: F401
+    
+    init_db()
+    
+    if config.STORAGE_TYPE == "local":
+        for folder in STORAGE_FOLDERS:
+            os.makedirs(os.path.join(config.STORAGE_PATH, folder), exist_ok=True)
+    
+    if create_admin:
+        from services.auth_service import AuthService
+        
+        try:
+            AuthService.ensure_admin_user()
+        except Exception as e:
+            # Admin oluşturulamasa da uygulama açılır
+            print(f"Admin kullanıcısı kontrol edilemedi: {str(e)}")
+
+def bootstrap():
+    """
+    Uygulama açılış işlerini işlem başına bir kez yapar
+    
+    Streamlit her etkileşimde app.py'yi baştan çalıştırır; bu fonksiyon
+    yalnızca ilk çalıştırmada veritabanına gider, sonraki çağrılarda tek bir
+    bayrak kontrolüyle döner. DB_AUTO_INIT kapalıysa veritabanı ve admin
+    hazırlığı deploy sırasında scripts/init_app.py ile yapılmış kabul edilir.
+    Dosya sunucusu, metrik sunucusu ve arka plan iş çalıştırıcısı her
+    durumda başlatılır (ayarlarda kapatılmadıysa).
+    """
+    global _bootstrapped
+    
+    if _bootstrapped:
+        return
+    
+    with _bootstrap_lock:
+        if _bootstrapped:
+            return
+        
+        if config.QUERY_PROFILER_ENABLED:
+            from db.profiler import install_profiler
+            install_profiler()
+        
+        if config.DB_AUTO_INIT:
+            init_app()
+        
+        from utils.file_server import start_file_server
+        from utils.job_runner import start_job_runner
+        from utils.metrics_exporter import start_metrics_exporter
+        
+        # Sertifika dosya sunucusunu başlat
+        start_file_server()
+        
+        # Prometheus metrik sunucusunu başlat
+        start_metrics_exporter()
+        
+        # Arka plan iş çalıştırıcısını başlat; yarım kalan işler kaldığı yerden devam eder
+        start_job_runner()
+        
+        _bootstrapped = True
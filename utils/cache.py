@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+
+class BytesLRUCache:
+    """Toplam boyutu bayt cinsinden sınırlı, thread-safe LRU önbellek"""
+    
+    # Ad -> önbellek (metrik sunucusu isabet oranlarını buradan okur)
+    _named = {}
+    
+    def __init__(self, max_bytes, name=None):
+        """
+        Önbelleği başlatır
+        
+        Args:
+            max_bytes: Önbellekte tutulacak en fazla toplam bayt
+            name: Metriklerde görünen ad (None ise metriklere eklenmez)
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        
+        if name:
+            BytesLRUCache._named[name] = self
+    
+    @classmethod
+    def named_caches(cls):
+        """Adı verilmiş önbellekleri döndürür (ad -> önbellek)"""
+        return dict(cls._named)
+    
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür
+        
+        Returns:
+            {hits, misses, entries, size_bytes} sözlüğü
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._items), "size_bytes": self._size}
+    
+    def get(self, key):
+        """
+        Anahtara karşılık gelen değeri döndürür
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Önbellekteki bytes, yoksa None
+        """
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+    
+    def set(self, key, value):
+        """
+        Değeri önbelleğe ekler, sınır aşılırsa en eski kayıtları atar
+        
+        Args:
+            key: Önbellek anahtarı
+            value: Saklanacak bytes
+        """
+        with self._lock:
+            if key in self._items:
+                self._size -= len(self._items.pop(key))
+            
+            self._items[key] = value
+            self._size += len(value)
+            
+            while self._size > self.max_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+    
+    def get_or_compute(self, key, compute):
+        """
+        Değeri önbellekten döndürür, yoksa hesaplayıp ekler
+        
+        Aynı anahtar için eşzamanlı istekler hesaplamayı yalnızca bir kez yapar,
+        diğerleri sonucu bekler.
+        
+        Args:
+            key: Önbellek anahtarı
+            compute: Değeri üreten parametresiz fonksiyon
+            
+        Returns:
+            Önbellekteki veya yeni hesaplanan bytes
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        try:
+            with key_lock:
+                # Beklerken başka bir istek hesaplamış olabilir (isabet sayılmaz)
+                with self._lock:
+                    value = self._items.get(key)
+                if value is None:
+                    value = compute()
+                    self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+    
+    def clear(self):
+        """Önbelleği boşaltır"""
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+    
+    def __len__(self):
+        return len(self._items)
@@ -1,21 +1,72 @@
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.colors import HexColor
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from PIL import Image, ImageDraw, ImageFont
 import io
 import os
+import hashlib
+import hmac
 from datetime import datetime
 import uuid
 import config
 import base64
+from utils.cache import BytesLRUCache
+from utils.qr_helper import QRCodeGenerator
+
+# Doğrulama kodunun uzunluğu: HMAC-SHA256 özetinin base32 gösteriminin ilk
+# karakterleri (8 karakter = 40 bit). Sertifikadan elle yazılabilecek kadar
+# kısa tutulur; kod tek başına değil sertifika numarasıyla birlikte denetlenir.
+VERIFICATION_CODE_LENGTH = 8
 
 class CertificateGenerator:
     """Sertifika oluşturma yardımcı sınıfı"""
     
+    # Resimden üretilen PDF'ler için sertifika başına önbellek
+    _image_pdf_cache = BytesLRUCache(config.PDF_CACHE_MAX_BYTES, name="image_pdf")
+    
+    @staticmethod
+    def verification_code(certificate_number, access_token, issued_at):
+        """
+        Sertifikanın doğrulama kodunu hesaplar
+        
+        Kod, sertifika numarası, erişim tokeni ve veriliş tarihinin gizli
+        anahtarla imzalanmış özetidir. Aynı sertifika için her zaman aynı kod
+        üretilir; veritabanına bakmadan yeniden hesaplanarak doğrulanabilir.
+        Özetin tamamı değil, base32 gösteriminin ilk VERIFICATION_CODE_LENGTH
+        karakteri kullanılır (bir numara için rastgele tahminin tutma
+        olasılığı 2^-40).
+        
+        Args:
+            certificate_number: Sertifika numarası
+            access_token: Sertifika erişim tokeni
+            issued_at: Veriliş tarihi (datetime veya date)
+        
+        Returns:
+            VERIFICATION_CODE_LENGTH karakterlik doğrulama kodu (büyük harf ve 2-7)
+        """
+        message = f"{certificate_number}|{access_token}|{issued_at.strftime('%Y-%m-%d')}"
+        digest = hmac.new(config.CERTIFICATE_SECRET.encode("utf-8"), message.encode("utf-8"), hashlib.sha256)
+        return base64.b32encode(digest.digest()).decode("ascii")[:VERIFICATION_CODE_LENGTH]
+    
+    @staticmethod
+    def verify_code(code, certificate_number, access_token, issued_at):
+        """
+        Doğrulama kodunun sertifika bilgileriyle eşleşip eşleşmediğini kontrol eder
+        
+        Büyük/küçük harf ve baştaki/sondaki boşluklar önemsenmez.
+        
+        Args:
+            code: Kontrol edilecek doğrulama kodu
+            certificate_number: Sertifika numarası
+            access_token: Sertifika erişim tokeni
+            issued_at: Veriliş tarihi
+        
+        Returns:
+            Kod geçerliyse True
+        """
+        if not code:
+            return False
+        expected = CertificateGenerator.verification_code(certificate_number, access_token, issued_at)
+        return hmac.compare_digest(expected, code.strip().upper())
+    
     @staticmethod
-    def generate_pdf_certificate(student_name, course_name, completion_date, output_path=None):
+    def generate_pdf_certificate(student_name, course_name, completion_date, output_path=None, verification_url=None, verification_code=None):
         """
         PDF sertifikası oluşturur
         
@@ -24,10 +75,17 @@ class CertificateGenerator:
             course_name: Eğitim adı
             completion_date: Tamamlama tarihi
             output_path: Çıktı dosyası yolu (None ise geçici dosya oluşturur)
+            verification_url: Doğrulama linki (verilirse QR kod olarak çizilir)
+            verification_code: Doğrulama kodu (bkz. verification_code)
             
         Returns:
             Oluşturulan sertifika dosyasının yolu
         """
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.utils import ImageReader
+        
         # Çıktı dosyası yolu
         if not output_path:
             output_filename = f"certificate_{uuid.uuid4()}.pdf"
@@ -36,8 +94,8 @@ class CertificateGenerator:
             # Dizin oluştur
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Yeni PDF oluştur
-        c = canvas.Canvas(output_path, pagesize=landscape(A4))
+        # Yeni PDF oluştur (aynı girdiler aynı baytları üretsin diye zaman damgası yazılmaz)
+        c = canvas.Canvas(output_path, pagesize=landscape(A4), invariant=1)
         width, height = landscape(A4)
         
         # Arka plan rengi
@@ -100,13 +158,17 @@ class CertificateGenerator:
         c.drawString(width-200, height/4 - 20, "____________________")
         c.drawString(width-200, height/4 - 40, "Yetkili İmza")
         
-        # QR kod için bir kutu (gerçek uygulamada QR kod kütüphanesi ile oluşturulabilir)
+        # Doğrulama QR kodu
         c.setStrokeColor(HexColor("#34495e"))
         c.setLineWidth(1)
         c.rect(50, 50, 100, 100, stroke=True, fill=False)
+        if verification_url:
+            qr_png = QRCodeGenerator.generate_png(verification_url)
+            c.drawImage(ImageReader(io.BytesIO(qr_png)), 51, 51, width=98, height=98)
         c.setFont(normal_font, 8)
         c.drawCentredString(100, 40, "Doğrulama Kodu")
-        c.drawCentredString(100, 30, str(uuid.uuid4())[:8])
+        if verification_code:
+            c.drawCentredString(100, 30, verification_code)
         
         c.save()
         
@@ -117,40 +179,24 @@ class CertificateGenerator:
         """
         HTML içeriğini PDF'e çevirir
         
+        Dönüştürme, önceden ısıtılmış işçi havuzunda bellekte yapılır ve sonuç
+        HTML içeriğinin özetine göre önbelleklenir.
+        
         Args:
             html_content: HTML içeriği
-            output_path: Çıktı dosyası yolu
+            output_path: Çıktı dosyası yolu (verilirse PDF ayrıca buraya yazılır)
             
         Returns:
             PDF dosyasının bytes'ı
         """
         try:
-            # WeasyPrint veya pdfkit kullanılabilir
-            # Şimdilik basit bir PDF oluşturalım
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import A4, landscape
-            
-            if not output_path:
-                output_path = f"temp_certificate_{uuid.uuid4()}.pdf"
+            from utils.html_pdf_renderer import HtmlPdfRenderer
             
-            # PDF oluştur
-            c = canvas.Canvas(output_path, pagesize=landscape(A4))
-            width, height = landscape(A4)
+            pdf_bytes = HtmlPdfRenderer.render(html_content)
             
-            # HTML içeriğini basit metin olarak ekle
-            c.setFont("Helvetica", 12)
-            c.drawString(50, height-50, "HTML Sertifikası")
-            c.drawString(50, height-100, "Bu sertifika HTML formatından dönüştürülmüştür.")
-            
-            c.save()
-            
-            # PDF'i bytes olarak oku
-            with open(output_path, 'rb') as f:
-                pdf_bytes = f.read()
-            
-            # Geçici dosyayı sil
-            if os.path.exists(output_path):
-                os.remove(output_path)
+            if output_path:
+                with open(output_path, 'wb') as f:
+                    f.write(pdf_bytes)
             
             return pdf_bytes
             
@@ -159,55 +205,57 @@ class CertificateGenerator:
             return None
     
     @staticmethod
-    def convert_image_to_pdf(image_data, output_path=None):
+    def convert_image_to_pdf(image_data, output_path=None, cache_key=None):
         """
         Resim dosyasını PDF'e çevirir
         
+        PDF doğrudan bellekte oluşturulur. Sonuç sertifika başına önbelleklenir;
+        önbellekte varsa resim hiç çözülmeden aynı bytes döndürülür.
+        
         Args:
             image_data: Resim dosyasının bytes'ı
-            output_path: Çıktı dosyası yolu
+            output_path: Çıktı dosyası yolu (verilirse PDF ayrıca buraya yazılır)
+            cache_key: Önbellek anahtarı, örn. sertifika yolu (None ise içerik özeti kullanılır)
             
         Returns:
             PDF dosyasının bytes'ı
         """
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.utils import ImageReader
+        
         try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import A4, landscape
-            from reportlab.lib.utils import ImageReader
-            
-            if not output_path:
-                output_path = f"temp_certificate_{uuid.uuid4()}.pdf"
-            
-            # Resmi PIL ile aç
-            img = Image.open(io.BytesIO(image_data))
-            
-            # PDF oluştur
-            c = canvas.Canvas(output_path, pagesize=landscape(A4))
-            width, height = landscape(A4)
-            
-            # Resmi PDF'e ekle
-            img_reader = ImageReader(img)
-            img_width, img_height = img_reader.getSize()
+            if cache_key is None:
+                cache_key = hashlib.sha256(image_data).hexdigest()
             
-            # Resmi sayfaya sığdır
-            scale = min(width/img_width, height/img_height) * 0.8
-            new_width = img_width * scale
-            new_height = img_height * scale
+            def render():
+                # Resmi bir kez çöz; boyut ve piksel verisi aynı nesneden okunur
+                img_reader = ImageReader(io.BytesIO(image_data))
+                img_width, img_height = img_reader.getSize()
+                
+                # PDF oluştur
+                buffer = io.BytesIO()
+                c = canvas.Canvas(buffer, pagesize=landscape(A4), invariant=1)
+                width, height = landscape(A4)
+                
+                # Resmi sayfaya sığdır
+                scale = min(width/img_width, height/img_height) * 0.8
+                new_width = img_width * scale
+                new_height = img_height * scale
+                
+                x = (width - new_width) / 2
+                y = (height - new_height) / 2
+                
+                c.drawImage(img_reader, x, y, width=new_width, height=new_height)
+                
+                c.save()
+                return buffer.getvalue()
             
-            x = (width - new_width) / 2
-            y = (height - new_height) / 2
+            pdf_bytes = CertificateGenerator._image_pdf_cache.get_or_compute(cache_key, render)
             
-            c.drawImage(img_reader, x, y, width=new_width, height=new_height)
-            
-            c.save()
-            
-            # PDF'i bytes olarak oku
-            with open(output_path, 'rb') as f:
-                pdf_bytes = f.read()
-            
-            # Geçici dosyayı sil
-            if os.path.exists(output_path):
-                os.remove(output_path)
+            if output_path:
+                with open(output_path, 'wb') as f:
+                    f.write(pdf_bytes)
             
             return pdf_bytes
             
@@ -216,7 +264,7 @@ class CertificateGenerator:
             return None
     
     @staticmethod
-    def generate_image_certificate(student_name, course_name, completion_date, output_path=None, format="png"):
+    def generate_image_certificate(student_name, course_name, completion_date, output_path=None, format="png", verification_url=None, verification_code=None):
         """
         Görüntü sertifikası oluşturur
         
@@ -226,10 +274,14 @@ class CertificateGenerator:
             completion_date: Tamamlama tarihi
             output_path: Çıktı dosyası yolu (None ise geçici dosya oluşturur)
             format: Görüntü formatı (png, jpg, jpeg)
+            verification_url: Doğrulama linki (verilirse QR kod olarak çizilir)
+            verification_code: Doğrulama kodu (bkz. verification_code)
             
         Returns:
             Oluşturulan sertifika dosyasının yolu
         """
+        from PIL import Image, ImageDraw, ImageFont
+        
         # Görüntü boyutları (A4 landscape yaklaşık)
         width, height = 842, 595
         
@@ -283,10 +335,14 @@ class CertificateGenerator:
         draw.text((width-150, height-120), "____________________", font=font_normal, fill="#34495e")
         draw.text((width-180, height-90), "Yetkili İmza", font=font_normal, fill="#34495e")
         
-        # QR kod için bir kutu
+        # Doğrulama QR kodu
         draw.rectangle([(50, height-150), (150, height-50)], outline="#34495e", width=1)
+        if verification_url:
+            qr_img = Image.open(io.BytesIO(QRCodeGenerator.generate_png(verification_url)))
+            img.paste(qr_img.convert("RGB").resize((99, 99), Image.NEAREST), (51, height-149))
         draw.text((100, height-40), "Doğrulama Kodu", font=font_small, fill="#34495e", anchor="mm")
-        draw.text((100, height-25), str(uuid.uuid4())[:8], font=font_small, fill="#34495e", anchor="mm")
+        if verification_code:
+            draw.text((100, height-25), verification_code, font=font_small, fill="#34495e", anchor="mm")
         
         # Görüntüyü kaydet
         img.save(output_path)
@@ -0,0 +1,155 @@
+import base64
+import html
+import uuid
+from string import Formatter
+from email.header import Header
+from email.utils import formataddr
+
+CERTIFICATE_EMAIL_SUBJECT = "Eğitim Sertifikanız Hazır!"
+
+CERTIFICATE_EMAIL_HTML = """
+        <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 5px;">
+                <div style="text-align: center; padding: 10px; background-color: #f8f9fa; margin-bottom: 20px;">
+                    <h2 style="color: #2c3e50;">Tebrikler, {student_name}!</h2>
+                </div>
+                
+                <p>Eğitimi başarıyla tamamladınız ve sertifikanız hazır.</p>
+                
+                <p>Sertifikanızı görüntülemek ve indirmek için aşağıdaki bağlantıya tıklayın:</p>
+                
+                <div style="text-align: center; margin: 30px 0;">
+                    <a href="{certificate_link}" style="background-color: #3498db; color: white; padding: 12px 20px; text-decoration: none; border-radius: 4px; font-weight: bold;">Sertifikanızı Görüntüleyin</a>
+                </div>
+                
+                <p>Bu link size özeldir ve sertifikanızın doğruluğunu ispat etmek için kullanılabilir.</p>
+                
+                <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+                
+                <p style="font-size: 12px; color: #777; text-align: center;">
+                    Bu e-posta otomatik olarak gönderilmiştir. Lütfen yanıtlamayınız.
+                </p>
+            </div>
+        </body>
+        </html>
+        """
+
+CERTIFICATE_EMAIL_TEXT = """Tebrikler, {student_name}!
+
+Eğitimi başarıyla tamamladınız ve sertifikanız hazır.
+
+Sertifikanızı görüntülemek ve indirmek için aşağıdaki bağlantıyı açın:
+{certificate_link}
+
+Bu link size özeldir ve sertifikanızın doğruluğunu ispat etmek için kullanılabilir.
+
+--
+Bu e-posta otomatik olarak gönderilmiştir. Lütfen yanıtlamayınız.
+"""
+
+CRLF = b"\r\n"
+
+class CertificateEmailTemplate:
+    """
+    Önceden derlenmiş sertifika e-postası şablonu
+    
+    Başlıklar, MIME sınırları ve şablonun sabit metin parçaları bir kez
+    hazırlanır; her alıcı için yalnızca ad ve link yerleştirilip gövde
+    kodlanır. Mesaj HTML ve düz metin alternatiflerini içerir ve SMTP'ye
+    doğrudan gönderilebilecek bytes olarak üretilir.
+    """
+    
+    def __init__(self, sender_name, sender_email, subject=CERTIFICATE_EMAIL_SUBJECT,
+                 html_template=CERTIFICATE_EMAIL_HTML, text_template=CERTIFICATE_EMAIL_TEXT):
+        """
+        Args:
+            sender_name: Gönderen adı
+            sender_email: Gönderen e-posta adresi
+            subject: E-posta konusu
+            html_template: {student_name} ve {certificate_link} alanlarını içeren HTML
+            text_template: Aynı alanları içeren düz metin
+        """
+        self.sender_email = sender_email
+        self._html_parts = self._compile(html_template)
+        self._text_parts = self._compile(text_template)
+        
+        # Gövdeler base64 ile kodlandığından bu sınır içerikte geçemez
+        boundary = f"==sertifika-{uuid.uuid4().hex}=="
+        
+        # Uzun başlıklar katlanırken SMTP satır sonu kullanılır
+        from_header = formataddr((sender_name, sender_email), charset="utf-8").replace("\n", "\r\n")
+        subject_header = Header(subject, "utf-8").encode(linesep="\r\n")
+        self._headers = f"From: {from_header}\r\nSubject: {subject_header}\r\n".encode("ascii")
+        
+        self._mime_headers = (
+            "MIME-Version: 1.0\r\n"
+            f'Content-Type: multipart/alternative; boundary="{boundary}"\r\n'
+            "\r\n"
+        ).encode("ascii")
+        
+        part_headers = (
+            "Content-Type: text/{subtype}; charset=\"utf-8\"\r\n"
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+        )
+        self._text_part_start = f"--{boundary}\r\n{part_headers.format(subtype='plain')}".encode("ascii")
+        self._html_part_start = f"\r\n--{boundary}\r\n{part_headers.format(subtype='html')}".encode("ascii")
+        self._closing = f"\r\n--{boundary}--\r\n".encode("ascii")
+    
+    @staticmethod
+    def _compile(template):
+        """
+        Şablonu sabit metin ve alan adı çiftlerine ayırır
+        
+        Returns:
+            (sabit metin, alan adı veya None) listesi
+        """
+        return [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+    
+    @staticmethod
+    def _fill(parts, values):
+        """Derlenmiş şablona değerleri yerleştirir"""
+        return "".join(
+            literal + values[field] if field is not None else literal
+            for literal, field in parts
+        )
+    
+    @staticmethod
+    def _encode_body(text):
+        """Gövdeyi SMTP satır sonlarıyla base64 olarak kodlar"""
+        return base64.encodebytes(text.encode("utf-8")).replace(b"\n", CRLF)
+    
+    def render(self, to, student_name, certificate_link):
+        """
+        Alıcıya özel mesajı üretir
+        
+        Args:
+            to: Alıcı e-posta adresi
+            student_name: Öğrenci adı
+            certificate_link: Sertifika erişim linki
+        
+        Returns:
+            Gönderime hazır mesaj (bytes)
+        """
+        to_header = to if to.isascii() else Header(to, "utf-8").encode(linesep="\r\n")
+        
+        html_body = self._fill(self._html_parts, {
+            "student_name": html.escape(student_name),
+            "certificate_link": html.escape(certificate_link)
+        })
+        text_body = self._fill(self._text_parts, {
+            "student_name": student_name,
+            "certificate_link": certificate_link
+        })
+        
+        return b"".join([
+            self._headers,
+            b"To: ", to_header.encode("ascii"), CRLF,
+            self._mime_headers,
+            self._text_part_start,
+            self._encode_body(text_body),
+            self._html_part_start,
+            self._encode_body(html_body),
+            self._closing
+        ])
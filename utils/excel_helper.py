@@ -38,7 +38,8 @@ class ExcelHelper:
                 worksheet = writer.sheets["Öğrenciler"]
                 for i, col in enumerate(df.columns):
                     # İçeriğe göre sütun genişliğini ayarla (min 10, max 30 karakter)
-                    max_len = max(df[col].astype(str).apply(len).max(), len(col)) + 2
+                    # Boş değerler (örn. telefonu olmayan öğrenci) de metne çevrilerek ölçülür
+                    max_len = max(df[col].map(lambda value: len(str(value))).max(), len(col)) + 2
                     max_len = min(max(max_len, 10), 30)
                     worksheet.column_dimensions[chr(65 + i)].width = max_len
             
@@ -76,3 +77,31 @@ class ExcelHelper:
         except Exception as e:
             print(f"Excel şablonu oluşturma hatası: {str(e)}")
             raise
+
+    @staticmethod
+    def read_email_list(file_content, file_name):
+        """
+        Yüklenen dosyadan e-posta adreslerini okur (yoklama listesi vb.)
+        
+        Excel dosyalarında 'E-posta' sütunu, yoksa ilk sütun okunur. Metin ve
+        CSV dosyalarında adresler satır, virgül, noktalı virgül veya boşlukla
+        ayrılabilir. '@' içermeyen değerler (başlıklar vb.) atlanır.
+        
+        Args:
+            file_content: Dosya içeriği (bytes)
+            file_name: Dosya adı (türü uzantıdan anlaşılır)
+        
+        Returns:
+            Tekrarsız e-posta adresleri listesi (dosyadaki sırayla)
+        """
+        import re
+        
+        if file_name.lower().endswith((".xlsx", ".xls")):
+            df = pd.read_excel(io.BytesIO(file_content))
+            column = "E-posta" if "E-posta" in df.columns else df.columns[0]
+            values = [str(value) for value in df[column].dropna()]
+        else:
+            values = re.split(r"[\s,;]+", file_content.decode("utf-8-sig", errors="ignore"))
+        
+        emails = [value.strip().strip('"\'').lower() for value in values]
+        return list(dict.fromkeys(email for email in emails if "@" in email))
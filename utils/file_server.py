@@ -0,0 +1,203 @@
+import os
+import re
+import mimetypes
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, unquote, parse_qs, quote
+import config
+
+# Yalnızca bu klasördeki dosyalar sunulur (şablonlar ve dışa aktarımlar hariç)
+SERVED_FOLDER = "certificates"
+
+_server = None
+_server_lock = threading.Lock()
+
+class CertificateFileHandler(BaseHTTPRequestHandler):
+    """Sertifika dosyalarını HTTP önbellek başlıkları ve aralık desteği ile sunar"""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_HEAD(self):
+        self._serve(send_body=False)
+    
+    def do_GET(self):
+        self._serve(send_body=True)
+    
+    def _serve(self, send_body):
+        """İsteği karşılar"""
+        url = urlsplit(self.path)
+        full_path = self._resolve_path(unquote(url.path))
+        
+        if not full_path:
+            self.send_error(404)
+            return
+        
+        stat = os.stat(full_path)
+        file_size = stat.st_size
+        
+        # Dosya adları benzersiz olduğundan içerik değişmez; boyut ve zaman yeterli
+        etag = f'"{file_size:x}-{stat.st_mtime_ns:x}"'
+        
+        if self._etag_matches(etag):
+            self.send_response(304)
+            self._send_cache_headers(etag, stat.st_mtime)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        start, end = 0, file_size - 1
+        status = 200
+        
+        range_header = self.headers.get("Range")
+        if range_header and self._if_range_matches(etag):
+            byte_range = self._parse_range(range_header, file_size)
+            if byte_range is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{file_size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = byte_range
+            status = 206
+        
+        length = end - start + 1
+        content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        if content_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+        
+        self.send_response(status)
+        self._send_cache_headers(etag, stat.st_mtime)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{file_size}")
+        
+        # ?download=<dosya adı> verilirse tarayıcı dosyayı indirir
+        download_name = parse_qs(url.query).get("download", [None])[0]
+        if download_name:
+            self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{quote(download_name)}")
+        else:
+            self.send_header("Content-Disposition", "inline")
+        
+        self.end_headers()
+        
+        if not send_body:
+            return
+        
+        with open(full_path, "rb") as f:
+            f.seek(start)
+            self._copy_range(f, length)
+    
+    def _resolve_path(self, request_path):
+        """
+        İstek yolunu depodaki dosya yoluna çevirir
+        
+        Returns:
+            Dosyanın tam yolu, izin verilen klasör dışındaysa veya yoksa None
+        """
+        relative_path = request_path.lstrip("/")
+        served_root = os.path.realpath(os.path.join(config.STORAGE_PATH, SERVED_FOLDER))
+        full_path = os.path.realpath(os.path.join(config.STORAGE_PATH, relative_path))
+        
+        # Dizin dışına çıkma (../) girişimlerini engelle
+        if not full_path.startswith(served_root + os.sep):
+            return None
+        
+        if not os.path.isfile(full_path):
+            return None
+        
+        return full_path
+    
+    def _etag_matches(self, etag):
+        """If-None-Match başlığı mevcut ETag ile eşleşiyor mu?"""
+        if_none_match = self.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+    
+    def _if_range_matches(self, etag):
+        """If-Range başlığı yoksa veya ETag ile eşleşiyorsa aralık isteği geçerlidir"""
+        if_range = self.headers.get("If-Range")
+        return not if_range or if_range.strip() == etag
+    
+    @staticmethod
+    def _parse_range(range_header, file_size):
+        """
+        Tek aralıklı 'bytes=' başlığını çözer
+        
+        Returns:
+            (başlangıç, bitiş) ikilisi, karşılanamayan aralıkta None
+        """
+        match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", range_header)
+        if not match or (not match.group(1) and not match.group(2)):
+            return None
+        
+        if not match.group(1):
+            # Son N bayt
+            suffix_length = int(match.group(2))
+            if suffix_length == 0:
+                return None
+            return max(0, file_size - suffix_length), file_size - 1
+        
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else file_size - 1
+        
+        if start >= file_size or end < start:
+            return None
+        
+        return start, min(end, file_size - 1)
+    
+    def _send_cache_headers(self, etag, mtime):
+        """ETag, Last-Modified ve Cache-Control başlıklarını ekler"""
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+        self.send_header("Cache-Control", f"public, max-age={config.FILE_SERVER_MAX_AGE}, immutable")
+    
+    def _copy_range(self, source, length, chunk_size=64 * 1024):
+        """Dosyanın belirtilen uzunluktaki kısmını parça parça gönderir"""
+        remaining = length
+        while remaining > 0:
+            chunk = source.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+    
+    def log_message(self, format, *args):
+        # Her istek için stdout'a yazma
+        pass
+
+def start_file_server():
+    """
+    Sertifika dosya sunucusunu arka plan thread'inde başlatır
+    
+    İşlem başına bir kez çalışır; sonraki çağrılar mevcut sunucuyu döndürür.
+    
+    Returns:
+        Çalışan sunucu, devre dışıysa veya başlatılamazsa None
+    """
+    global _server
+    
+    if not config.FILE_SERVER_ENABLED or not config.FILE_SERVER_URL or config.STORAGE_TYPE != "local":
+        return None
+    
+    with _server_lock:
+        if _server is not None:
+            return _server
+        
+        try:
+            server = ThreadingHTTPServer((config.FILE_SERVER_HOST, config.FILE_SERVER_PORT), CertificateFileHandler)
+        except OSError as e:
+            # Aynı makinedeki başka bir süreç portu zaten dinliyor olabilir
+            print(f"Dosya sunucusu başlatılamadı: {str(e)}")
+            return None
+        
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="certificate-file-server", daemon=True)
+        thread.start()
+        
+        _server = server
+        return _server
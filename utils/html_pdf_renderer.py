@@ -0,0 +1,329 @@
+import os
+import io
+import hashlib
+import dataclasses
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+import config
+from utils.cache import BytesLRUCache
+
+# Çıktıyı etkileyen bir değişiklik yapıldığında artırılmalı (önbelleği geçersiz kılar)
+RENDERER_VERSION = "xhtml2pdf-3"
+
+# xhtml2pdf'in yerleşik fontlarında (Helvetica, Times, Courier) Türkçe karakterler
+# (ş, ğ, ı, İ) yoktur. Bu aileler ve şablonlarda adı geçen ama indirilmeyen fontlar
+# (Google Fonts vb.; bilinmeyen aileler 'helvetica'ya düşer) DejaVu fontlarıyla çizilir.
+UNICODE_FONTS = [
+    ("helvetica, arial, sans-serif, sansserif, sans", "DejaVuSans.ttf", "DejaVuSans-Bold.ttf"),
+    ("times, times-roman, times new roman, georgia, serif", "DejaVuSerif.ttf", "DejaVuSerif-Bold.ttf"),
+    ("courier, monospace, monospaced", "DejaVuSansMono.ttf", "DejaVuSansMono-Bold.ttf")
+]
+
+_unicode_font_css = None
+
+def _block_remote_links(uri, rel):
+    """
+    Uzak kaynakların (Google Fonts vb.) indirilmesini engeller
+    
+    Render süresini ağ gecikmesinden bağımsız ve tekrarlanabilir tutar.
+    """
+    if uri.startswith(("http://", "https://")):
+        return ""
+    return uri
+
+def _find_font_file(file_name):
+    """ReportLab'ın TTF arama klasörlerinde fontu arar, bulunamazsa None"""
+    from reportlab import rl_config
+    
+    for folder in rl_config.TTFSearchPath:
+        path = os.path.join(folder, file_name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+def _unicode_font_setup():
+    """
+    UNICODE_FONTS için @font-face kurallarını ve fontların klasörlerini döndürür
+    
+    Sonuç süreç başına bir kez hesaplanır. Bulunamayan fontlar atlanır; o
+    ailelerde xhtml2pdf'in yerleşik fontu kullanılır.
+    
+    Returns:
+        (CSS metni, font klasörleri)
+    """
+    global _unicode_font_css
+    
+    if _unicode_font_css is None:
+        rules = []
+        folders = set()
+        for families, *file_names in UNICODE_FONTS:
+            for file_name, weight in zip(file_names, ("normal", "bold")):
+                path = _find_font_file(file_name)
+                if not path:
+                    print(f"Unicode font bulunamadı: {file_name}")
+                    continue
+                folders.add(os.path.dirname(path))
+                rules.append(f"@font-face {{ font-family: {families}; src: url('{path}'); font-weight: {weight}; }}")
+        _unicode_font_css = ("\n".join(rules), tuple(sorted(folders)))
+    
+    return _unicode_font_css
+
+def _render_html(html_content):
+    """
+    HTML içeriğini bellekte PDF'e çevirir (işçi süreçlerde çalışır)
+    
+    Args:
+        html_content: HTML içeriği
+    
+    Returns:
+        PDF dosyasının bytes'ı
+    """
+    from reportlab import rl_config
+    from xhtml2pdf import pisa
+    from xhtml2pdf.default import DEFAULT_CSS
+    
+    # Oluşturma tarihi ve rastgele belge kimliği yazılmaz; aynı HTML aynı baytları üretir
+    rl_config.invariant = 1
+    
+    font_css, font_folders = _unicode_font_setup()
+    options = {}
+    try:
+        from xhtml2pdf.config.resources import default_policy
+    except ImportError:
+        # Eski xhtml2pdf sürümleri yerel dosya okumalarını kısıtlamaz
+        pass
+    else:
+        # Yeni sürümler yerel okumaları çalışma klasörüyle sınırlar; font klasörlerine de izin verilir
+        policy = default_policy()
+        options["resource_policy"] = dataclasses.replace(policy, extra_roots=(*policy.extra_roots, *map(Path, font_folders)))
+    
+    output = io.BytesIO()
+    result = pisa.CreatePDF(
+        html_content,
+        dest=output,
+        encoding="utf-8",
+        default_css=f"{DEFAULT_CSS}\n{font_css}",
+        link_callback=_block_remote_links,
+        **options
+    )
+    
+    if result.err:
+        raise RuntimeError(f"HTML işlenemedi ({result.err} hata)")
+    
+    return output.getvalue()
+
+def _exit_with_parent(parent_pid):
+    """
+    Ana süreç ölürse işçi süreci de sonlandırır
+    
+    Ana süreç aniden kapandığında (deploy, çökme) havuz kapatılamaz; işçiler
+    sahipsiz kalmasın diye ana sürecin varlığı düzenli olarak kontrol edilir.
+    """
+    while True:
+        time.sleep(5)
+        if os.getppid() != parent_pid:
+            os._exit(0)
+
+def _warm_up_worker(parent_pid):
+    """
+    İşçi süreci başlatır: kütüphaneyi içe aktarır ve küçük bir belge çizer
+    
+    xhtml2pdf ve ReportLab'ın ilk yüklenmesi yaklaşık bir saniye sürer; bu
+    maliyet kullanıcı isteğinden önce, havuz kurulurken ödenir.
+    
+    Args:
+        parent_pid: Havuzu oluşturan ana sürecin ID'si
+    """
+    import logging
+    
+    threading.Thread(target=_exit_with_parent, args=(parent_pid,), daemon=True).start()
+    
+    # xhtml2pdf desteklemediği her CSS özelliği için uyarı basar
+    logging.getLogger("xhtml2pdf").setLevel(logging.ERROR)
+    _render_html("<html><body><p>.</p></body></html>")
+
+class HtmlPdfRenderer:
+    """Önceden ısıtılmış işçi havuzu ile HTML -> PDF dönüştürücü"""
+    
+    _executor = None
+    _lock = threading.Lock()
+    _cache = BytesLRUCache(config.PDF_CACHE_MAX_BYTES, name="html_pdf")
+    _disk_lock = threading.Lock()
+    _disk_usage = None  # Disk önbelleğinin bilinen boyutu (ilk yazmada taranır)
+    
+    @classmethod
+    def warm_up(cls):
+        """
+        İşçi havuzunu oluşturur ve tüm işçileri önceden başlatır
+        
+        Birden çok kez çağrılması güvenlidir; havuz yalnızca bir kez kurulur.
+        """
+        with cls._lock:
+            if cls._executor is not None:
+                return cls._executor
+            
+            worker_count = max(1, config.PDF_RENDERER_WORKERS)
+            
+            # Streamlit sunucusunun thread'leri fork ile kopyalanmasın diye spawn kullanılır
+            cls._executor = ProcessPoolExecutor(
+                max_workers=worker_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up_worker,
+                initargs=(os.getpid(),)
+            )
+            
+            # Her işçinin hemen ayağa kalkması için boş görevler gönder
+            for _ in range(worker_count):
+                cls._executor.submit(int)
+            
+            return cls._executor
+    
+    @classmethod
+    def shutdown(cls):
+        """İşçi havuzunu kapatır"""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+    
+    @classmethod
+    def render(cls, html_content):
+        """
+        HTML içeriğini PDF'e çevirir
+        
+        Sonuçlar HTML içeriğinin özetine göre önce bellekte, sonra diskte
+        önbelleklenir; aynı HTML için tekrar render yapılmaz.
+        
+        Args:
+            html_content: HTML içeriği (str veya bytes)
+        
+        Returns:
+            PDF dosyasının bytes'ı
+        """
+        if isinstance(html_content, bytes):
+            html_content = html_content.decode("utf-8")
+        
+        cache_key = hashlib.sha256(
+            f"{RENDERER_VERSION}\n{html_content}".encode("utf-8")
+        ).hexdigest()
+        
+        pdf_bytes = cls._get_cached(cache_key)
+        if pdf_bytes is not None:
+            return pdf_bytes
+        
+        try:
+            executor = cls.warm_up()
+            pdf_bytes = executor.submit(_render_html, html_content).result(timeout=config.PDF_RENDER_TIMEOUT)
+        except BrokenProcessPool:
+            # Havuz çöktüyse bir sonraki istekte yeniden kurulsun, bu istek süreç içinde çizilsin
+            cls.shutdown()
+            pdf_bytes = _render_html(html_content)
+        
+        cls._store_cached(cache_key, pdf_bytes)
+        return pdf_bytes
+    
+    @classmethod
+    def _cache_file_path(cls, cache_key):
+        """Disk önbelleğindeki dosya yolunu döndürür"""
+        return os.path.join(config.STORAGE_PATH, "cache", "html-pdf", f"{cache_key}.pdf")
+    
+    @classmethod
+    def _get_cached(cls, cache_key):
+        """Önbellekteki PDF'i döndürür, yoksa None"""
+        pdf_bytes = cls._cache.get(cache_key)
+        if pdf_bytes is not None:
+            return pdf_bytes
+        
+        cache_path = cls._cache_file_path(cache_key)
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                pdf_bytes = f.read()
+            cls._cache.set(cache_key, pdf_bytes)
+            
+            # Değiştirilme zamanı son kullanım zamanı olarak tutulur (budamada en eskiler silinir)
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return pdf_bytes
+        
+        return None
+    
+    @classmethod
+    def _store_cached(cls, cache_key, pdf_bytes):
+        """PDF'i bellek ve disk önbelleğine yazar"""
+        cls._cache.set(cache_key, pdf_bytes)
+        
+        try:
+            cache_path = cls._cache_file_path(cache_key)
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            
+            # Yarım yazılmış dosya okunmasın diye önce süreç ve iş parçacığına
+            # özel geçici adla yaz (aynı PDF aynı anda iki yerde üretilebilir)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, cache_path)
+            
+            cls._track_disk_usage(os.path.dirname(cache_path), len(pdf_bytes))
+        except OSError as e:
+            print(f"PDF önbelleğe yazılamadı: {str(e)}")
+
+    @classmethod
+    def _track_disk_usage(cls, cache_folder, added_bytes):
+        """
+        Disk önbelleğinin boyutunu izler ve PDF_DISK_CACHE_MAX_BYTES aşılınca budar
+        
+        Boyut ilk yazmada klasör taranarak bulunur, sonra yazılan dosyalarla
+        artırılır. Sınır aşıldığında klasör yeniden taranır (diğer süreçlerin
+        yazdıkları da hesaba katılır) ve en uzun süredir kullanılmayan
+        dosyalar sınırın %90'ına inilene kadar silinir.
+        """
+        limit = config.PDF_DISK_CACHE_MAX_BYTES
+        if limit <= 0:
+            return
+        
+        with cls._disk_lock:
+            if cls._disk_usage is None:
+                cls._disk_usage = sum(size for _, size, _ in cls._scan_disk_cache(cache_folder))
+            else:
+                cls._disk_usage += added_bytes
+            
+            if cls._disk_usage <= limit:
+                return
+            
+            entries = sorted(cls._scan_disk_cache(cache_folder))
+            usage = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if usage <= limit * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                    usage -= size
+                except OSError:
+                    # Başka bir süreç silmiş olabilir
+                    pass
+            
+            cls._disk_usage = usage
+    
+    @staticmethod
+    def _scan_disk_cache(cache_folder):
+        """Disk önbelleğindeki PDF'lerin (değiştirilme zamanı, boyut, yol) listesi"""
+        entries = []
+        try:
+            with os.scandir(cache_folder) as iterator:
+                for entry in iterator:
+                    if not entry.name.endswith(".pdf"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        return entries
@@ -0,0 +1,57 @@
+import threading
+import config
+
+_threads = []
+_threads_lock = threading.Lock()
+_wake_up = threading.Event()
+
+def start_job_runner():
+    """
+    Arka plan iş çalıştırıcısını başlatır
+    
+    İşlem başına bir kez JOB_WORKERS adet thread açılır; sonraki çağrılar
+    mevcut thread'leri kullanır. Thread'ler iş tablosundan bekleyen işleri
+    alır, böylece sayfadan ayrılan kullanıcıların işleri ve yeniden
+    başlatmada yarım kalan işler de tamamlanır.
+    
+    Returns:
+        Çalıştırıcı etkinse True, devre dışıysa False
+    """
+    if not config.JOB_RUNNER_ENABLED:
+        return False
+    
+    with _threads_lock:
+        if _threads:
+            return True
+        
+        for index in range(max(config.JOB_WORKERS, 1)):
+            thread = threading.Thread(target=_work_loop, name=f"job-runner-{index}", daemon=True)
+            thread.start()
+            _threads.append(thread)
+    
+    return True
+
+def notify_job_runner():
+    """Yeni iş eklendiğini bildirir; bekleyen thread'ler hemen uyanır"""
+    _wake_up.set()
+
+def _work_loop():
+    """Sıradaki işi alır ve çalıştırır; iş yoksa bildirim veya süre dolana kadar bekler"""
+    from services.job_service import JobService
+    from db.profiler import profile_request
+    
+    while True:
+        _wake_up.clear()
+        
+        try:
+            job_id = JobService.next_runnable_job()
+            if job_id is None:
+                _wake_up.wait(config.JOB_POLL_SECONDS)
+                continue
+            
+            # İş başka bir thread tarafından alınmışsa run_job None döner
+            with profile_request("job.run"):
+                JobService.run_job(job_id)
+        except Exception as e:
+            print(f"İş çalıştırıcı hatası: {str(e)}")
+            _wake_up.wait(config.JOB_POLL_SECONDS)
@@ -0,0 +1,126 @@
+import sys
+import json
+import queue
+import atexit
+import logging
+import itertools
+import threading
+from logging.handlers import QueueHandler, QueueListener
+import config
+
+# Uygulamanın tüm kayıtçıları bu kaydın altındadır
+ROOT_LOGGER = "sertifika"
+
+_listener = None
+_setup_lock = threading.Lock()
+
+class StructuredFormatter(logging.Formatter):
+    """Kayıtları 'zaman seviye kayıtçı mesaj alan=değer' veya JSON satırı olarak biçimlendirir"""
+
+    def __init__(self, json_output=False):
+        super().__init__(datefmt="%Y-%m-%d %H:%M:%S")
+        self.json_output = json_output
+
+    def format(self, record):
+        fields = getattr(record, "fields", None) or {}
+
+        if self.json_output:
+            data = {
+                "ts": self.formatTime(record, self.datefmt),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields
+            }
+            if record.exc_info:
+                data["exception"] = self.formatException(record.exc_info)
+            return json.dumps(data, ensure_ascii=False, default=str)
+
+        text = f"{self.formatTime(record, self.datefmt)} {record.levelname:<7} {record.name} {record.getMessage()}"
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+class SamplingFilter(logging.Filter):
+    """
+    Örneklenen kayıtlardan yalnızca her N'incisini geçirir
+
+    Alıcı başına yazılan satırlar gibi sık tekrarlanan kayıtlar sample=True
+    ile işaretlenir; diğer kayıtlar olduğu gibi geçer.
+    """
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = max(every, 1)
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        if not getattr(record, "sample", False):
+            return True
+        return next(self._counter) % self.every == 0
+
+def setup_logging():
+    """
+    Uygulama kayıtlarını yapılandırır
+
+    İşlem başına bir kez çalışır. Kayıtlar çağıran thread'de biçimlendirilip
+    kuyruğa bırakılır; stdout'a yazma ayrı bir thread'de yapılır, böylece
+    gönderim döngüleri G/Ç beklemez.
+    """
+    global _listener
+
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        log_queue = queue.SimpleQueue()
+
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(StructuredFormatter(json_output=config.LOG_FORMAT == "json"))
+        queue_handler.addFilter(SamplingFilter(config.LOG_SAMPLE_EVERY))
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        _listener = QueueListener(log_queue, stream_handler)
+        _listener.start()
+
+        # Çıkışta kuyrukta kalan kayıtlar yazılır
+        atexit.register(_listener.stop)
+
+        root_logger = logging.getLogger(ROOT_LOGGER)
+        root_logger.setLevel(config.LOG_LEVEL)
+        root_logger.addHandler(queue_handler)
+        root_logger.propagate = False
+
+def get_logger(name):
+    """
+    Modül kayıtçısını döndürür
+
+    Args:
+        name: Kayıtçı adı (örn. 'email')
+
+    Returns:
+        logging.Logger
+    """
+    setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+def log_event(logger, level, message, sample=False, **fields):
+    """
+    Yapılandırılmış kayıt yazar
+
+    Seviye kapalıysa hiçbir şey hesaplanmaz; sık çağrılan yerlerde maliyeti
+    tek bir seviye kontrolüdür.
+
+    Args:
+        logger: Kayıtçı
+        level: logging seviyesi (logging.INFO vb.)
+        message: Kısa açıklama
+        sample: True ise kayıt LOG_SAMPLE_EVERY oranında örneklenir
+        **fields: Kayda eklenecek alanlar
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra={"fields": fields, "sample": sample})
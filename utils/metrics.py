@@ -0,0 +1,186 @@
+import time
+import inspect
+import threading
+import functools
+import contextlib
+from collections import deque
+import config
+
+_operations = {}
+_operations_lock = threading.Lock()
+
+class _Operation:
+    """Bir işlemin sayaçları ve son METRICS_WINDOW süresi (kilit altında güncellenir)"""
+    
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "samples")
+    
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=config.METRICS_WINDOW)
+
+def record(name, duration_ms, error=False):
+    """
+    İşlem süresini kaydeder
+    
+    Args:
+        name: İşlem adı (örn. 'CourseService.get_all_courses')
+        duration_ms: Süre (milisaniye)
+        error: İşlem hata ile bittiyse True
+    """
+    if not config.METRICS_ENABLED:
+        return
+    
+    with _operations_lock:
+        operation = _operations.get(name)
+        if operation is None:
+            operation = _operations[name] = _Operation()
+        
+        operation.count += 1
+        operation.total_ms += duration_ms
+        operation.samples.append(duration_ms)
+        if duration_ms > operation.max_ms:
+            operation.max_ms = duration_ms
+        if error:
+            operation.errors += 1
+
+@contextlib.contextmanager
+def _tracking(name):
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record(name, (time.perf_counter() - start) * 1000, error)
+
+def track(name):
+    """
+    Kod bloğunun süresini ölçen context manager
+    
+    Ölçüm kapalıysa hiçbir şey yapmayan bağlam döndürülür.
+    
+    Args:
+        name: İşlem adı
+    
+    Örnek:
+        with track("FileService.get_file"):
+            ...
+    """
+    if not config.METRICS_ENABLED:
+        return contextlib.nullcontext()
+    return _tracking(name)
+
+def timed(name=None):
+    """
+    Fonksiyonun süresini ölçen decorator
+    
+    Ölçüm kapalıysa fonksiyon hiç sarmalanmaz; ek maliyet sıfırdır.
+    Generator ve coroutine fonksiyonları sarmalanmaz (yalnızca
+    oluşturulmaları ölçülürdü).
+    
+    Args:
+        name: İşlem adı (varsayılan: fonksiyonun nitelikli adı)
+    """
+    def decorator(func):
+        if not config.METRICS_ENABLED or inspect.isgeneratorfunction(func) or inspect.iscoroutinefunction(func):
+            return func
+        
+        operation_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                error = True
+                raise
+            finally:
+                record(operation_name, (time.perf_counter() - start) * 1000, error)
+        
+        return wrapper
+    
+    return decorator
+
+def instrument(cls):
+    """
+    Sınıfın tüm public metotlarını ölçen sınıf decorator'ı
+    
+    Statik metotlar, sınıf metotları ve örnek metotları desteklenir; adı '_'
+    ile başlayan metotlar ölçülmez. İşlem adı 'Sınıf.metot' biçimindedir.
+    """
+    if not config.METRICS_ENABLED:
+        return cls
+    
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith("_"):
+            continue
+        
+        operation_name = f"{cls.__name__}.{attribute}"
+        
+        if isinstance(value, staticmethod):
+            setattr(cls, attribute, staticmethod(timed(operation_name)(value.__func__)))
+        elif isinstance(value, classmethod):
+            setattr(cls, attribute, classmethod(timed(operation_name)(value.__func__)))
+        elif inspect.isfunction(value):
+            setattr(cls, attribute, timed(operation_name)(value))
+    
+    return cls
+
+def _percentile(sorted_samples, percent):
+    """Sıralı örneklerden yüzdelik değeri (en yakın sıra yöntemi)"""
+    index = max(0, min(len(sorted_samples) - 1, int(round(percent / 100 * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[index]
+
+def get_metrics():
+    """
+    Tüm işlemlerin özetini döndürür
+    
+    Yüzdelikler işlem başına son METRICS_WINDOW ölçümden hesaplanır;
+    sayı, hata, ortalama ve en yüksek değer işlem başından beri tutulur.
+    
+    Returns:
+        Toplam süreye göre azalan sırada işlem özetleri listesi
+    """
+    with _operations_lock:
+        snapshot = [
+            (name, operation.count, operation.errors, operation.total_ms, operation.max_ms, sorted(operation.samples))
+            for name, operation in _operations.items()
+        ]
+    
+    summaries = []
+    for name, count, errors, total_ms, max_ms, samples in snapshot:
+        summaries.append({
+            "name": name,
+            "count": count,
+            "errors": errors,
+            "total_ms": total_ms,
+            "avg_ms": total_ms / count,
+            "p50_ms": _percentile(samples, 50),
+            "p95_ms": _percentile(samples, 95),
+            "p99_ms": _percentile(samples, 99),
+            "max_ms": max_ms
+        })
+    
+    summaries.sort(key=lambda summary: summary["total_ms"], reverse=True)
+    return summaries
+
+def get_metric(name):
+    """
+    Tek bir işlemin özetini döndürür
+    
+    Returns:
+        İşlem özeti (bkz. get_metrics), kayıt yoksa None
+    """
+    return next((summary for summary in get_metrics() if summary["name"] == name), None)
+
+def reset_metrics():
+    """Tüm ölçümleri siler"""
+    with _operations_lock:
+        _operations.clear()
@@ -0,0 +1,277 @@
+import time
+import bisect
+import threading
+import contextlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import config
+
+# Prometheus metin biçimi (text/plain; version=0.0.4)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Tüm metrik adlarının ön eki
+PREFIX = "sertifika_"
+
+# Süre histogramları için varsayılan kova sınırları (saniye)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_registry = []
+_collectors = []
+_server = None
+_server_lock = threading.Lock()
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    """Etiket değerlerine göre ayrılmış metrik (kilit altında güncellenir)"""
+    
+    kind = None
+    
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+    
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+    
+    def _render_samples(self, items):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç"""
+    
+    kind = "counter"
+    
+    def inc(self, amount=1, **labels):
+        """
+        Sayacı artırır
+        
+        Args:
+            amount: Artış miktarı (negatif olamaz)
+            labels: Etiket değerleri
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+class Gauge(_Metric):
+    """Artıp azalabilen anlık değer"""
+    
+    kind = "gauge"
+    
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(_Metric):
+    """Gözlemleri kovalara dağıtan histogram (süreler saniye cinsinden)"""
+    
+    kind = "histogram"
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value, **labels):
+        """
+        Gözlem ekler
+        
+        Args:
+            value: Gözlenen değer
+            labels: Etiket değerleri
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [kova sayıları..., +Inf], toplam
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+    
+    @contextlib.contextmanager
+    def time(self, **labels):
+        """Kod bloğunun süresini gözlem olarak ekleyen context manager"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+    
+    def _render_samples(self, items):
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', _format_value(float(bound)))])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+def register_collector(collector):
+    """
+    Okuma anında hesaplanan metrikler için toplayıcı ekler
+    
+    Args:
+        collector: Prometheus metin satırları listesi döndüren parametresiz fonksiyon
+    """
+    _collectors.append(collector)
+
+def render_metrics():
+    """
+    Tüm metrikleri Prometheus metin biçiminde döndürür
+    
+    Returns:
+        Metin (satır sonlarıyla birlikte)
+    """
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    for collector in _collectors:
+        lines.extend(collector())
+    return "\n".join(lines) + "\n"
+
+# Uygulama metrikleri; kayıtlar ilgili servislerden beslenir
+CERTIFICATES_RENDERED = Counter("certificates_rendered_total", "Oluşturulan sertifika sayısı", ["template_type", "status"])
+CERTIFICATE_RENDER_SECONDS = Histogram("certificate_render_seconds", "Sertifika oluşturma süresi", ["template_type"])
+EMAILS = Counter("emails_total", "E-posta gönderim sonuçları (sent, failed, quota_skipped)", ["result"])
+SMTP_SEND_SECONDS = Histogram("smtp_send_seconds", "SMTP gönderim süresi (hız sınırı beklemesi hariç)", ["mode"])
+DB_CONNECTIONS_IN_USE = Gauge("db_connections_in_use", "Havuzdan alınmış veritabanı bağlantısı sayısı")
+DB_CONNECTIONS_OPENED = Counter("db_connections_opened_total", "Açılan yeni veritabanı bağlantısı sayısı")
+DB_CONNECTION_CHECKOUTS = Counter("db_connection_checkouts_total", "Havuzdan bağlantı alma sayısı")
+
+# Oturum kimliği -> son görülme zamanı (time.monotonic)
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def session_seen(session_id):
+    """Giriş yapılmış bir oturumun etkin olduğunu kaydeder"""
+    with _sessions_lock:
+        _sessions[session_id] = time.monotonic()
+
+def session_ended(session_id):
+    """Oturumu etkin oturumlardan çıkarır (çıkış yapıldığında)"""
+    with _sessions_lock:
+        _sessions.pop(session_id, None)
+
+def _collect_sessions():
+    cutoff = time.monotonic() - config.ACTIVE_SESSION_SECONDS
+    with _sessions_lock:
+        for session_id in [session_id for session_id, seen in _sessions.items() if seen < cutoff]:
+            del _sessions[session_id]
+        active = len(_sessions)
+    
+    name = PREFIX + "active_sessions"
+    return [
+        f"# HELP {name} Son ACTIVE_SESSION_SECONDS içinde işlem yapan giriş yapılmış oturum sayısı",
+        f"# TYPE {name} gauge",
+        f"{name} {active}"
+    ]
+
+def _collect_caches():
+    from utils.cache import BytesLRUCache
+    
+    caches = BytesLRUCache.named_caches()
+    samples = {
+        "cache_hits_total": ("counter", "Önbellek isabet sayısı", lambda stats: stats["hits"]),
+        "cache_misses_total": ("counter", "Önbellek ıskalama sayısı", lambda stats: stats["misses"]),
+        "cache_size_bytes": ("gauge", "Önbellekteki toplam bayt", lambda stats: stats["size_bytes"]),
+        "cache_entries": ("gauge", "Önbellekteki kayıt sayısı", lambda stats: stats["entries"])
+    }
+    
+    stats_by_cache = {name: cache.stats() for name, cache in caches.items()}
+    lines = []
+    for suffix, (kind, documentation, value) in samples.items():
+        name = PREFIX + suffix
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        for cache_name, stats in sorted(stats_by_cache.items()):
+            lines.append(f"{name}{_format_labels(('cache',), (cache_name,))} {value(stats)}")
+    return lines
+
+register_collector(_collect_sessions)
+register_collector(_collect_caches)
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """/metrics adresinde metrikleri sunar"""
+    
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # Her okuma için stdout'a yazma
+        pass
+
+def start_metrics_exporter():
+    """
+    Metrik sunucusunu arka plan thread'inde başlatır
+    
+    Prometheus METRICS_EXPORTER_HOST:METRICS_EXPORTER_PORT/metrics adresini
+    okur. İşlem başına bir kez çalışır; sonraki çağrılar mevcut sunucuyu
+    döndürür.
+    
+    Returns:
+        Çalışan sunucu, devre dışıysa veya başlatılamazsa None
+    """
+    global _server
+    
+    if not config.METRICS_EXPORTER_ENABLED:
+        return None
+    
+    with _server_lock:
+        if _server is not None:
+            return _server
+        
+        try:
+            server = ThreadingHTTPServer((config.METRICS_EXPORTER_HOST, config.METRICS_EXPORTER_PORT), MetricsHandler)
+        except OSError as e:
+            # Aynı makinedeki başka bir süreç portu zaten dinliyor olabilir
+            print(f"Metrik sunucusu başlatılamadı: {str(e)}")
+            return None
+        
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True)
+        thread.start()
+        
+        _server = server
+        return _server
@@ -0,0 +1,214 @@
+import io
+import os
+import hashlib
+
+class PdfPageStreamWriter:
+    """
+    PDF belgelerinin sayfalarını tek bir PDF'e akış halinde ekleyen yazıcı
+    
+    pypdf.PdfWriter tüm sayfaları dosya yazılana kadar bellekte tutar. Bu
+    yazıcı her eklenen belgenin sayfalarını ve bağlı nesnelerini (fontlar,
+    resimler, içerik akışları) numaralarını değiştirerek hemen çıktıya yazar;
+    bellekte yalnızca nesnelerin dosyadaki konumları ve sayfa numaraları
+    kalır. Referans içermeyen aynı akışlar (ör. her sertifikadaki arka plan
+    resmi) bir kez yazılıp tekrar kullanılır.
+    
+    Kullanım:
+        with PdfPageStreamWriter(output) as writer:
+            for pdf_bytes in belgeler:
+                writer.append(pdf_bytes)
+    """
+    
+    # Sayfa ağacı nesnesi her zaman 1 numaralıdır; sayfalar /Parent ile buna bağlanır
+    PAGES_OBJECT_NUMBER = 1
+    
+    def __init__(self, output):
+        """
+        Args:
+            output: Çıktı dosyası yolu veya yazılabilir dosya nesnesi
+        """
+        if isinstance(output, (str, os.PathLike)):
+            self._stream = open(output, "wb")
+            self._owns_stream = True
+        else:
+            self._stream = output
+            self._owns_stream = False
+        
+        self._position = 0
+        # Nesne numarası -> dosyadaki konum (0 numaralı nesne boş girdi)
+        self._offsets = [None, None]
+        self._page_numbers = []
+        self._shared_streams = {}
+        self._closed = False
+        self._write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._owns_stream:
+            self._stream.close()
+        return False
+    
+    @property
+    def page_count(self):
+        """Şimdiye kadar yazılan sayfa sayısı"""
+        return len(self._page_numbers)
+    
+    def _write(self, data):
+        self._stream.write(data)
+        self._position += len(data)
+    
+    def _reserve(self):
+        """Yeni bir nesne numarası ayırır"""
+        self._offsets.append(None)
+        return len(self._offsets) - 1
+    
+    def _write_object(self, number, obj):
+        """Nesneyi 'n 0 obj ... endobj' olarak yazar ve konumunu kaydeder"""
+        buffer = io.BytesIO()
+        buffer.write(f"{number} 0 obj\n".encode())
+        obj.write_to_stream(buffer)
+        buffer.write(b"\nendobj\n")
+        self._offsets[number] = self._position
+        self._write(buffer.getvalue())
+    
+    @staticmethod
+    def _has_references(obj):
+        """Nesnenin içinde dolaylı referans olup olmadığını döndürür"""
+        from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
+        
+        if isinstance(obj, IndirectObject):
+            return True
+        if isinstance(obj, DictionaryObject):
+            return any(
+                PdfPageStreamWriter._has_references(value)
+                for key, value in obj.items() if key != "/Length"
+            )
+        if isinstance(obj, ArrayObject):
+            return any(PdfPageStreamWriter._has_references(value) for value in obj)
+        return False
+    
+    @staticmethod
+    def _copy_stream(stream_object, entries):
+        """Akışı yeniden kodlamadan, verilen sözlük girdileriyle kopyalar"""
+        from pypdf.generic import DecodedStreamObject
+        
+        copy = DecodedStreamObject()
+        copy.update(entries)
+        # Kodlanmış ham veri olduğu gibi yazılır; /Filter girdisi korunduğu
+        # için okuyucular veriyi yine çözebilir
+        copy.set_data(stream_object._data)
+        return copy
+    
+    def append(self, pdf_bytes):
+        """
+        Bir PDF belgesinin tüm sayfalarını çıktıya ekler
+        
+        Args:
+            pdf_bytes: Eklenecek PDF içeriği
+        
+        Returns:
+            Eklenen sayfa sayısı
+        """
+        from pypdf import PdfReader
+        from pypdf.generic import (
+            ArrayObject, DictionaryObject, IndirectObject, NameObject, NullObject, StreamObject
+        )
+        
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        numbers = {}
+        pending = []
+        
+        def reference(indirect):
+            key = (indirect.idnum, indirect.generation)
+            if key not in numbers:
+                target = indirect.get_object()
+                digest = None
+                if isinstance(target, StreamObject) and not self._has_references(target):
+                    # Referanssız akışlar içerikleriyle tanınır ve paylaşılır
+                    buffer = io.BytesIO()
+                    self._copy_stream(target, {k: v for k, v in target.items() if k != "/Length"}).write_to_stream(buffer)
+                    digest = hashlib.sha256(buffer.getvalue()).hexdigest()
+                
+                if digest is not None and digest in self._shared_streams:
+                    numbers[key] = self._shared_streams[digest]
+                else:
+                    numbers[key] = self._reserve()
+                    pending.append((numbers[key], target))
+                    if digest is not None:
+                        self._shared_streams[digest] = numbers[key]
+            return IndirectObject(numbers[key], 0, None)
+        
+        def remap(obj):
+            if isinstance(obj, IndirectObject):
+                return reference(obj)
+            if isinstance(obj, StreamObject):
+                return self._copy_stream(
+                    obj, {key: remap(value) for key, value in obj.items() if key != "/Length"}
+                )
+            if isinstance(obj, DictionaryObject):
+                return DictionaryObject({key: remap(value) for key, value in obj.items()})
+            if isinstance(obj, ArrayObject):
+                return ArrayObject(remap(value) for value in obj)
+            return obj
+        
+        page_count = 0
+        for page in reader.pages:
+            number = self._reserve()
+            if page.indirect_reference is not None:
+                numbers[(page.indirect_reference.idnum, page.indirect_reference.generation)] = number
+            
+            # Devralınan özellikler (/Resources, /MediaBox) pypdf tarafından
+            # sayfaya kopyalanır; sayfa yalnızca yeni sayfa ağacına bağlanır
+            page_object = DictionaryObject({
+                key: remap(value) for key, value in page.items() if key != "/Parent"
+            })
+            page_object[NameObject("/Parent")] = IndirectObject(self.PAGES_OBJECT_NUMBER, 0, None)
+            self._write_object(number, page_object)
+            self._page_numbers.append(number)
+            page_count += 1
+            
+            # Sayfanın bağlı olduğu nesneleri yaz
+            while pending:
+                object_number, target = pending.pop()
+                self._write_object(object_number, NullObject() if target is None else remap(target))
+        
+        return page_count
+    
+    def close(self):
+        """Sayfa ağacını, kataloğu ve xref tablosunu yazıp belgeyi tamamlar"""
+        from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject
+        
+        if self._closed:
+            return
+        self._closed = True
+        
+        try:
+            pages = DictionaryObject({
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Kids"): ArrayObject(IndirectObject(n, 0, None) for n in self._page_numbers),
+                NameObject("/Count"): NumberObject(len(self._page_numbers))
+            })
+            self._write_object(self.PAGES_OBJECT_NUMBER, pages)
+            
+            catalog_number = self._reserve()
+            self._write_object(catalog_number, DictionaryObject({
+                NameObject("/Type"): NameObject("/Catalog"),
+                NameObject("/Pages"): IndirectObject(self.PAGES_OBJECT_NUMBER, 0, None)
+            }))
+            
+            xref_position = self._position
+            self._write(f"xref\n0 {len(self._offsets)}\n".encode())
+            self._write(b"0000000000 65535 f \n")
+            for offset in self._offsets[1:]:
+                self._write(f"{offset:010d} 00000 n \n".encode())
+            self._write(
+                f"trailer\n<< /Size {len(self._offsets)} /Root {catalog_number} 0 R >>\n"
+                f"startxref\n{xref_position}\n%%EOF\n".encode()
+            )
+        finally:
+            if self._owns_stream:
+                self._stream.close()
@@ -0,0 +1,84 @@
+import io
+import hashlib
+import config
+from utils.cache import BytesLRUCache
+
+class QRCodeGenerator:
+    """Sertifika doğrulama QR kodları için yardımcı sınıf"""
+    
+    # Aynı içerik için QR kodu bir kez kodlanır
+    _cache = BytesLRUCache(config.QR_CACHE_MAX_BYTES, name="qr")
+    
+    @staticmethod
+    def verification_url(token):
+        """
+        Sertifika doğrulama linkini oluşturur
+        
+        Args:
+            token: Sertifika erişim tokeni
+        
+        Returns:
+            Doğrulama linki
+        """
+        return f"{config.BASE_URL}/?token={token}"
+    
+    @staticmethod
+    def _build(data):
+        """QR kod matrisini oluşturur"""
+        import qrcode
+        
+        qr = qrcode.QRCode(
+            version=None,
+            error_correction=qrcode.constants.ERROR_CORRECT_M,
+            box_size=10,
+            border=4
+        )
+        qr.add_data(data)
+        qr.make(fit=True)
+        return qr
+    
+    @staticmethod
+    def generate_png(data):
+        """
+        QR kodunu PNG olarak üretir
+        
+        Görüntü 1 bit renk derinliğiyle kaydedilir (genellikle 1 KB altı) ve
+        içeriğe göre bellekte önbelleklenir.
+        
+        Args:
+            data: QR koda yazılacak metin
+        
+        Returns:
+            PNG dosyasının bytes'ı
+        """
+        def render():
+            img = QRCodeGenerator._build(data).make_image(fill_color="black", back_color="white")
+            buffer = io.BytesIO()
+            img.get_image().convert("1").save(buffer, format="PNG", optimize=True)
+            return buffer.getvalue()
+        
+        return QRCodeGenerator._cache.get_or_compute(QRCodeGenerator._cache_key("png", data), render)
+    
+    @staticmethod
+    def generate_svg(data):
+        """
+        QR kodunu SVG olarak üretir
+        
+        Args:
+            data: QR koda yazılacak metin
+        
+        Returns:
+            SVG dosyasının bytes'ı
+        """
+        def render():
+            from qrcode.image.svg import SvgPathImage
+            
+            img = QRCodeGenerator._build(data).make_image(image_factory=SvgPathImage)
+            return img.to_string()
+        
+        return QRCodeGenerator._cache.get_or_compute(QRCodeGenerator._cache_key("svg", data), render)
+    
+    @staticmethod
+    def _cache_key(kind, data):
+        """Önbellek anahtarı"""
+        return f"{kind}:{hashlib.sha256(data.encode('utf-8')).hexdigest()}"
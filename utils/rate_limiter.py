@@ -0,0 +1,93 @@
+import time
+import asyncio
+import threading
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+class TokenBucket:
+    """
+    Thread-safe token bucket hız sınırlayıcı
+    
+    Kova `burst` jetonla dolu başlar ve dakikada `rate_per_minute` jeton
+    dolar. Her gönderim bir jeton ayırır; jeton yoksa ayırma yine yapılır ve
+    sıradaki boş zamana kadar beklenir. Böylece eşzamanlı göndericiler
+    sırayla ve eşit aralıklarla çalışır, ortalama hız sınırı aşmaz.
+    """
+    
+    def __init__(self, rate_per_minute, burst=1):
+        """
+        Args:
+            rate_per_minute: Dakikada izin verilen gönderim sayısı
+            burst: Art arda beklemeden yapılabilecek gönderim sayısı
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Geçen süre kadar jeton ekler (kilit altında çağrılır)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self):
+        """
+        Bir gönderim hakkı ayırır
+        
+        Returns:
+            Gönderimden önce beklenmesi gereken süre (saniye)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    def acquire(self):
+        """Gönderim hakkı alınana kadar bekler"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Gönderim hakkı alınana kadar olay döngüsünü bloklamadan bekler"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def pause(self, seconds):
+        """
+        Sunucu yavaşlama isteği gönderdiğinde tüm göndericileri bekletir
+        
+        Args:
+            seconds: Bekleme süresi
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+def get_token_bucket(key, rate_per_minute, burst=1):
+    """
+    Anahtar başına işlem içinde paylaşılan kovayı döndürür
+    
+    Aynı SMTP hesabını kullanan tüm thread'ler ve işler aynı sınırı paylaşır.
+    
+    Args:
+        key: Kova anahtarı (örn. SMTP hesabı)
+        rate_per_minute: Dakikada izin verilen gönderim sayısı; 0 ise sınır yok
+        burst: Art arda beklemeden yapılabilecek gönderim sayısı
+    
+    Returns:
+        TokenBucket, sınır yoksa None
+    """
+    if rate_per_minute <= 0:
+        return None
+    
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None or bucket.rate != rate_per_minute / 60.0 or bucket.capacity != max(burst, 1):
+            bucket = TokenBucket(rate_per_minute, burst)
+            _buckets[key] = bucket
+        return bucket
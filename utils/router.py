@@ -0,0 +1,158 @@
+import time
+import logging
+import importlib
+from functools import lru_cache
+import streamlit as st
+from utils.auth_helpers import check_jwt, logout
+from utils.log_helper import get_logger, log_event
+from utils.metrics import record, get_metric
+from db.profiler import profile_request
+
+logger = get_logger("router")
+
+# Sayfa anahtarı -> rota tanımı
+#   module: Sayfa modülü; ilk gösterildiğinde yüklenir
+#   auth: None (herkese açık), 'user' (giriş gerekli) veya 'admin'
+#   label: Menüde görünen ad (None ise menüde gösterilmez)
+#   layout: True ise ortak kenar çubuğu çizilir
+ROUTES = {
+    "login": {"module": "login", "auth": None, "label": None, "layout": False},
+    "certificate_viewer": {"module": "certificate_viewer", "auth": None, "label": None, "layout": False},
+    "dashboard": {"module": "dashboard", "auth": "user", "label": "Ana Sayfa", "layout": True},
+    "courses": {"module": "courses", "auth": "user", "label": "Eğitimler", "layout": True},
+    "students": {"module": "students", "auth": "user", "label": "Öğrenciler", "layout": True},
+    "certificates": {"module": "certificates", "auth": "user", "label": "Sertifikalar", "layout": True},
+    "users": {"module": "users", "auth": "admin", "label": "👥 Kullanıcı Yönetimi", "layout": True},
+    "performance": {"module": "performance", "auth": "admin", "label": "📈 Performans", "layout": True},
+    "profile": {"module": "profile", "auth": "user", "label": "👤 Profil", "layout": True}
+}
+
+DEFAULT_PAGE = "login"
+HOME_PAGE = "dashboard"
+
+# Menünün bölümleri; her bölüm rota anahtarlarından oluşur
+NAVIGATION = [
+    (None, ["dashboard", "courses", "students", "certificates"]),
+    ("**👑 Admin Paneli**", ["users", "performance"]),
+    (None, ["profile"])
+]
+
+def load_page(page):
+    """
+    Sayfa modülünü döndürür, gerekirse ilk kez yükler
+    
+    Sayfa modülleri ve kullandıkları ağır kütüphaneler (pandas, altair vb.)
+    uygulama açılışında değil, sayfa ilk gösterildiğinde yüklenir. Böylece
+    yalnızca giriş sayfasını veya herkese açık sertifika linkini açan
+    kullanıcılar diğer sayfaların bağımlılıklarını beklemez.
+    
+    Args:
+        page: Sayfa anahtarı (örn. 'dashboard')
+    
+    Returns:
+        Sayfa modülü (show() fonksiyonu olan)
+    
+    Raises:
+        KeyError: Sayfa kayıtlı değilse
+    """
+    return importlib.import_module(ROUTES[page]["module"])
+
+def navigate(page):
+    """Başka bir sayfaya geçer"""
+    st.session_state["current_page"] = page
+    st.rerun()
+
+def dispatch(page):
+    """
+    Sayfayı yetki kontrolü, ortak düzen ve süre ölçümüyle gösterir
+    
+    Giriş gerektiren sayfalarda oturum yoksa giriş sayfası, yönetici
+    sayfalarında yetki yoksa ana sayfa gösterilir. Bilinmeyen sayfa
+    anahtarları giriş sayfasına yönlendirilir.
+    
+    Args:
+        page: Sayfa anahtarı
+    """
+    if page not in ROUTES:
+        page = DEFAULT_PAGE
+    
+    route = ROUTES[page]
+    
+    if route["auth"] and not check_jwt():
+        st.warning("Bu sayfayı görüntülemek için giriş yapmalısınız!")
+        page = DEFAULT_PAGE
+        route = ROUTES[page]
+    elif route["auth"] == "admin" and st.session_state.get("role") != "admin":
+        st.error("Bu sayfayı görüntülemek için yönetici yetkisine sahip olmalısınız!")
+        page = HOME_PAGE
+        route = ROUTES[page]
+    
+    st.session_state["current_page"] = page
+    
+    if route["layout"]:
+        render_sidebar(page, st.session_state.get("role"))
+    
+    # İlk gösterimdeki modül yükleme süresi çizim süresine katılmaz
+    module = load_page(page)
+    
+    start = time.perf_counter()
+    with profile_request(f"page.{page}"):
+        module.show()
+    
+    # Sayfadan st.rerun() ile çıkılırsa süre kaydedilmez; yarım çizimdir
+    duration_ms = (time.perf_counter() - start) * 1000
+    _record_timing(page, duration_ms)
+    
+    if route["layout"] and st.session_state.get("role") == "admin":
+        stats = get_metric(f"page.{page}")
+        if stats:
+            st.sidebar.caption(
+                f"⏱️ Sayfa süresi: {duration_ms:.0f} ms "
+                f"(p50 {stats['p50_ms']:.0f} ms, p95 {stats['p95_ms']:.0f} ms, {stats['count']} çizim)"
+            )
+
+@lru_cache(maxsize=None)
+def _navigation_for(role):
+    """Role göre menü bölümlerini hazırlar (rol başına bir kez hesaplanır)"""
+    sections = []
+    for title, pages in NAVIGATION:
+        items = [
+            (page, ROUTES[page]["label"])
+            for page in pages
+            if ROUTES[page]["auth"] != "admin" or role == "admin"
+        ]
+        if items:
+            sections.append((title, tuple(items)))
+    return tuple(sections)
+
+def render_sidebar(current_page, role):
+    """
+    Giriş yapılmış sayfaların ortak kenar çubuğunu çizer
+    
+    Args:
+        current_page: Gösterilen sayfa (menüde vurgulanır)
+        role: Kullanıcı rolü
+    """
+    with st.sidebar:
+        st.success(f"Hoş geldiniz, {st.session_state.get('username')}!")
+        st.title("Menü")
+        
+        for index, (title, items) in enumerate(_navigation_for(role)):
+            if index:
+                st.divider()
+            if title:
+                st.write(title)
+            
+            for page, label in items:
+                button_type = "primary" if page == current_page else "secondary"
+                if st.button(label, key=f"nav_{page}", use_container_width=True, type=button_type):
+                    navigate(page)
+        
+        if st.button("Çıkış Yap", key="nav_logout", use_container_width=True):
+            logout()
+            st.rerun()
+
+def _record_timing(page, duration_ms):
+    """Rotanın çizim süresini ölçüm kaydına ('page.<sayfa>') ekler"""
+    record(f"page.{page}", duration_ms)
+    log_event(logger, logging.DEBUG, "Sayfa çizildi", sample=True, page=page, duration_ms=round(duration_ms, 1))